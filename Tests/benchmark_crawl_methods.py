@@ -0,0 +1,479 @@
+"""
+Offline benchmark of the crawl methods on recorded fixtures.
+
+Every crawl method is run against recorded responses of its site instead of the live
+site, so parser and filter changes can be measured reproducibly. For each site the
+parse and filter time (median over the iterations), jobs/sec and the peak memory
+allocated during one crawl are reported.
+
+Fixtures live in Tests/fixtures/crawl_methods/<module>/: index.json maps each
+'METHOD URL' to its status, headers and body file. The committed fixtures are synthetic
+pages in the markup of each site (25-60 postings, a mix of matching and non-matching
+titles and locations); --record replaces them with the live responses. Browser crawls
+are replayed with a stand-in driver that answers the browser_pool scripts and element
+lookups from the recorded page source, so their recordings hold the rendered page of
+every visited URL and of every state reached by clicking (stored as '<url>#click-<n>').
+A site whose replay finds no jobs fails the run.
+
+    python Tests/benchmark_crawl_methods.py --record            # record all fixtures
+    python Tests/benchmark_crawl_methods.py --only dualoo egeli # benchmark some sites
+    python Tests/benchmark_crawl_methods.py --save baseline.json
+    python Tests/benchmark_crawl_methods.py --baseline baseline.json
+"""
+
+import sys
+import os
+import argparse
+import contextlib
+import io
+import json
+import sqlite3
+import statistics
+import tempfile
+import time
+import tracemalloc
+from urllib.parse import urljoin
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import requests
+from bs4 import BeautifulSoup
+
+from crawler import Crawler
+from crawler.base_crawler import get_shared_session, HTML_PARSER
+from crawler.browser_pool import _READY_SCRIPT, _TEXT_SCRIPT, _EXTRACT_SCRIPT
+from crawler.cassette import RecordingAdapter, ReplayAdapter, build_response
+from crawler.url_mapping import URL_MAPPINGS, resolve_crawler_module
+from crawls_data import CRAWLS_DATA
+from localities_data import LOCALITIES_DATA
+from storage import close_pool
+
+FIXTURE_DIR = os.path.join(current_dir, 'fixtures', 'crawl_methods')
+DEFAULT_KEYWORDS = ["praktikum", "praktika", "praktikant", "werkstudent", "student", "studium"]
+BODY_EXTENSIONS = {'json': '.json', 'html': '.html', 'xml': '.xml', 'javascript': '.js'}
+
+
+def benchmark_sites():
+    """(module name, start URL, keywords) of every crawl method, scheduled crawls first"""
+    sites = {}
+    for _, url, _, _, keywords in CRAWLS_DATA:
+        name = resolve_crawler_module(url)
+        if name and name not in sites:
+            sites[name] = (url, keywords)
+    ### Modules without a scheduled crawl are started on their mapping pattern
+    for pattern, name in URL_MAPPINGS.items():
+        if name not in sites:
+            sites[name] = ('https://' + pattern, DEFAULT_KEYWORDS)
+    return [(name, url, keywords) for name, (url, keywords) in sites.items()]
+
+
+def _request_key(method, url):
+    return f'{method} {url}'
+
+
+class Fixture:
+    """Recorded responses of one site, served like a cassette (crawler/cassette.py)"""
+
+    def __init__(self, name):
+        self.directory = os.path.join(FIXTURE_DIR, name)
+        self.index_path = os.path.join(self.directory, 'index.json')
+        self.entries = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def exists(self):
+        return bool(self.entries)
+
+    def store(self, request, response):
+        """Store a live response (body read in full)"""
+        content_type = response.headers.get('Content-Type', '')
+        headers = {name: response.headers[name] for name in ('Content-Type', 'Location') if name in response.headers}
+        extension = next((ext for kind, ext in BODY_EXTENSIONS.items() if kind in content_type), '.txt')
+        body_file = f'{len(self.entries):03d}{extension}'
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, body_file), 'wb') as f:
+            f.write(response.content)
+        self.entries[_request_key(request.method, request.url)] = {
+            'status': response.status_code,
+            'headers': headers,
+            'url': response.url,
+            'body': body_file,
+        }
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, ensure_ascii=False)
+
+    def load(self, request):
+        """Build the recorded response for a request (404 if it wasn't recorded)"""
+        entry = self.entries.get(_request_key(request.method, request.url))
+        if entry is None:
+            return build_response(request, 404, {}, request.url, b'')
+        with open(os.path.join(self.directory, entry['body']), 'rb') as f:
+            body = f.read()
+        return build_response(request, entry['status'], entry['headers'], entry['url'], body)
+
+
+def _inner_text(element):
+    """Approximation of innerText: the trimmed text nodes, one per line"""
+    return element.get_text('\n', strip=True)
+
+
+def _click_url(url, clicks):
+    """Fixture URL of the page state after the given number of clicks on url"""
+    return f"{url.split('#')[0]}#click-{clicks}"
+
+
+def _is_click(script, args):
+    return bool(args) and '.click()' in script
+
+
+class FixtureElement:
+    """Element of a replayed page, the WebElement methods the crawl methods use"""
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    @property
+    def text(self):
+        return _inner_text(self._tag)
+
+    def get_attribute(self, name):
+        value = self._tag.get(name)
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def is_enabled(self):
+        return not self._tag.has_attr('disabled')
+
+
+class FixtureDriver:
+    """
+    Stand-in for a pooled Chrome driver that serves the recorded page sources.
+    It answers the browser_pool scripts (wait_for, element_text, extract_records) and
+    find_element on the parsed page. A click loads the page state recorded after it.
+    """
+
+    def __init__(self, fixture):
+        self.fixture = fixture
+        self.current_url = None
+        self.page_source = ''
+        self._soup = BeautifulSoup('', HTML_PARSER)
+        self._url = None
+        self._clicks = 0
+
+    @property
+    def title(self):
+        return self._soup.title.text if self._soup.title else ''
+
+    def get(self, url):
+        self._url, self._clicks = url, 0
+        self._load(url)
+
+    def _load(self, url):
+        response = self.fixture.load(requests.Request('GET', url).prepare())
+        if response.status_code == 404:
+            raise RuntimeError(f"Page state not recorded: {url}")
+        self.current_url = response.url
+        self.page_source = response.text
+        self._soup = BeautifulSoup(response.content, HTML_PARSER)
+
+    def find_element(self, by, value):
+        from selenium.common.exceptions import NoSuchElementException
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"{by}={value} (replayed page)")
+        return elements[0]
+
+    def find_elements(self, by, value):
+        if by == 'id':
+            tags = self._soup.find_all(id=value)
+        elif by == 'css selector':
+            tags = self._soup.select(value)
+        elif by == 'class name':
+            tags = self._soup.find_all(class_=value)
+        elif by == 'tag name':
+            tags = self._soup.find_all(value)
+        else:
+            raise NotImplementedError(f"Elements can't be looked up by {by} on a replayed page")
+        return [FixtureElement(tag) for tag in tags]
+
+    def execute_script(self, script, *args):
+        if script == _READY_SCRIPT:
+            ### The replayed page never changes, a missing selector is reported like a timeout
+            return {'selector': next((selector for selector in args[0] if self._soup.select_one(selector)), None)}
+        if script == _TEXT_SCRIPT:
+            element = self._soup.select_one(args[0])
+            return _inner_text(element) if element else None
+        if script == _EXTRACT_SCRIPT:
+            return self._extract(*args)
+        if _is_click(script, args) and isinstance(args[0], FixtureElement):
+            self._clicks += 1
+            self._load(_click_url(self._url, self._clicks))
+            return None
+        raise NotImplementedError("Only the browser_pool scripts and clicks can be replayed")
+
+    def _read(self, element, field):
+        if element is None:
+            return None
+        if field['prop']:
+            value = element.get(field['prop'])
+            if value is not None and field['prop'] in ('href', 'src'):
+                value = urljoin(self.current_url, value)
+        elif field['attr']:
+            value = element.get(field['attr'])
+        else:
+            return _inner_text(element)
+        if isinstance(value, list):
+            value = ' '.join(value)
+        return value
+
+    def _extract(self, item_selectors, fields):
+        """Same records as _EXTRACT_SCRIPT, with soupsieve instead of the DOM"""
+        items = []
+        for selector in item_selectors:
+            items = self._soup.select(selector)
+            if items:
+                break
+        records = []
+        for item in items:
+            record = {}
+            for name, field in fields.items():
+                if field['all']:
+                    record[name] = [self._read(element, field)
+                                    for selector in field['selectors'] for element in item.select(selector)]
+                    continue
+                record[name] = None
+                for selector in field['selectors']:
+                    value = self._read(item.select_one(selector) if selector else item, field)
+                    if value:
+                        record[name] = value
+                        break
+            records.append(record)
+        return records
+
+
+class RecordingDriver:
+    """Pooled Chrome driver that stores the rendered page of every visited URL and click"""
+
+    def __init__(self, driver, fixture):
+        self._driver = driver
+        self._fixture = fixture
+        self._url = None
+        self._clicks = 0
+        self._stored = False
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        self._driver.get(url)
+        self._url, self._clicks, self._stored = url, 0, False
+
+    def execute_script(self, script, *args):
+        result = self._driver.execute_script(script, *args)
+        if _is_click(script, args):
+            self._clicks += 1
+            self._stored = False
+        ### The page is rendered once the crawl method extracts it
+        elif script == _EXTRACT_SCRIPT and self._url and not self._stored:
+            url = _click_url(self._url, self._clicks) if self._clicks else self._url
+            request = requests.Request('GET', url).prepare()
+            body = self._driver.page_source.encode('utf-8')
+            headers = {'Content-Type': 'text/html; charset=utf-8'}
+            self._fixture.store(request, build_response(request, 200, headers, self._driver.current_url, body))
+            self._stored = True
+        return result
+
+
+class FixtureCrawler(Crawler):
+    """Crawler whose requests go through the given transport and whose browser replays the fixture"""
+
+    def __init__(self, db_path, adapter, fixture, record=False):
+        super().__init__(db_path)
+        self._session = requests.Session()
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self.fixture = fixture
+        self.record = record
+
+    @property
+    def session(self):
+        return self._session
+
+    @contextlib.contextmanager
+    def browser(self, url=None, block_resources=True):
+        if not self.record:
+            yield FixtureDriver(self.fixture)
+            return
+        with super().browser(url, block_resources) as driver:
+            yield RecordingDriver(driver, self.fixture)
+
+    async def fetch_async(self, url, method='GET', headers=None, **kwargs):
+        return self.fetch(url, method=method, headers=headers, **kwargs)
+
+
+@contextlib.contextmanager
+def _without_delays():
+    """Skip the politeness sleeps of the crawl methods, a replay doesn't touch the sites"""
+    sleep = time.sleep
+    time.sleep = lambda seconds: None
+    try:
+        yield
+    finally:
+        time.sleep = sleep
+
+
+def _localities_db(directory):
+    """Temporary database holding only the localities used by the filters"""
+    db_path = os.path.join(directory, 'benchmark.db')
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE localities (id INTEGER PRIMARY KEY, ortschaftsname TEXT, kanton TEXT)")
+        conn.executemany("INSERT INTO localities (ortschaftsname, kanton) VALUES (?, ?)", LOCALITIES_DATA)
+        conn.commit()
+    finally:
+        conn.close()
+    return db_path
+
+
+def _crawl_quietly(crawler, url, keywords):
+    """Run a crawl with the crawl methods' output suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return crawler.crawl(url, keywords)
+
+
+def record_site(db_path, name, url, keywords):
+    """Crawl a site live and store every response as its fixture"""
+    fixture = Fixture(name)
+    fixture.entries = {}
+    live_adapter = get_shared_session().get_adapter(url)
+    crawler = FixtureCrawler(db_path, RecordingAdapter(fixture, live_adapter), fixture, record=True)
+    results = _crawl_quietly(crawler, url, keywords)
+    fixture.save()
+    print(f"{name:32} recorded {len(fixture.entries)} responses, {len(results or [])} matching jobs")
+
+
+def benchmark_site(db_path, name, url, keywords, iterations):
+    """Replay a site's fixture and measure parse/filter time and allocations"""
+    fixture = Fixture(name)
+    if not fixture.exists():
+        return None
+    crawler = FixtureCrawler(db_path, ReplayAdapter(fixture), fixture)
+
+    parse_ms, filter_ms = [], []
+    with _without_delays():
+        for _ in range(iterations):
+            _crawl_quietly(crawler, url, keywords)
+            parse_ms.append(crawler.metrics.phase_ms['parse'])
+            filter_ms.append(crawler.metrics.phase_ms['filter'])
+        metrics = crawler.metrics
+
+        ### Allocations are measured in a separate run, tracemalloc slows parsing down
+        tracemalloc.start()
+        try:
+            _crawl_quietly(crawler, url, keywords)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    if not metrics.pages or not metrics.jobs_found:
+        raise RuntimeError(f"replay found {metrics.jobs_found} jobs on {metrics.pages} pages (status {metrics.status})")
+
+    seconds = (statistics.median(parse_ms) + statistics.median(filter_ms)) / 1000
+    return {
+        'pages': metrics.pages,
+        'bytes': metrics.bytes,
+        'jobs_found': metrics.jobs_found,
+        'jobs_matched': metrics.jobs_matched,
+        'parse_ms': round(statistics.median(parse_ms), 2),
+        'filter_ms': round(statistics.median(filter_ms), 2),
+        'jobs_per_sec': round(metrics.jobs_found / seconds) if seconds else None,
+        'peak_kib': round(peak / 1024),
+    }
+
+
+def _delta(current, previous):
+    if not previous:
+        return ''
+    return f" ({(current - previous) / previous * 100:+.0f}%)"
+
+
+def print_report(results, baseline):
+    print(f"\n{'Site':32} {'Pages':>5} {'Jobs':>6} {'Match':>5} {'Parse ms':>16} {'Filter ms':>14} {'Jobs/s':>9} {'Peak KiB':>9}")
+    print("-" * 104)
+    for name, result in results.items():
+        previous = baseline.get(name, {})
+        print(f"{name:32} {result['pages']:>5} {result['jobs_found']:>6} {result['jobs_matched']:>5} "
+              f"{result['parse_ms']:>8}{_delta(result['parse_ms'], previous.get('parse_ms')):>8} "
+              f"{result['filter_ms']:>7}{_delta(result['filter_ms'], previous.get('filter_ms')):>7} "
+              f"{result['jobs_per_sec'] or '-':>9} {result['peak_kib']:>9}")
+    total_parse = sum(result['parse_ms'] for result in results.values())
+    total_filter = sum(result['filter_ms'] for result in results.values())
+    print("-" * 104)
+    print(f"{len(results)} sites - parse {total_parse:.1f} ms, filter {total_filter:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded fixtures through the crawl methods")
+    parser.add_argument('--record', action='store_true', help="record the fixtures from the live sites")
+    parser.add_argument('--only', nargs='+', metavar='MODULE', help="only these crawl method modules")
+    parser.add_argument('--iterations', type=int, default=5, help="timed runs per site (default 5)")
+    parser.add_argument('--save', metavar='FILE', help="write the results as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="show changes against saved results")
+    args = parser.parse_args()
+
+    sites = [site for site in benchmark_sites() if not args.only or site[0] in args.only]
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = _localities_db(directory)
+
+        if args.record:
+            for name, url, keywords in sites:
+                try:
+                    record_site(db_path, name, url, keywords)
+                except Exception as e:
+                    print(f"{name:32} failed: {e}")
+            close_pool(db_path)
+            return
+
+        results = {}
+        missing = []
+        failed = []
+        for name, url, keywords in sites:
+            start = time.perf_counter()
+            try:
+                result = benchmark_site(db_path, name, url, keywords, args.iterations)
+            except Exception as e:
+                print(f"{name:32} failed: {e}", file=sys.stderr)
+                failed.append(name)
+                continue
+            if result is None:
+                missing.append(name)
+                continue
+            results[name] = result
+            print(f"{name:32} done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        ### Pooled connections keep the file open, which blocks removing it on Windows
+        close_pool(db_path)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    if missing:
+        print(f"No fixtures for {len(missing)} sites (record them with --record): {', '.join(missing)}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        sys.exit(f"Replay failed for {len(failed)} sites: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
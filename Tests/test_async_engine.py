@@ -0,0 +1,115 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import crawler.async_engine as async_engine
+import crawler.base_crawler as base_crawler
+import crawler.concurrency as concurrency
+from crawler import Crawler, UNCHANGED
+from storage import close_pool
+
+
+class SlowJobsHandler(BaseHTTPRequestHandler):
+    """Serves the job list slowly with an ETag and counts the requests in flight"""
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_GET(self):
+        with self.lock:
+            SlowJobsHandler.in_flight += 1
+            SlowJobsHandler.max_in_flight = max(SlowJobsHandler.max_in_flight, SlowJobsHandler.in_flight)
+        try:
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            time.sleep(0.1)
+            body = json.dumps({'jobs': [{'title': 'Praktikum Informatik', 'link': 'https://example.ch/1'}]}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with self.lock:
+                SlowJobsHandler.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def crawl_test_jobs_async(crawler_instance, url, keywords):
+    responses = await asyncio.gather(*(crawler_instance.fetch_async(url) for _ in range(crawl_test_jobs_async.requests)))
+    return responses[0].json()['jobs'], None
+
+
+class AsyncSite:
+    """Local job site, the crawl method dispatch points at the coroutine crawl method"""
+
+    def __enter__(self):
+        SlowJobsHandler.in_flight = SlowJobsHandler.max_in_flight = 0
+        crawl_test_jobs_async.requests = 1
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowJobsHandler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/jobs'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'crawls.db')
+        self.original_dispatch = base_crawler.get_crawler_method
+        base_crawler.get_crawler_method = lambda url: crawl_test_jobs_async
+        self.original_limiter = concurrency.get_host_limiter()
+        return self
+
+    def __exit__(self, *exc_info):
+        concurrency._limiter = self.original_limiter
+        base_crawler.get_crawler_method = self.original_dispatch
+        self.server.shutdown()
+        self.server.server_close()
+        close_pool(self.db_path)
+        self.tmp.cleanup()
+
+
+def test_async_crawl_closes_its_session_and_keeps_the_host_limit():
+    with AsyncSite() as site:
+        concurrency.configure_host_limiter(max_per_host=1)
+        ### Three requests at once against the same host
+        crawl_test_jobs_async.requests = 3
+
+        async def crawl():
+            results = await Crawler(site.db_path).crawl_async(site.url, ['praktikum'])
+            return results, dict(async_engine._sessions)
+
+        results, sessions = asyncio.run(crawl())
+        assert [job['link'] for job in results] == ['https://example.ch/1']
+        assert sessions == {}
+        assert SlowJobsHandler.max_in_flight == 1
+
+
+def test_async_fetch_sends_the_stored_validators():
+    with AsyncSite() as site:
+        crawler = Crawler(site.db_path)
+        results = crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        assert [job['link'] for job in results] == ['https://example.ch/1']
+        crawler.commit_http_cache()
+
+        ### The coroutine crawl method sends the ETag of the last run and gets a 304
+        crawler = Crawler(site.db_path)
+        assert crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1) is UNCHANGED
+
+
+if __name__ == "__main__":
+    test_async_crawl_closes_its_session_and_keeps_the_host_limit()
+    test_async_fetch_sends_the_stored_validators()
+    print("All async engine tests passed")
@@ -0,0 +1,65 @@
+import sys
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawler.base_crawler import get_shared_session, use_cassette, RECORD, REPLAY
+
+
+class JobsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/old':
+            self.send_response(301)
+            self.send_header('Location', '/jobs')
+            self.end_headers()
+            return
+        body = '{"jobs": [{"title": "Praktikum Informatik"}]}'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_record_then_replay_without_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JobsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sweep.cassette')
+        try:
+            cassette = use_cassette(path, RECORD)
+            recorded = get_shared_session().get(base_url + '/old')
+            assert len(cassette) == 2
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        try:
+            use_cassette(path, REPLAY)
+            replayed = get_shared_session().get(base_url + '/old')
+            missing = get_shared_session().get(base_url + '/other')
+        finally:
+            use_cassette(None)
+
+    assert replayed.status_code == 200
+    assert replayed.url == base_url + '/jobs'
+    assert replayed.json() == recorded.json()
+    assert [r.status_code for r in replayed.history] == [301]
+    assert missing.status_code == 404
+
+
+if __name__ == "__main__":
+    test_record_then_replay_without_server()
+    print("All cassette tests passed")
@@ -0,0 +1,247 @@
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import crawler.base_crawler as base_crawler
+from crawler import Crawler, UNCHANGED
+from crawler.http_cache import body_digest
+from database import Database
+from storage import connect, close_pool
+
+
+class JobsHandler(BaseHTTPRequestHandler):
+    """Serves the job list with an ETag, answering 304 to a matching If-None-Match"""
+    jobs = []
+    etag = '"v1"'
+    send_etag = True
+
+    def do_GET(self):
+        if self.send_etag and self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({'jobs': self.jobs}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.send_etag:
+            self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def crawl_test_jobs(crawler_instance, url, keywords):
+    response = crawler_instance.fetch(url, headers=crawler_instance.api_headers)
+    return response.json()['jobs'], None
+
+
+def crawl_test_jobs_broken(crawler_instance, url, keywords):
+    ### Like the crawl methods: the parse error is swallowed and nothing is returned
+    crawler_instance.fetch(url, headers=crawler_instance.api_headers)
+    return [], None
+
+
+def crawl_test_jobs_streamed(crawler_instance, url, keywords):
+    jobs = []
+    for job in crawler_instance.fetch_json_items(url, 'jobs'):
+        ### The body must not have been read in full before the first item
+        job['consumed'] = crawl_test_jobs_streamed.response._content_consumed
+        jobs.append(job)
+    return jobs, None
+
+
+class ConditionalServer:
+    """Local job site plus a temporary database, the crawl method dispatch points at the site"""
+
+    def __init__(self, crawl_method=crawl_test_jobs):
+        JobsHandler.jobs = [{'title': 'Praktikum Informatik', 'link': 'https://example.ch/1'}]
+        JobsHandler.etag = '"v1"'
+        JobsHandler.send_etag = True
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), JobsHandler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/jobs'
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'crawls.db')
+        self.crawl_method = crawl_method
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.original_dispatch = base_crawler.get_crawler_method
+        base_crawler.get_crawler_method = lambda url: self.crawl_method
+        return self
+
+    def __exit__(self, *exc_info):
+        base_crawler.get_crawler_method = self.original_dispatch
+        self.server.shutdown()
+        self.server.server_close()
+        close_pool(self.db_path)
+        self.tmp.cleanup()
+
+    def cache_rows(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return (conn.execute("SELECT * FROM http_cache").fetchall(),
+                    conn.execute("SELECT * FROM content_digests").fetchall())
+        finally:
+            conn.close()
+
+
+def test_not_modified_start_page_is_unchanged():
+    with ConditionalServer() as site:
+        crawler = Crawler(site.db_path)
+        results = crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        assert [job['link'] for job in results] == ['https://example.ch/1']
+        crawler.commit_http_cache()
+        stored = site.cache_rows()
+
+        ### The site answers 304 to the stored ETag
+        crawler = Crawler(site.db_path)
+        assert crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1) is UNCHANGED
+        assert crawler.metrics.status == 'unchanged'
+        crawler.commit_http_cache()
+        assert site.cache_rows() == stored
+
+
+def test_same_digest_is_unchanged_and_changed_body_is_crawled():
+    with ConditionalServer() as site:
+        JobsHandler.send_etag = False
+        crawler = Crawler(site.db_path)
+        crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        crawler.commit_http_cache()
+        stored = site.cache_rows()
+        assert stored[0] == [] and len(stored[1]) == 1
+
+        crawler = Crawler(site.db_path)
+        assert crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1) is UNCHANGED
+        crawler.commit_http_cache()
+        assert site.cache_rows() == stored
+
+        ### A new posting changes the digest and goes through the normal path
+        JobsHandler.jobs = JobsHandler.jobs + [{'title': 'Werkstudent', 'link': 'https://example.ch/2'}]
+        crawler = Crawler(site.db_path)
+        results = crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        assert [job['link'] for job in results] == ['https://example.ch/1', 'https://example.ch/2']
+        assert crawler.metrics.status == 'ok'
+        crawler.commit_http_cache()
+        assert site.cache_rows()[1] != stored[1]
+
+
+def test_streamed_start_page_is_digested_while_parsing():
+    with ConditionalServer(crawl_test_jobs_streamed) as site:
+        JobsHandler.send_etag = False
+
+        def crawl():
+            crawler = Crawler(site.db_path)
+            original_fetch = crawler.fetch
+            def fetch(url, *args, **kwargs):
+                response = original_fetch(url, *args, **kwargs)
+                crawl_test_jobs_streamed.response = response
+                return response
+            crawler.fetch = fetch
+            results = crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+            crawler.commit_http_cache()
+            return results
+
+        results = crawl()
+        assert [job['consumed'] for job in results] == [False]
+        stored = site.cache_rows()
+        assert stored[0] == [] and len(stored[1]) == 1
+
+        ### The same body streamed again is unchanged
+        assert crawl() is UNCHANGED
+        assert site.cache_rows() == stored
+
+        JobsHandler.jobs = JobsHandler.jobs + [{'title': 'Werkstudent', 'link': 'https://example.ch/2'}]
+        assert [job['link'] for job in crawl()] == ['https://example.ch/1', 'https://example.ch/2']
+        assert site.cache_rows()[1] != stored[1]
+
+
+def test_digest_ignores_asset_cache_busters_only():
+    page = ('<link rel="stylesheet" href="/site.css?v={v}"><script src="/app.js?t={v}"></script>'
+            '<a href="/jobs/1?t={t}">Praktikum Informatik</a><span>{date}</span>')
+    digest = body_digest(page.format(v=1, t=1, date='2026-03-02T10:00:00Z').encode())
+    assert body_digest(page.format(v=2, t=1, date='2026-03-02T10:00:00Z').encode()) == digest
+    ### Job links and visible dates are part of the listing
+    assert body_digest(page.format(v=1, t=2, date='2026-03-02T10:00:00Z').encode()) != digest
+    assert body_digest(page.format(v=1, t=1, date='2026-03-09T10:00:00Z').encode()) != digest
+
+
+def test_validators_are_kept_per_crawl():
+    with ConditionalServer() as site:
+        crawler = Crawler(site.db_path)
+        crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        crawler.commit_http_cache()
+
+        ### Another crawl of the same URL doesn't send crawl 1's ETag and gets the page
+        crawler = Crawler(site.db_path)
+        results = crawler.crawl(site.url, ['werkstudent'], conditional=True, crawl_id=2)
+        assert results is not UNCHANGED and len(results) == 1
+
+
+def test_failed_or_empty_crawl_drops_the_cache():
+    with ConditionalServer() as site:
+        crawler = Crawler(site.db_path)
+        crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1)
+        crawler.commit_http_cache()
+        assert all(len(rows) == 1 for rows in site.cache_rows())
+
+        ### A new version whose parsing fails must not leave the next run skipped
+        JobsHandler.etag = '"v2"'
+        JobsHandler.jobs = JobsHandler.jobs + [{'title': 'Werkstudent', 'link': 'https://example.ch/2'}]
+        site.crawl_method = crawl_test_jobs_broken
+        crawler = Crawler(site.db_path)
+        assert crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=1) == []
+        crawler.commit_http_cache()
+        assert site.cache_rows() == ([], [])
+
+
+def test_crawl_changes_drop_the_cache():
+    with ConditionalServer() as site:
+        database = Database.__new__(Database)
+        database.db_file = site.db_path
+        conn = connect(site.db_path)
+        database.create_tables(conn.cursor())
+        database.apply_migrations(conn)
+        conn.close()
+
+        def cache_crawl_ids():
+            http_cache, content_digests = site.cache_rows()
+            return {row[0] for row in http_cache}, {row[0] for row in content_digests}
+
+        crawl_id = database.add_crawl('Test', site.url, '09:00', 'mon', ['praktikum'])['id']
+        crawler = Crawler(site.db_path)
+        crawler.crawl(site.url, ['praktikum'], conditional=True, crawl_id=crawl_id)
+        crawler.commit_http_cache()
+        assert cache_crawl_ids() == ({crawl_id}, {crawl_id})
+
+        database.update_crawl(crawl_id, 'Test', site.url, '09:00', 'mon', ['werkstudent'])
+        assert cache_crawl_ids() == (set(), set())
+
+        crawler = Crawler(site.db_path)
+        crawler.crawl(site.url, ['werkstudent'], conditional=True, crawl_id=crawl_id)
+        crawler.commit_http_cache()
+        database.delete_crawl(crawl_id)
+        assert cache_crawl_ids() == (set(), set())
+
+
+if __name__ == "__main__":
+    test_not_modified_start_page_is_unchanged()
+    test_same_digest_is_unchanged_and_changed_body_is_crawled()
+    test_streamed_start_page_is_digested_while_parsing()
+    test_digest_ignores_asset_cache_busters_only()
+    test_validators_are_kept_per_crawl()
+    test_failed_or_empty_crawl_drops_the_cache()
+    test_crawl_changes_drop_the_cache()
+    print("All conditional crawl tests passed")
@@ -0,0 +1,163 @@
+import sys
+import os
+import logging
+import sqlite3
+import tempfile
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import schedule
+from crawler.metrics import CrawlMetrics
+from database import Database
+from storage import connect, close_pool
+
+URL = 'https://example.ch/jobs'
+
+
+class ListedCrawler:
+    """Stands in for Crawler in execute_crawl, returns the postings set on the class"""
+    results = []
+    last = None
+
+    def __init__(self):
+        self.metrics = None
+        ListedCrawler.last = self
+
+    def crawl(self, url, keywords, conditional=False, crawl_id=None):
+        self.metrics = CrawlMetrics(crawl_id, url)
+        self.metrics.status = 'ok'
+        return [dict(result) for result in self.results]
+
+    def commit_http_cache(self):
+        pass
+
+
+def posting(number, title='Praktikum Informatik', location='St. Gallen'):
+    return {'title': title, 'company': 'Example AG', 'location': location, 'link': f'https://example.ch/{number}'}
+
+
+class DiffDatabase:
+    """Scheduler on a temporary database, every row written to the job tables is counted by triggers"""
+
+    def __enter__(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'crawls.db')
+        database = Database.__new__(Database)
+        database.db_file = self.db_path
+        conn = connect(self.db_path)
+        database.create_tables(conn.cursor())
+        database.apply_migrations(conn)
+        conn.execute("CREATE TABLE row_writes (tbl TEXT, op TEXT)")
+        for table in ('crawl_results', 'removed_jobs'):
+            for op in ('INSERT', 'UPDATE', 'DELETE'):
+                conn.execute(f'''
+                    CREATE TRIGGER count_{table}_{op.lower()} AFTER {op} ON {table}
+                    BEGIN INSERT INTO row_writes VALUES ('{table}', '{op}'); END
+                ''')
+        conn.commit()
+        conn.close()
+
+        self.original_crawler = schedule.Crawler
+        schedule.Crawler = ListedCrawler
+        self.scheduler = schedule.CrawlerScheduler()
+        self.scheduler.db_path = self.db_path
+        return self
+
+    def __exit__(self, *exc_info):
+        schedule.Crawler = self.original_crawler
+        close_pool(self.db_path)
+        self.tmp.cleanup()
+
+    def run(self, results):
+        """Run crawl 1 with the given postings, returns the metrics and the rows written"""
+        ListedCrawler.results = results
+        self.query("DELETE FROM row_writes")
+        self.scheduler.execute_crawl(1, URL, ['praktikum'])
+        return ListedCrawler.last.metrics, self.query("SELECT tbl, op FROM row_writes")
+
+    def query(self, sql, params=()):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+
+class LogLines(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+
+def test_new_still_listed_and_removed_jobs():
+    with DiffDatabase() as db:
+        metrics, writes = db.run([posting(1), posting(2), posting(3)])
+        assert (metrics.jobs_new, metrics.jobs_removed) == (3, 0)
+        assert writes.count(('crawl_results', 'INSERT')) == 3
+        ids = dict(db.query("SELECT link, id FROM crawl_results"))
+
+        ### 1 is listed unchanged, 2 got a new title, 3 is gone and 4 is new
+        log = LogLines()
+        level = schedule.logger.level
+        schedule.logger.addHandler(log)
+        schedule.logger.setLevel(logging.INFO)
+        try:
+            metrics, writes = db.run([posting(1), posting(2, title='Werkstudent Informatik'), posting(4)])
+        finally:
+            schedule.logger.removeHandler(log)
+            schedule.logger.setLevel(level)
+        assert (metrics.jobs_new, metrics.jobs_removed) == (1, 1)
+        assert sorted(writes) == sorted([
+            ('removed_jobs', 'INSERT'), ('crawl_results', 'DELETE'), ('crawl_results', 'INSERT'),
+        ])
+        assert 'Job removed: Praktikum Informatik at Example AG' in log.lines
+
+        ### Rows of jobs still listed keep the values they were first stored with
+        rows = {link: (row_id, title) for row_id, link, title in db.query("SELECT id, link, title FROM crawl_results")}
+        assert rows['https://example.ch/1'] == (ids['https://example.ch/1'], 'Praktikum Informatik')
+        assert rows['https://example.ch/2'] == (ids['https://example.ch/2'], 'Praktikum Informatik')
+        assert 'https://example.ch/3' not in rows and 'https://example.ch/4' in rows
+        assert db.query("SELECT job_id, link, notified FROM removed_jobs") == [
+            (ids['https://example.ch/3'], 'https://example.ch/3', 0)
+        ]
+
+
+def test_links_stay_unique_per_crawl():
+    with DiffDatabase() as db:
+        ### A link listed twice on the site is stored once
+        metrics, _ = db.run([posting(1), posting(1, location='Wil'), posting(2)])
+        assert metrics.jobs_new == 2
+        db.run([posting(1), posting(2), posting(2)])
+        assert db.query('''
+            SELECT crawl_id, link FROM crawl_results GROUP BY crawl_id, link HAVING COUNT(*) > 1
+        ''') == []
+        unique = [row for row in db.query("PRAGMA index_list(crawl_results)") if row[1] == 'idx_crawl_results_crawl_link']
+        assert unique and unique[0][2] == 1
+
+
+def test_unchanged_results_write_no_rows():
+    with DiffDatabase() as db:
+        results = [posting(number) for number in range(1, 6)]
+        db.run(results)
+        before = db.query("SELECT * FROM crawl_results ORDER BY id")
+
+        metrics, writes = db.run(results)
+        assert (metrics.jobs_new, metrics.jobs_removed) == (0, 0)
+        assert writes == []
+        assert db.query("SELECT * FROM crawl_results ORDER BY id") == before
+
+
+if __name__ == "__main__":
+    test_new_still_listed_and_removed_jobs()
+    test_links_stay_unique_per_crawl()
+    test_unchanged_results_write_no_rows()
+    print("All crawl diff tests passed")
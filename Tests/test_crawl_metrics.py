@@ -0,0 +1,44 @@
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawler.metrics import CrawlMetrics
+from storage import close_pool
+
+
+def test_phases_and_save():
+    metrics = CrawlMetrics(crawl_id=7, crawl_url='https://example.ch/jobs')
+    metrics.add('filter', 0.25)
+    with metrics.phase('diff'):
+        pass
+    metrics.record_stream(2048, 0.5)
+    metrics.pages = 2
+    metrics.status = 'ok'
+
+    assert metrics.phase_ms['filter'] == 250
+    assert metrics.network_seconds() == 0.5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'metrics.db')
+        metrics.save(db_path)
+        close_pool(db_path)
+        conn = sqlite3.connect(db_path)
+        try:
+            row = conn.execute(
+                "SELECT crawl_id, status, pages, bytes, download_ms, filter_ms FROM crawl_metrics"
+            ).fetchone()
+        finally:
+            conn.close()
+    assert row == (7, 'ok', 2, 2048, 500.0, 250.0)
+
+
+if __name__ == "__main__":
+    test_phases_and_save()
+    print("All crawl metrics tests passed")
@@ -0,0 +1,42 @@
+import sys
+import os
+import threading
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawl_executor import CrawlQueue, HTTP, BROWSER
+
+
+def test_longest_crawls_first_on_separate_pools():
+    ran = []
+    done = threading.Event()
+
+    def run_crawl(crawl_id, url, keywords):
+        ran.append((threading.current_thread().name.split('-')[1], crawl_id))
+        if len(ran) == 5:
+            done.set()
+
+    crawl_queue = CrawlQueue(run_crawl, http_workers=1, browser_workers=1)
+    crawl_queue.submit(1, 'https://a.ch', [], HTTP, expected_seconds=5)
+    crawl_queue.submit(2, 'https://b.ch', [], HTTP, expected_seconds=60)
+    crawl_queue.submit(3, 'https://c.ch', [], BROWSER, expected_seconds=30)
+    crawl_queue.submit(4, 'https://d.ch', [], HTTP)
+    crawl_queue.submit(5, 'https://e.ch', [], BROWSER, expected_seconds=120)
+    assert not crawl_queue.submit(2, 'https://b.ch', [], HTTP)
+    assert crawl_queue.backlog_seconds() == {HTTP: 85, BROWSER: 150}
+
+    crawl_queue.start()
+    assert done.wait(5)
+    crawl_queue.stop()
+
+    assert [crawl_id for kind, crawl_id in ran if kind == HTTP] == [2, 4, 1]
+    assert [crawl_id for kind, crawl_id in ran if kind == BROWSER] == [5, 3]
+
+
+if __name__ == "__main__":
+    test_longest_crawls_first_on_separate_pools()
+    print("All crawl queue tests passed")
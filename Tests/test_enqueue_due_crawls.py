@@ -0,0 +1,90 @@
+import sys
+import os
+import tempfile
+from datetime import datetime
+from pytz import timezone
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from schedule import CrawlerScheduler
+from crawler.metrics import CrawlMetrics
+from database import Database
+from storage import connect, close_pool
+
+
+def test_crawls_after_the_email_report_run_at_their_time():
+    with tempfile.TemporaryDirectory() as tmp:
+        scheduler = CrawlerScheduler()
+        scheduler.db_path = os.path.join(tmp, 'crawls.db')
+        scheduler.email_time = '15:30'
+        scheduler.crawls = {
+            1: ('Morning', 'https://a.ch/jobs', '09:00', 'mon', ['praktikum']),
+            2: ('Report time', 'https://b.ch/jobs', '15:30', 'mon', ['praktikum']),
+            3: ('Evening', 'https://c.ch/jobs', '18:00', 'mon', ['praktikum']),
+        }
+        try:
+            ### 2026-03-02 is a Monday
+            monday = datetime(2026, 3, 2)
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=9, minute=0)) == [1]
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=15, minute=29)) == []
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=15, minute=30)) == [2]
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=17, minute=59)) == []
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=18, minute=0)) == [3]
+            assert scheduler.enqueue_due_crawls(monday.replace(hour=23, minute=0)) == []
+        finally:
+            close_pool(scheduler.db_path)
+
+
+def test_crawls_before_the_report_are_released_early():
+    with tempfile.TemporaryDirectory() as tmp:
+        scheduler = CrawlerScheduler()
+        scheduler.db_path = os.path.join(tmp, 'crawls.db')
+        scheduler.email_time = '15:30'
+        scheduler.crawls = {
+            1: ('Afternoon', 'https://a.ch/jobs', '15:25', 'mon', ['praktikum']),
+            2: ('Evening', 'https://b.ch/jobs', '18:00', 'mon', ['praktikum']),
+        }
+        try:
+            ### Not enough time left before the report: crawl 1 starts now, crawl 2 waits
+            assert scheduler.enqueue_due_crawls(datetime(2026, 3, 2, 15, 21)) == [1]
+        finally:
+            close_pool(scheduler.db_path)
+
+
+def test_crawls_that_ran_today_are_not_rerun_after_a_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'crawls.db')
+        database = Database.__new__(Database)
+        database.db_file = db_path
+        conn = connect(db_path)
+        database.create_tables(conn.cursor())
+        database.apply_migrations(conn)
+        conn.close()
+
+        every_day = 'mon,tue,wed,thu,fri,sat,sun'
+        ran = database.add_crawl('Ran', 'https://a.ch/jobs', '00:00', every_day, ['praktikum'])['id']
+        missed = database.add_crawl('Missed', 'https://b.ch/jobs', '00:00', every_day, ['praktikum'])['id']
+        metrics = CrawlMetrics(ran, 'https://a.ch/jobs')
+        metrics.started_at = datetime.now(timezone('Europe/Zurich')).strftime('%Y-%m-%d 00:00:30')
+        metrics.save(db_path)
+
+        ### Starting up again only enqueues the crawl without a run today
+        scheduler = CrawlerScheduler('queue')
+        scheduler.db_path = db_path
+        scheduler.email_time = '23:59'
+        try:
+            scheduler.update_crawl_schedules()
+            assert scheduler.crawl_queue.pending == {missed}
+        finally:
+            close_pool(db_path)
+
+
+if __name__ == "__main__":
+    test_crawls_after_the_email_report_run_at_their_time()
+    test_crawls_before_the_report_are_released_early()
+    test_crawls_that_ran_today_are_not_rerun_after_a_restart()
+    print("All enqueue tests passed")
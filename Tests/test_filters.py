@@ -0,0 +1,53 @@
+import sys
+import os
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawler.filters import is_it_job, classify_titles, filter_postings, raw_postings
+from crawler.locality_index import LocalityIndex
+
+
+def test_is_it_job():
+    assert is_it_job("Software Engineer (m/w/d)")
+    assert is_it_job("Leiter IT Support")
+    assert not is_it_job("Kita Mitarbeiterin")
+    assert classify_titles(["DevOps Engineer", "Koch"]) == [True, False]
+
+
+def test_filter_postings():
+    index = LocalityIndex(["st. gallen"])
+    postings = [
+        {'title': 'Software Engineer', 'location': 'St. Gallen'},
+        {'title': 'Software Engineer', 'location': 'Zürich'},
+        {'title': 'Java Developer', 'location': 'St. Gallen'},
+        {'title': 'Software Tester', 'location': 'Bern'},
+    ]
+    verdicts = filter_postings(postings, ['Engineer', 'tester'], index)
+    assert [reasons for _, reasons in verdicts] == [
+        [],
+        ['location not in Ostschweiz'],
+        ['no keyword match'],
+        ['location not in Ostschweiz'],
+    ]
+
+    verdicts = filter_postings(postings, ['tester'], index, check_location=False)
+    assert [reasons for _, reasons in verdicts][3] == []
+
+
+def test_raw_postings_marks_method():
+    @raw_postings(check_location=False)
+    def crawl_example(crawler_instance, url, keywords):
+        return [], None
+
+    assert crawl_example.filter_spec == {'check_location': False, 'check_it_job': True}
+
+
+if __name__ == "__main__":
+    test_is_it_job()
+    test_filter_postings()
+    test_raw_postings_marks_method()
+    print("=== FILTER TESTS PASSED ===")
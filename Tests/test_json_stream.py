@@ -0,0 +1,47 @@
+import sys
+import os
+import json
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawler.json_stream import iter_json_array
+
+
+DOCUMENT = {
+    'meta': {'jobs': ['not this one'], 'note': 'a "quoted" ] [ string'},
+    'total': 3,
+    'jobs': [
+        {'title': 'Software Engineer (m/w/d)', 'links': {'directlink': 'https://example.ch/1'}},
+        {'title': 'Informatiker:in – Zürich', 'attributes': {'10': ['St. Gallen']}},
+        12345,
+        'plain string',
+        [1, 2, {'nested': True}],
+        None,
+    ],
+    'after': {'jobs': []},
+}
+
+
+def _chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_items_match_json_loads_for_any_chunk_size():
+    data = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+    for size in (1, 2, 3, 7, 64, len(data)):
+        assert list(iter_json_array(_chunks(data, size), 'jobs')) == DOCUMENT['jobs']
+
+
+def test_missing_key_and_empty_array():
+    assert list(iter_json_array([b'{"pages": []}'], 'pages')) == []
+    assert list(iter_json_array([b'{"other": [1, 2]}'], 'pages')) == []
+
+
+if __name__ == "__main__":
+    test_items_match_json_loads_for_any_chunk_size()
+    test_missing_key_and_empty_array()
+    print("All json_stream tests passed")
@@ -0,0 +1,56 @@
+import sys
+import os
+import re
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from localities_data import LOCALITIES_DATA
+from crawler.locality_index import LocalityIndex
+
+
+LOCALITY_NAMES = {name.lower() for name, _ in LOCALITIES_DATA}
+
+
+def naive_match(location):
+    """The original per-locality word boundary check"""
+    location_lower = location.lower()
+    for loc_name in LOCALITY_NAMES:
+        if loc_name in location_lower and re.search(r'\b{}\b'.format(re.escape(loc_name)), location_lower):
+            return True
+    return False
+
+
+def test_matches_like_naive_check():
+    index = LocalityIndex(LOCALITY_NAMES)
+    samples = [
+        "St. Gallen", "9000 St. Gallen", "Herisau", "Herisauer Strasse", "Zürich",
+        "Rapperswil-Jona", "Heerbrugg, Switzerland", "Bern", "Chur / Remote",
+        "Rüthi (Rheintal)", "Gossau SG", "", "Home Office",
+    ]
+    for name in sorted(LOCALITY_NAMES)[::25]:
+        samples.extend([name, f"9000 {name}", f"{name}er", name[:-1]])
+
+    for location in samples:
+        assert index.matches(location) == naive_match(location), location
+
+
+def test_classify_batch():
+    index = LocalityIndex(["st. gallen", "wil"])
+    assert index.classify(["St. Gallen", "Wil SG", "Wilen", "Zürich"]) == [True, True, False, False]
+
+
+def test_empty_index():
+    index = LocalityIndex([])
+    assert index.matches("St. Gallen") is False
+    assert index.find("St. Gallen") is None
+
+
+if __name__ == "__main__":
+    test_matches_like_naive_check()
+    test_classify_batch()
+    test_empty_index()
+    print("=== LOCALITY INDEX TESTS PASSED ===")
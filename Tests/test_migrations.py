@@ -0,0 +1,67 @@
+import sys
+import os
+import tempfile
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from database import Database, MIGRATIONS
+from storage import connect, close_pool
+
+
+def test_migrations_upgrade_existing_database():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'crawls.db')
+        database = Database.__new__(Database)
+        database.db_file = db_path
+        try:
+            conn = connect(db_path)
+            cursor = conn.cursor()
+            database.create_tables(cursor)
+            ### Rows stored before the migrations get their day columns too
+            cursor.execute('''
+                INSERT INTO crawl_results (crawl_id, crawl_url, title, link, crawl_date)
+                VALUES (1, 'https://example.ch/jobs', 'Praktikum', 'https://example.ch/1', '2026-03-01 08:15:00')
+            ''')
+            ### A duplicate of the job from before the unique link index
+            cursor.execute('''
+                INSERT INTO crawl_results (crawl_id, crawl_url, title, link, crawl_date)
+                VALUES (1, 'https://example.ch/jobs', 'Praktikum', 'https://example.ch/1', '2026-03-02 08:15:00')
+            ''')
+            cursor.execute('''
+                INSERT INTO removed_jobs (crawl_id, title, link, removal_date, notified)
+                VALUES (1, 'Werkstudent', 'https://example.ch/2', '2026-02-27 16:00:00', 1)
+            ''')
+            conn.commit()
+
+            database.apply_migrations(conn)
+            database.apply_migrations(conn)
+            assert cursor.execute("PRAGMA user_version").fetchone()[0] == len(MIGRATIONS)
+
+            assert cursor.execute("SELECT crawl_day FROM crawl_results").fetchall() == [('2026-03-01',)]
+            unique = [row for row in cursor.execute("PRAGMA index_list(crawl_results)")
+                      if row[1] == 'idx_crawl_results_crawl_link']
+            assert unique and unique[0][2] == 1
+            assert cursor.execute(
+                "SELECT COUNT(*) FROM removed_jobs WHERE removal_day BETWEEN '2026-02-01' AND '2026-02-28'"
+            ).fetchone()[0] == 1
+
+            plan = cursor.execute(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM crawl_results WHERE crawl_day >= ?", ('2026-03-01',)
+            ).fetchall()
+            assert 'idx_crawl_results_day' in plan[0][-1]
+            plan = cursor.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM removed_jobs WHERE removal_date < ? AND notified = 1", ('2026-03-01',)
+            ).fetchall()
+            assert 'idx_removed_jobs_notified' in plan[0][-1]
+            conn.close()
+        finally:
+            close_pool(db_path)
+
+
+if __name__ == "__main__":
+    test_migrations_upgrade_existing_database()
+    print("All migration tests passed")
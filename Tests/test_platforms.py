@@ -0,0 +1,155 @@
+import sys
+import os
+import json
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawler.url_mapping import get_crawler_method, URL_MAPPINGS, PLATFORM_TENANTS
+from crawler.platforms import get_platform_crawler
+from crawler.base_crawler import BaseCrawler
+
+
+class FakeResponse:
+    def __init__(self, url, body):
+        self.url = url
+        self.content = body.encode('utf-8')
+        self.text = body
+        self.status_code = 200
+        self.encoding = 'utf-8'
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeCrawler:
+    """Serves fixed pages instead of fetching them"""
+    api_headers = {}
+    parse_html = BaseCrawler.parse_html
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def fetch(self, url, **kwargs):
+        return FakeResponse(url, self.pages[url])
+
+    def fetch_json_items(self, url, key, **kwargs):
+        yield from json.loads(self.pages[url])[key]
+
+
+JOBCHANNEL_PAGE = """
+<ul>
+  <li class="item"><a class="title" href="/job/1"><span class="jobtitle">Software Engineer</span></a>
+    <span class="location">St. Gallen</span><a title="Alle Jobs dieser Firma anzeigen...">ACME</a></li>
+  <li class="item"><a class="title" href="/job/2"><span class="jobtitle">Koch</span></a></li>
+</ul>
+<a class="btn btn-sm btn-secondary" href="/search?page=2">Nächste Seite</a>
+"""
+
+UMANTIS_PAGE = """
+<div class="tableaslist_cell"><a class="HSTableLinkSubTitle" aria-label="Praktikum Informatik" href="/Vacancies/1">x</a>
+  <span class="tableaslist_subtitle tableaslist_element_1152495">| St. Gallen</span></div>
+"""
+
+
+def test_jobchannel_tenant():
+    url = "https://startfeld.jobportal.jobchannel.ch/search"
+    crawl = get_crawler_method(url)
+    assert crawl.__name__ == "crawl_startfeld"
+    assert crawl.filter_spec == {'check_location': True, 'check_it_job': True}
+
+    content, next_url = crawl(FakeCrawler({url: JOBCHANNEL_PAGE}), url, ["engineer"])
+    assert next_url == "https://startfeld.jobportal.jobchannel.ch/search?page=2"
+    assert content[0] == {
+        'title': 'Software Engineer',
+        'link': '/job/1',
+        'company': 'ACME',
+        'location': 'St. Gallen',
+    }
+    assert content[1]['location'] == 'Not specified'
+
+
+def test_umantis_paging():
+    url = "https://recruitingapp-2800.umantis.com/Jobs/All?tc1152481=p1&_search_token1152481=42#connectortable_1152481"
+    crawl = get_crawler_method(url)
+    content, next_url = crawl(FakeCrawler({url: UMANTIS_PAGE}), url, ["praktikum"])
+    assert next_url == "https://recruitingapp-2800.umantis.com/Jobs/All?tc1152481=p2&_search_token1152481=42#connectortable_1152481"
+    assert content == [{
+        'title': 'Praktikum Informatik',
+        'link': 'https://recruitingapp-2800.umantis.com/Vacancies/1',
+        'company': 'Kanton St.Gallen',
+        'location': 'St. Gallen',
+    }]
+
+
+PROSPECTIVE_JOBS = json.dumps({'jobs': [{
+    'title': 'Praktikum Informatik',
+    'link': 'https://ohws.prospective.ch/public/v1/jobs/7',
+    'links': {'directlink': 'https://jobs.example.ch/7'},
+    'attributes': {'10': ['St. Gallen']},
+}]})
+
+DUALOO_PAGE = """
+<a class="row" href="lx0anfq4/job/3"><span class="jobName">Praktikum Informatik</span><span class="cityName">Wil</span></a>
+"""
+
+
+def test_tenants_keep_their_stored_links():
+    ### crawl_results are keyed by link, a changed link would be reported as removed and new
+    buehler_url = "https://ohws.prospective.ch/public/v1/medium/1008005/jobs?lang=de&offset=0&limit=100"
+    content, _ = get_crawler_method(buehler_url)(FakeCrawler({buehler_url: PROSPECTIVE_JOBS}), buehler_url, ["praktikum"])
+    assert content[0]['link'] == 'https://ohws.prospective.ch/public/v1/jobs/7'
+
+    ost_url = "https://ohws.prospective.ch/public/v1/medium/1007649/jobs?lang=de&offset=0&limit=999"
+    content, _ = get_crawler_method(ost_url)(FakeCrawler({ost_url: PROSPECTIVE_JOBS}), ost_url, ["praktikum"])
+    assert content[0]['link'] == 'https://jobs.example.ch/7'
+
+    egeli_url = "https://jobs.dualoo.com/portal/lx0anfq4?lang=DE"
+    content, _ = get_crawler_method(egeli_url)(FakeCrawler({egeli_url: DUALOO_PAGE}), egeli_url, ["praktikum"])
+    assert content[0]['link'] == 'https://jobs.dualoo.com/portal/lx0anfq4/job/3'
+
+
+ABACUSCITY_PAGE = """
+<table>
+  <tr class="nav-row odd"><td><a href="/de/jobportal/job/1">Praktikum Informatik</a></td></tr>
+</table>
+<div class="row nav-row"><a class="nav-item" href="/teaser">Teaser</a><a class="nav-item font" href="/de/jobportal/job/2">Werkstudent IT</a>
+  <span class="nav-filter jobsfiltercolumncontent cl6a9b5550-033d-74d4-f2f2-1b0e19589c4f">Wil</span>
+  <span class="nav-filter jobsfiltercolumncontent clada51a77-64c4-e8dc-646e-40de4a1d6ce3">MS Direct AG</span></div>
+<div class="nav-row-header"><a href="/sort">Sortieren</a></div>
+"""
+
+
+def test_abacuscity_tenants_keep_their_row_markup():
+    ### SVA lists its jobs in table rows, MS Direct in 'row nav-row' divs
+    svasg_url = "https://svasg-jobs.abacuscity.ch/de/jobportal/"
+    content, _ = get_crawler_method(svasg_url)(FakeCrawler({svasg_url: ABACUSCITY_PAGE}), svasg_url, ["praktikum"])
+    assert [(job['title'], job['link']) for job in content] == [('Praktikum Informatik', '/de/jobportal/job/1')]
+
+    msdirect_url = "https://msdirectgroup-jobs.abacuscity.ch/de/jobportal"
+    content, _ = get_crawler_method(msdirect_url)(FakeCrawler({msdirect_url: ABACUSCITY_PAGE}), msdirect_url, ["werkstudent"])
+    assert content == [{
+        'title': 'Werkstudent IT',
+        'link': 'https://msdirectgroup-jobs.abacuscity.ch/de/jobportal/job/2',
+        'location': 'Wil',
+        'company': 'MS Direct AG',
+    }]
+
+
+def test_every_tenant_has_an_adapter():
+    mapped = set(URL_MAPPINGS.values())
+    for name in PLATFORM_TENANTS:
+        assert name in mapped, name
+        assert get_platform_crawler(name, PLATFORM_TENANTS[name]).__name__ == f"crawl_{name}"
+
+
+if __name__ == "__main__":
+    test_jobchannel_tenant()
+    test_umantis_paging()
+    test_tenants_keep_their_stored_links()
+    test_abacuscity_tenants_keep_their_row_markup()
+    test_every_tenant_has_an_adapter()
+    print("=== PLATFORM TESTS PASSED ===")
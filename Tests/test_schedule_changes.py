@@ -0,0 +1,120 @@
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from schedule import CrawlerScheduler
+from database import Database
+from storage import connect, close_pool
+
+
+def feed_rows(db_path, after_seq=0):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute('''
+            SELECT entity, entity_id, action FROM schedule_changes WHERE seq > ? ORDER BY seq
+        ''', (after_seq,)).fetchall()
+    finally:
+        conn.close()
+
+
+def test_change_feed_reschedules_jobs():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'crawls.db')
+        database = Database.__new__(Database)
+        database.db_file = db_path
+        conn = connect(db_path)
+        database.create_tables(conn.cursor())
+        database.apply_migrations(conn)
+        conn.close()
+
+        scheduler = CrawlerScheduler('cron')
+        scheduler.db_path = db_path
+        ### Paused, so the planned jobs can be inspected without running
+        scheduler.scheduler.start(paused=True)
+        try:
+            scheduler.schedule_email_task()
+            scheduler.last_change_seq = scheduler.get_last_change_seq()
+            scheduler.update_crawl_schedules()
+            assert scheduler.scheduler.get_jobs() and not scheduler.crawls
+
+            ### Adding a crawl publishes it and the next feed run plans its job
+            crawl_id = database.add_crawl('Test', 'https://example.ch/jobs', '09:00', 'mon,wed', ['praktikum'])['id']
+            assert feed_rows(db_path) == [('crawl', str(crawl_id), 'add')]
+            scheduler.apply_schedule_changes()
+            job = scheduler.scheduler.get_job(f'crawl_{crawl_id}')
+            assert "day_of_week='mon,wed', hour='9', minute='0'" in str(job.trigger)
+            assert job.args == (crawl_id, 'https://example.ch/jobs', ['praktikum'])
+
+            ### An update replaces the job with the new time, URL and keywords
+            seq = scheduler.last_change_seq
+            database.update_crawl(crawl_id, 'Test', 'https://example.ch/karriere', '10:15', 'fri', ['werkstudent'])
+            assert feed_rows(db_path, seq) == [('crawl', str(crawl_id), 'update')]
+            scheduler.apply_schedule_changes()
+            job = scheduler.scheduler.get_job(f'crawl_{crawl_id}')
+            assert "day_of_week='fri', hour='10', minute='15'" in str(job.trigger)
+            assert job.args == (crawl_id, 'https://example.ch/karriere', ['werkstudent'])
+
+            ### A new email time moves the report, cleanup and reset jobs
+            seq = scheduler.last_change_seq
+            database.update_email_settings('16:45')
+            assert feed_rows(db_path, seq) == [('setting', 'email_time', 'update')]
+            scheduler.apply_schedule_changes()
+            assert scheduler.email_time == '16:45'
+            assert "hour='16', minute='45'" in str(scheduler.scheduler.get_job(scheduler.email_task_id).trigger)
+            assert "hour='16', minute='50'" in str(scheduler.scheduler.get_job('database_cleanup').trigger)
+
+            ### Deleting the crawl removes its job
+            seq = scheduler.last_change_seq
+            database.delete_crawl(crawl_id)
+            assert feed_rows(db_path, seq) == [('crawl', str(crawl_id), 'delete')]
+            scheduler.apply_schedule_changes()
+            assert scheduler.scheduler.get_job(f'crawl_{crawl_id}') is None
+            assert crawl_id not in scheduler.crawls
+
+            ### Every change was applied once
+            assert scheduler.last_change_seq == scheduler.get_last_change_seq()
+            assert feed_rows(db_path, scheduler.last_change_seq) == []
+        finally:
+            scheduler.scheduler.shutdown(wait=False)
+            close_pool(db_path)
+
+
+def test_changes_in_queue_mode_update_the_crawls():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'crawls.db')
+        database = Database.__new__(Database)
+        database.db_file = db_path
+        conn = connect(db_path)
+        database.create_tables(conn.cursor())
+        database.apply_migrations(conn)
+        conn.close()
+
+        scheduler = CrawlerScheduler('queue')
+        scheduler.db_path = db_path
+        try:
+            first = database.add_crawl('First', 'https://a.ch/jobs', '09:00', 'mon', ['praktikum'])['id']
+            second = database.add_crawl('Second', 'https://b.ch/jobs', '18:00', 'mon', ['praktikum'])['id']
+            scheduler.apply_schedule_changes()
+            assert set(scheduler.crawls) == {first, second}
+
+            ### The queue feeder reads the crawls, no cron jobs are planned
+            database.update_crawl(first, 'First', 'https://a.ch/jobs', '11:30', 'tue', ['werkstudent'])
+            database.delete_crawl(second)
+            scheduler.apply_schedule_changes()
+            assert scheduler.crawls == {first: ('First', 'https://a.ch/jobs', '11:30', 'tue', ['werkstudent'])}
+            assert scheduler.scheduler.get_jobs() == []
+        finally:
+            close_pool(db_path)
+
+
+if __name__ == "__main__":
+    test_change_feed_reschedules_jobs()
+    test_changes_in_queue_mode_update_the_crawls()
+    print("All schedule change tests passed")
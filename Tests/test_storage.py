@@ -0,0 +1,61 @@
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from storage import connect, close_pool
+
+
+def test_pooled_connections():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'storage.db')
+        try:
+            conn = connect(db_path)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            conn.execute("CREATE TABLE jobs (link TEXT)")
+            conn.commit()
+
+            ### An uncommitted write is rolled back when the connection goes back to the pool
+            conn.execute("INSERT INTO jobs VALUES ('https://example.ch/1')")
+            conn.close()
+            conn.close()
+            assert conn.closed
+            try:
+                conn.execute("SELECT 1")
+                assert False, "closed connection still usable"
+            except sqlite3.ProgrammingError:
+                pass
+
+            ### The idle connection is reused, also from another thread
+            reused = []
+            def worker():
+                other = connect(db_path)
+                reused.append(other.execute("SELECT COUNT(*) FROM jobs").fetchone()[0])
+                other.close()
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            assert reused == [0]
+
+            with connect(db_path) as conn:
+                conn.execute("INSERT INTO jobs VALUES ('https://example.ch/2')")
+            conn.close()
+            conn = connect(db_path)
+            assert conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 1
+            conn.close()
+        finally:
+            close_pool(db_path)
+
+
+if __name__ == "__main__":
+    test_pooled_connections()
+    print("All storage tests passed")
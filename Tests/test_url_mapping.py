@@ -0,0 +1,37 @@
+import sys
+import os
+
+# Add parent directory to Python path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from crawls_data import CRAWLS_DATA
+from crawler.url_mapping import get_crawler_method, resolve_crawler_module, get_registered_hosts
+
+
+def test_every_configured_crawl_has_a_crawler():
+    for crawl in CRAWLS_DATA:
+        url = crawl[1]
+        assert resolve_crawler_module(url) is not None, url
+
+
+def test_longest_prefix_and_subdomains():
+    assert resolve_crawler_module("https://ohws.prospective.ch/public/v1/medium/1008005/jobs") == "buehler"
+    assert resolve_crawler_module("https://ohws.prospective.ch/public/v1/medium/1950/jobs") == "raiffeisen"
+    assert resolve_crawler_module("https://www.benedict.ch/jobs") == "benedict"
+    assert resolve_crawler_module("https://example.com/?ref=benedict.ch") is None
+
+
+def test_crawler_methods_are_cached():
+    url = "https://www.benedict.ch/jobs"
+    assert get_crawler_method(url) is get_crawler_method(url)
+    assert "ohws.prospective.ch" in get_registered_hosts()
+
+
+if __name__ == "__main__":
+    test_every_configured_crawl_has_a_crawler()
+    test_longest_prefix_and_subdomains()
+    test_crawler_methods_are_cached()
+    print("=== URL MAPPING TESTS PASSED ===")
@@ -0,0 +1,108 @@
+import itertools
+import logging
+import queue
+import threading
+
+### Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('CrawlExecutor')
+
+MAX_CRAWL_WORKERS = 8
+MAX_BROWSER_WORKERS = 2   # browser crawls share the Chrome pool (browser_pool.MAX_BROWSERS)
+
+### Expected durations for crawls without recorded metrics (seconds)
+DEFAULT_HTTP_DURATION = 20
+DEFAULT_BROWSER_DURATION = 90
+
+HTTP = 'http'
+BROWSER = 'browser'
+
+
+class CrawlQueue:
+    """
+    Priority work queue for crawls with separate worker pools for HTTP and browser crawls.
+
+    All crawls of a day share the same deadline (the daily report), so the longest
+    expected crawl is started first: short crawls fill the gaps at the end and a slow
+    browser crawl can't be the last one to start.
+    """
+
+    def __init__(self, run_crawl, http_workers=MAX_CRAWL_WORKERS, browser_workers=MAX_BROWSER_WORKERS):
+        """
+        Args:
+            run_crawl: Callable taking (crawl_id, url, keywords), e.g. CrawlerScheduler.execute_crawl
+            http_workers: Number of crawls fetching over HTTP at the same time
+            browser_workers: Number of browser crawls at the same time
+        """
+        self.run_crawl = run_crawl
+        self.workers = {HTTP: http_workers, BROWSER: browser_workers}
+        self.queues = {kind: queue.PriorityQueue() for kind in self.workers}
+        self.pending = set()
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        """Start the worker threads of both pools"""
+        if self._threads:
+            return
+        for kind, count in self.workers.items():
+            for number in range(count):
+                thread = threading.Thread(target=self._work, args=(kind,),
+                                          name=f'crawl-{kind}-{number}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"Crawl queue started with {self.workers[HTTP]} HTTP and {self.workers[BROWSER]} browser workers")
+
+    def stop(self):
+        """Let the workers finish their current crawl and exit"""
+        if not self._threads:
+            return
+        for kind, count in self.workers.items():
+            for _ in range(count):
+                self.queues[kind].put((float('-inf'), next(self._order), None))
+        self._threads = []
+
+    def submit(self, crawl_id, url, keywords, kind=HTTP, expected_seconds=None):
+        """
+        Enqueue a crawl, returns False if it is already queued or running.
+
+        Args:
+            kind: HTTP or BROWSER, selects the worker pool
+            expected_seconds: Expected duration, longer crawls are started first
+        """
+        if expected_seconds is None:
+            expected_seconds = DEFAULT_BROWSER_DURATION if kind == BROWSER else DEFAULT_HTTP_DURATION
+        with self._lock:
+            if crawl_id in self.pending:
+                return False
+            self.pending.add(crawl_id)
+        self.queues[kind].put((-expected_seconds, next(self._order), (crawl_id, url, keywords)))
+        return True
+
+    def backlog_seconds(self):
+        """Expected time until the queued crawls are done, per pool (ignoring running crawls)"""
+        backlog = {}
+        for kind, work_queue in self.queues.items():
+            with work_queue.mutex:
+                queued = sum(-item[0] for item in work_queue.queue if item[2] is not None)
+            backlog[kind] = queued / max(1, self.workers[kind])
+        return backlog
+
+    def _work(self, kind):
+        work_queue = self.queues[kind]
+        while True:
+            _, _, crawl = work_queue.get()
+            if crawl is None:
+                return
+            crawl_id, url, keywords = crawl
+            try:
+                self.run_crawl(crawl_id, url, keywords)
+            except Exception as e:
+                logger.error(f"Crawl {crawl_id} raised in {kind} worker: {e}")
+            finally:
+                with self._lock:
+                    self.pending.discard(crawl_id)
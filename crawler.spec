@@ -52,7 +52,17 @@ except Exception as e:
         'crawler',
         'crawler.base_crawler',
         'crawler.url_mapping',
+        'crawler.concurrency',
+        'crawler.async_engine',
+        'crawler.http_cache',
+        'crawler.locality_index',
+        'crawler.filters',
+        'crawler.browser_pool',
+        'crawler.json_stream',
+        'crawler.metrics',
+        'crawler.cassette',
         'crawler.crawlMethods',
+        'crawler.platforms',
     ]
     
     # ✅ Alle .py Files in crawlMethods/ hinzufügen
@@ -63,6 +73,13 @@ except Exception as e:
                 module_name = f'crawler.crawlMethods.{file[:-3]}'
                 manual_modules.append(module_name)
                 print(f"  Adding: {module_name}")
+
+    # ✅ Plattform-Adapter in platforms/ hinzufügen
+    platforms_dir = os.path.join(current_dir, 'crawler', 'platforms')
+    if os.path.exists(platforms_dir):
+        for file in os.listdir(platforms_dir):
+            if file.endswith('.py') and file != '__init__.py':
+                manual_modules.append(f'crawler.platforms.{file[:-3]}')
     
     hiddenimports.extend(manual_modules)
     print(f"✅ Manual collection: {len(manual_modules)} modules")
@@ -83,12 +100,14 @@ resource_files = [
     'email_notification.py',
     'gui.py',
     'schedule.py',
+    'crawl_executor.py',
     'startup_utils.py',
     'version_info_file.txt',
     '.env',
     'image.png',
     'requirements.txt',
     'database_config.py',
+    'storage.py',
     'env_utils.py',
     'version.py',
     'updater.py'
@@ -115,6 +134,7 @@ hiddenimports.extend([
     'win32service',
     'servicemanager',
     'requests',
+    'aiohttp',
     'bs4',
     'lxml',
     'gevent',
@@ -2,7 +2,7 @@
 Crawler Package - Maintains backward compatibility
 """
 
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, UNCHANGED
 
 ### Backward compatibility - expose the BaseCrawler as Crawler
 Crawler = BaseCrawler
\ No newline at end of file
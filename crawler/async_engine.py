@@ -0,0 +1,102 @@
+"""
+Asyncio crawl engine - async fetch primitive and bridge for crawl methods
+"""
+
+import asyncio
+import functools
+from contextlib import asynccontextmanager
+
+import aiohttp
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from .concurrency import MAX_CONCURRENT_REQUESTS, MAX_REQUESTS_PER_HOST
+
+DEFAULT_TIMEOUT = 10
+
+### One aiohttp session per running event loop, and the crawls using it
+_sessions = {}
+_session_users = {}
+
+
+def _get_session():
+    """Get or create the aiohttp session for the running event loop"""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            limit_per_host=MAX_REQUESTS_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def close_async_session():
+    """Close the aiohttp session of the running event loop"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+@asynccontextmanager
+async def async_session_scope():
+    """
+    Keep the loop's aiohttp session open while a crawl runs and close it once the
+    last crawl running on the loop is done, so no connector outlives the crawls
+    """
+    loop = asyncio.get_running_loop()
+    _session_users[loop] = _session_users.get(loop, 0) + 1
+    try:
+        yield
+    finally:
+        _session_users[loop] -= 1
+        if not _session_users[loop]:
+            del _session_users[loop]
+            await close_async_session()
+
+
+def _to_response(url, status, reason, headers, body, encoding):
+    """Wrap a downloaded body in a requests Response so crawl methods can treat both alike"""
+    response = Response()
+    response.url = url
+    response.status_code = status
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response.encoding = encoding
+    return response
+
+
+async def fetch_async(url, headers, method='GET', timeout=DEFAULT_TIMEOUT, **kwargs):
+    """Fetch a URL on the event loop and return a requests-compatible Response"""
+    session = _get_session()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with session.request(method, url, headers=headers, timeout=client_timeout, **kwargs) as resp:
+        body = await resp.read()
+        return _to_response(str(resp.url), resp.status, resp.reason, resp.headers, body, resp.charset)
+
+
+async def run_crawl_method(crawler_method, crawler_instance, url, keywords):
+    """Run a crawl method - coroutines are awaited, legacy sync methods run in an executor"""
+    if asyncio.iscoroutinefunction(crawler_method):
+        return await crawler_method(crawler_instance, url, keywords)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(crawler_method, crawler_instance, url, keywords)
+    )
+
+
+def run_coroutine(coro):
+    """Run a coroutine to completion from sync code and close the loop's HTTP session"""
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await close_async_session()
+
+    return asyncio.run(runner())
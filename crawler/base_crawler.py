@@ -1,16 +1,31 @@
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-import sqlite3
+from urllib3.connection import HTTPConnection
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+import contextlib
+import hashlib
+import os
+import socket
 import threading
 import re
 import time
 from database_config import get_db_path
+from storage import connect
 import urllib.parse
 import json
 
 from .url_mapping import get_crawler_method
+from .concurrency import get_host_limiter
+from .async_engine import fetch_async, run_crawl_method, run_coroutine, async_session_scope
+from .locality_index import get_locality_index
+from .filters import is_it_job, classify_titles, filter_postings
+from .http_cache import ValidatorCache, DigestCache, body_digest, conditional_headers
+from .browser_pool import get_browser_pool
+from .json_stream import iter_json_array, CHUNK_SIZE
+from .metrics import CrawlMetrics
+from .cassette import Cassette, RecordingAdapter, ReplayAdapter, RECORD, REPLAY, cassette_from_env
 
 class CustomHTTPAdapter(HTTPAdapter):
     def __init__(self, socket_options=None, *args, **kwargs):
@@ -22,13 +37,133 @@ class CustomHTTPAdapter(HTTPAdapter):
             kwargs["socket_options"] = self.socket_options
         return super(CustomHTTPAdapter, self).init_poolmanager(*args, **kwargs)
 
+
+### Shared HTTP session settings
+DEFAULT_TIMEOUT = 10
+POOL_CONNECTIONS = 32   # number of hosts kept in the pool manager
+POOL_MAXSIZE = 8        # keep-alive connections per host
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+_session = None
+_session_lock = threading.Lock()
+
+### Record/replay cassette the shared session goes through (None = live network)
+_cassette = cassette_from_env(os.environ.get('CRAWLER_CASSETTE'))
+
+### Returned by crawl() instead of a result list when the start page hasn't changed
+UNCHANGED = object()
+
+
+### BeautifulSoup tree builder for crawled pages (lxml is several times faster than html.parser)
+HTML_PARSER = 'lxml'
+
+
+def _class_matcher(wanted):
+    """
+    Match a class attribute like find_all(class_=...) does: the whole attribute value
+    or one of its classes. A SoupStrainer only sees the raw attribute string.
+    """
+    def matches(value):
+        if value is None:
+            return False
+        classes = value.split() if isinstance(value, str) else value
+        return value == wanted or ' '.join(classes) == wanted or wanted in classes
+    return matches
+
+
+def html_strainer(name=None, attrs=None, **kwargs):
+    """Build a SoupStrainer from find_all() style arguments, or None to parse everything"""
+    attrs = dict(attrs or {})
+    if 'class_' in kwargs:
+        attrs['class'] = kwargs.pop('class_')
+    attrs.update(kwargs)
+    if isinstance(attrs.get('class'), str):
+        attrs['class'] = _class_matcher(attrs['class'])
+    if name is None and not attrs:
+        return None
+    return SoupStrainer(name, attrs)
+
+
+class StartPageUnchanged(BaseException):
+    """
+    Raised by fetch() when the start page is unchanged since the last stored crawl.
+    Derives from BaseException so the crawl methods' 'except Exception' handlers
+    don't swallow it and the page is never parsed.
+    """
+
+
+def _build_session():
+    """Create a requests session with pooled keep-alive connections and retries"""
+    retry_strategy = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+        raise_on_status=False,
+    )
+    adapter = CustomHTTPAdapter(
+        socket_options=SOCKET_OPTIONS,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry_strategy,
+    )
+    if _cassette is not None:
+        adapter = RecordingAdapter(_cassette, adapter) if _cassette.mode == RECORD else ReplayAdapter(_cassette)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session():
+    """Get the process-wide HTTP session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_shared_session():
+    """Close the process-wide HTTP session and drop all pooled connections"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def use_cassette(path, mode=REPLAY):
+    """
+    Route all crawler requests through a cassette: 'record' fetches live and stores every
+    response in the cassette file, 'replay' serves the stored responses without network.
+    Pass path=None to go back to the live network.
+    """
+    global _cassette
+    close_shared_session()
+    _cassette = Cassette(path, mode) if path is not None else None
+    return _cassette
+
+
+def active_cassette():
+    """The cassette the crawlers currently use, or None"""
+    return _cassette
+
+
 class BaseCrawler:
     def __init__(self, db_path=None):
         self.db_path = db_path if db_path is not None else get_db_path()
         self.thread_local = threading.local()
         self.visited_URLs = set()
         self.results = []
-        self.ostschweiz_locations = self.get_ostschweiz_locations()
+        self._conditional = None
+        self.metrics = None
+        self.locality_index = get_locality_index(self.db_path, self.get_ostschweiz_locations)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -49,19 +184,289 @@ class BaseCrawler:
     
     
     def _get_connection(self):
-        """Get or create a thread-local database connection"""
-        if not hasattr(self.thread_local, 'connection'):
-            self.thread_local.connection = sqlite3.connect(self.db_path)
-        return self.thread_local.connection
+        """Get the thread-local connection, borrowing a new one from the pool once it was closed"""
+        connection = getattr(self.thread_local, 'connection', None)
+        if connection is None or connection.closed:
+            connection = self.thread_local.connection = connect(self.db_path)
+        return connection
     
     def _close_connection(self):
         """Close the thread-local connection if it exists"""
         if hasattr(self.thread_local, 'connection'):
             self.thread_local.connection.close()
             del self.thread_local.connection
+    
+    
+    @property
+    def session(self):
+        """The shared pooled HTTP session used by all crawl methods"""
+        return get_shared_session()
+    
+    
+    def browser(self, url=None, block_resources=True):
+        """
+        Lease a warm headless Chrome from the shared pool: 'with crawler_instance.browser(url) as driver:'
+        Images, fonts and trackers are blocked unless block_resources is False.
+        """
+        return get_browser_pool().lease(url, block_resources)
+    
+    
+    def fetch(self, url, method='GET', headers=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """Fetch a URL through the shared session (defaults to the HTML headers)"""
+        if headers is None:
+            headers = self.headers
+        headers, is_start_url = self._conditional_request(url, method, headers)
+
+        ### Replayed responses don't touch the sites, so they skip the per-host limits
+        limiter = get_host_limiter() if _cassette is None or _cassette.mode == RECORD else None
+        with limiter.slot(url) if limiter else contextlib.nullcontext():
+            started = time.perf_counter()
+            response = self.session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+            seconds = time.perf_counter() - started
+
+        if self.metrics is not None:
+            ### Streamed bodies are counted while they are read
+            self.metrics.record_response(response, seconds, 0 if kwargs.get('stream') else None)
+        self._conditional_response(response, is_start_url, streamed=kwargs.get('stream', False))
+        return response
+    
+    
+    def _conditional_request(self, url, method, headers):
+        """Add the stored validators to a request of the start URL, returns (headers, is_start_url)"""
+        conditional = self._conditional
+        is_start_url = conditional is not None and method == 'GET' and url == conditional['url']
+        ### Cassettes hold full bodies, so no validators are sent while one is in use
+        if is_start_url and _cassette is None:
+            headers = {**headers, **conditional_headers(conditional['validators'])}
+        return headers, is_start_url
+    
+    
+    def _conditional_response(self, response, is_start_url, streamed=False):
+        """Count the request of a conditional crawl and check the start page for changes"""
+        conditional = self._conditional
+        if conditional is not None:
+            conditional['fetch_count'] += 1
+            if is_start_url:
+                self._check_start_page(response, streamed=streamed)
+    
+    
+    def _check_start_page(self, response, streamed=False):
+        """
+        Abort the crawl method if the start page is unchanged (304 or same body digest).
+        Streamed bodies are digested chunk by chunk while they are parsed, see fetch_json_items.
+        """
+        conditional = self._conditional
+        if response.status_code == 304:
+            raise StartPageUnchanged('304 Not Modified')
+        if response.status_code != 200:
+            return
+
+        conditional['pending'] = (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        if conditional['crawl_id'] is None:
+            return
+        if streamed:
+            conditional['streamed'] = (response, hashlib.sha256())
+            return
+        self._check_digest(body_digest(response.content))
+    
+    
+    def _check_digest(self, digest):
+        """Keep the start page digest for commit_http_cache, abort the crawl method if it is the stored one"""
+        conditional = self._conditional
+        conditional['pending_digest'] = digest
+        if digest == conditional['digest']:
+            raise StartPageUnchanged('same content digest')
+    
+    
+    def parse_html(self, markup, name=None, attrs=None, **kwargs):
+        """
+        Parse HTML with the lxml tree builder. If the job container is given with
+        find_all() style arguments (e.g. 'li', class_='item'), only the matching
+        subtrees are built; find/find_all for the container still work on the result.
+        """
+        return BeautifulSoup(markup, HTML_PARSER, parse_only=html_strainer(name, attrs, **kwargs))
+    
+    
+    def fetch_json_items(self, url, key, headers=None, **kwargs):
+        """
+        Stream a JSON API response and yield the items of its top-level "key" array
+        one at a time, so large result lists (limit=999) are never held in memory at once.
+        A streamed start page is digested on the way and compared once its body is read,
+        an unchanged one then aborts the crawl method before the filters and the diff.
+        """
+        if headers is None:
+            headers = self.api_headers
+        response = self.fetch(url, headers=headers, stream=True, **kwargs)
+        conditional = self._conditional
+        streamed = conditional.get('streamed') if conditional is not None else None
+        digest = streamed[1] if streamed is not None and streamed[0] is response else None
+        try:
+            response.raise_for_status()
+            chunks = self._timed_chunks(response, digest)
+            yield from iter_json_array(chunks, key)
+            if digest is not None:
+                ### The bytes after the array belong to the body as well
+                for _ in chunks:
+                    pass
+                self._check_digest(digest.hexdigest())
+        finally:
+            response.close()
+    
+    
+    def _timed_chunks(self, response, digest=None):
+        """Body chunks of a streamed response, counted as download time and bytes (and fed into digest)"""
+        chunks = response.iter_content(CHUNK_SIZE)
+        while True:
+            started = time.perf_counter()
+            chunk = next(chunks, None)
+            if self.metrics is not None:
+                self.metrics.record_stream(len(chunk or b''), time.perf_counter() - started)
+            if chunk is None:
+                return
+            if digest is not None:
+                digest.update(chunk)
+            yield chunk
+    
+    
+    async def fetch_async(self, url, method='GET', headers=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """
+        Async variant of fetch for coroutine crawl methods, multiplexed on the event loop.
+        Shares the per-host limits and the conditional start page checks with fetch.
+        """
+        if headers is None:
+            headers = self.headers
+        if _cassette is not None:
+            ### Cassettes are served by the requests session, not by aiohttp
+            return await asyncio.to_thread(self.fetch, url, method, headers, timeout, **kwargs)
+        headers, is_start_url = self._conditional_request(url, method, headers)
+        async with get_host_limiter().async_slot(url):
+            started = time.perf_counter()
+            response = await fetch_async(url, headers, method=method, timeout=timeout, **kwargs)
+            seconds = time.perf_counter() - started
+        if self.metrics is not None:
+            self.metrics.record_response(response, seconds)
+        self._conditional_response(response, is_start_url)
+        return response
+        
+    
+    def _run_crawler_method(self, crawler_method, url, keywords):
+        """Call a crawl method from sync code, running coroutine methods to completion"""
+        if asyncio.iscoroutinefunction(crawler_method):
+            return run_coroutine(crawler_method(self, url, keywords))
+        return crawler_method(self, url, keywords)
+        
+    
+    def _apply_filters(self, crawler_method, page_content, keywords):
+        """Filter the postings of crawl methods that return them unfiltered"""
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.pages += 1
+            metrics.jobs_found += len(page_content or [])
+        filter_spec = getattr(crawler_method, 'filter_spec', None)
+        if filter_spec is None or not page_content:
+            return page_content
+        if metrics is None:
+            return self.filter_jobs(page_content, keywords, **filter_spec)
+        with metrics.phase('filter'):
+            return self.filter_jobs(page_content, keywords, **filter_spec)
+    
+    
+    def _timed_crawl_method(self, crawler_method, url, keywords):
+        """Run a crawl method, counting its time besides fetching as parse time"""
+        metrics = self.metrics
+        started = time.perf_counter()
+        network_before = metrics.network_seconds()
+        try:
+            return self._run_crawler_method(crawler_method, url, keywords)
+        finally:
+            network = metrics.network_seconds() - network_before
+            metrics.add('parse', max(0.0, time.perf_counter() - started - network))
+    
+    
+    def filter_jobs(self, postings, keywords, check_location=True, check_it_job=True):
+        """Keep the postings with a keyword in the title that are IT jobs located in Ostschweiz"""
+        matching = []
+        for posting, reasons in filter_postings(postings, keywords, self.locality_index,
+                                                check_location, check_it_job):
+            if reasons:
+                print(f"Skipping: {' + '.join(reasons)} - {posting.get('title')}")
+            else:
+                matching.append(posting)
+                print(f"Found matching job: {posting.get('title')}")
+        print(f"{len(matching)} of {len(postings)} postings match the filters")
+        return matching
+    
+    
+    def _begin_conditional(self, start_url, crawl_id=None):
+        """Load the stored validators and content digest of the start URL for this crawl (none without a crawl_id)"""
+        if not hasattr(self, 'validator_cache'):
+            self.validator_cache = ValidatorCache(self.db_path)
+            self.digest_cache = DigestCache(self.db_path)
+        self._conditional = {
+            'url': start_url,
+            'crawl_id': crawl_id,
+            'validators': self.validator_cache.get(crawl_id, start_url) if crawl_id is not None else None,
+            'digest': self.digest_cache.get(crawl_id, start_url) if crawl_id is not None else None,
+            'fetch_count': 0,
+            'pending': None,
+            'pending_digest': None,
+            'streamed': None,
+        }
+    
+    
+    def commit_http_cache(self):
+        """
+        Persist validators and digest of the last conditional crawl, once its results are stored.
+        After a failed or empty crawl the stored entries are dropped instead, so the next
+        run parses the page again rather than keeping the results of this one.
+        """
+        conditional = self._conditional
+        if conditional is None:
+            return
+        try:
+            url, crawl_id = conditional['url'], conditional['crawl_id']
+            if crawl_id is None:
+                return
+            etag, last_modified = conditional['pending'] or (None, None)
+            ### Only single-request crawls can be skipped safely on the next run. Crawl methods
+            ### swallow their parse errors and return [], so empty results aren't trusted either.
+            metrics = self.metrics
+            succeeded = metrics is not None and metrics.status == 'ok' and metrics.jobs_found > 0
+            cacheable = succeeded and conditional['fetch_count'] == 1
+
+            if cacheable and (etag or last_modified):
+                self.validator_cache.store(crawl_id, url, etag, last_modified)
+            elif conditional['validators']:
+                self.validator_cache.forget(crawl_id, url)
+
+            if cacheable and conditional['pending_digest']:
+                self.digest_cache.store(crawl_id, url, conditional['pending_digest'])
+            elif conditional['digest']:
+                self.digest_cache.forget(crawl_id, url)
+        except Exception as e:
+            print(f"Error storing HTTP cache entries: {e}")
+        finally:
+            self._conditional = None
         
     
-    def crawl(self, start_url: str, keywords: list[str], max_pages: int = 30):
+    def crawl(self, start_url: str, keywords: list[str], max_pages: int = 30,
+              conditional: bool = False, crawl_id=None):
+        """
+        Crawl a start URL and all following pages.
+
+        With conditional=True and a crawl_id the start URL is requested with the ETag/Last-Modified
+        validators stored for that crawl and compared against its stored body digest.
+        UNCHANGED is returned without parsing if the start page hasn't changed.
+        Timings, bytes and job counts of the run are collected in self.metrics.
+        """
+        self.metrics = CrawlMetrics(crawl_id, start_url)
+        if conditional:
+            try:
+                self._begin_conditional(start_url, crawl_id)
+            except Exception as e:
+                print(f"Error loading HTTP validators: {e}")
+                self._conditional = None
+
         all_content = []
         current_url = start_url
         page_count = 1
@@ -77,7 +482,8 @@ class BaseCrawler:
                 # Get crawler method for URL
                 crawler_method = get_crawler_method(current_url)
                 if crawler_method:
-                    page_content, next_url = crawler_method(self, current_url, keywords)
+                    page_content, next_url = self._timed_crawl_method(crawler_method, current_url, keywords)
+                    page_content = self._apply_filters(crawler_method, page_content, keywords)
                     if page_content:
                         all_content.extend(page_content)
 
@@ -88,14 +494,82 @@ class BaseCrawler:
                         current_url = None
                 else:
                     print(f"No crawler found for URL: {current_url}")
+                    self.metrics.status = 'no crawler'
                     return None
 
+            except StartPageUnchanged as e:
+                print(f"\nStart page unchanged since last crawl ({e}): {start_url}")
+                self._conditional = None
+                self.metrics.status = 'unchanged'
+                return UNCHANGED
             except Exception as e:
                 print(f"Error during crawl: {e}")
+                self.metrics.status = 'error'
                 current_url = None
             finally:
                 self._close_connection()
 
+        self.metrics.status = self.metrics.status or 'ok'
+        self.metrics.jobs_matched = len(all_content)
+        self._print_results(all_content)
+        return all_content
+    
+    
+    async def crawl_async(self, start_url: str, keywords: list[str], max_pages: int = 30):
+        """Async variant of crawl - coroutine crawl methods run on the loop, sync ones in an executor"""
+        ### The loop's aiohttp session is closed once the last crawl on the loop is done
+        async with async_session_scope():
+            return await self._crawl_async(start_url, keywords, max_pages)
+    
+    
+    async def _crawl_async(self, start_url, keywords, max_pages):
+        self.metrics = CrawlMetrics(crawl_url=start_url)
+        all_content = []
+        current_url = start_url
+        page_count = 1
+
+        print("\n" + "="*60)
+        print(f"Starting async crawler with keywords: {', '.join(keywords)}")
+        print("="*60)
+
+        while current_url and page_count <= max_pages:
+            print(f"\nCrawling page {page_count}: {current_url}")
+
+            try:
+                crawler_method = get_crawler_method(current_url)
+                if crawler_method:
+                    started = time.perf_counter()
+                    network_before = self.metrics.network_seconds()
+                    page_content, next_url = await run_crawl_method(crawler_method, self, current_url, keywords)
+                    network = self.metrics.network_seconds() - network_before
+                    self.metrics.add('parse', max(0.0, time.perf_counter() - started - network))
+                    page_content = self._apply_filters(crawler_method, page_content, keywords)
+                    if page_content:
+                        all_content.extend(page_content)
+
+                    if next_url and next_url != current_url:
+                        current_url = next_url
+                        page_count += 1
+                    else:
+                        current_url = None
+                else:
+                    print(f"No crawler found for URL: {current_url}")
+                    self.metrics.status = 'no crawler'
+                    return None
+
+            except Exception as e:
+                print(f"Error during crawl: {e}")
+                self.metrics.status = 'error'
+                current_url = None
+
+        self.metrics.status = self.metrics.status or 'ok'
+        self.metrics.jobs_matched = len(all_content)
+        self._print_results(all_content)
+        return all_content
+    
+    
+    def _print_results(self, all_content):
+        """Print a summary of all matching jobs of a crawl"""
         print("\n" + "="*60)
         print(f"Crawling completed - Found {len(all_content)} matching jobs")
         print("="*60)
@@ -114,8 +588,12 @@ class BaseCrawler:
         print("\n" + "="*60)
         print("End of results")
         print("="*60)
-
-        return all_content
+    
+    
+    @property
+    def ostschweiz_locations(self):
+        """All Ostschweiz municipality names (lowercase) of the shared locality index"""
+        return self.locality_index.names
     
     
     def get_ostschweiz_locations(self):
@@ -132,65 +610,28 @@ class BaseCrawler:
         
         
     def is_location_in_ostschweiz(self, location):
-        """Check if a location is in Ostschweiz"""
-        print(f"Checking location: {location}")
-        location_lower = location.lower()
-        for loc_name in self.ostschweiz_locations:
-            if loc_name in location.lower():
-                if loc_name in location_lower:
-                    # Check if the matched municipality is a standalone word
-                    if re.search(r'\b{}\b'.format(re.escape(loc_name)), location_lower):
-                        print(f"Location {location} is in Ostschweiz")
-                        return True
-                    else:
-                        print(f"Skipping partial match: {loc_name} in {location}")
+        """Check if a location is in Ostschweiz (a municipality occurs as a standalone word)"""
+        if self.locality_index.matches(location):
+            print(f"Location {location} is in Ostschweiz")
+            return True
 
         print(f"Location {location} is not in Ostschweiz")
         return False
     
+    
+    def classify_locations(self, locations):
+        """Check a list of locations at once, returns a list of booleans"""
+        return self.locality_index.classify(locations)
+    
         
     def is_it_job(self, title):
         """Check if a job title is an IT job"""
-        it_keywords = [
-            'informatik',
-            'software',
-            'entwickler',
-            'developer',
-            'programmierer',
-            'engineer',
-            'devops',
-            'cloud',
-            'network',
-            'storage',
-            'cyber',
-            'application',
-            'applikation',
-            'ict',
-            'systemadministrator',
-            'system',
-            'digital',
-            'consult',
-            'datenbank',
-            'frontend',
-            'backend',
-            'fullstack',
-            'consultant',
-            'consulting',
-            'it',
-            'support',
-        ]
-
-        title_lower = title.lower()
-
-        for keyword in it_keywords:
-            if keyword == 'it':
-                if re.search(r'\bit\b', title_lower):
-                    return True
-            else:
-                if keyword in title_lower:
-                    return True
-
-        return False
+        return is_it_job(title)
+    
+    
+    def classify_titles(self, titles):
+        """Check a list of job titles at once, returns a list of booleans"""
+        return classify_titles(titles)
     
     
     def __del__(self):
@@ -0,0 +1,493 @@
+"""
+Pool of warm headless Chrome instances shared by the Selenium based crawl methods
+"""
+
+import atexit
+import itertools
+import json
+import socket
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+MAX_BROWSERS = 2          # concurrently running Chrome instances
+MAX_USES = 25             # leases before an instance is restarted
+MAX_MEMORY_MB = 1024      # restart an instance once Chrome uses more than this (RSS incl. renderers)
+PAGE_LOAD_TIMEOUT = 30
+WAIT_POLL_INTERVAL = 0.1   # seconds between readiness checks
+NETWORK_IDLE_TIME = 0.5    # no new resources for this long counts as network idle
+
+CHROME_ARGUMENTS = [
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--window-size=1920,1080",
+]
+
+### DevTools resource types that are never needed to render a job list, failed by request interception
+BLOCKED_RESOURCE_TYPES = ['Image', 'Font', 'Media']
+DEVTOOLS_TIMEOUT = 10
+
+### Third-party trackers, analytics, consent banners, chat widgets and font CDNs
+BLOCKED_DOMAINS = [
+    'googletagmanager.com',
+    'google-analytics.com',
+    'analytics.google.com',
+    'doubleclick.net',
+    'googleadservices.com',
+    'googlesyndication.com',
+    'fonts.googleapis.com',
+    'fonts.gstatic.com',
+    'connect.facebook.net',
+    'facebook.com',
+    'snap.licdn.com',
+    'px.ads.linkedin.com',
+    'bat.bing.com',
+    'clarity.ms',
+    'hotjar.com',
+    'hs-scripts.com',
+    'hs-analytics.net',
+    'cookiebot.com',
+    'consent.cookiebot.com',
+    'usercentrics.eu',
+    'onetrust.com',
+    'cookielaw.org',
+    'matomo.cloud',
+    'youtube.com',
+    'ytimg.com',
+    'vimeo.com',
+    'tiktok.com',
+    'twitter.com',
+    'zendesk.com',
+    'intercom.io',
+]
+
+### Per-site exceptions: crawl hostname -> domains that must still load for the job list to render
+SITE_ALLOWED_DOMAINS = {
+    # e.g. 'jobs.example.ch': ['fonts.googleapis.com'],
+}
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_path():
+    """
+    Resolve the chromedriver binary once per process. Uses webdriver-manager if
+    it's installed, otherwise returns None and leaves it to Selenium Manager.
+    """
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    _driver_path = ChromeDriverManager().install()
+                except Exception as e:
+                    print(f"Could not resolve chromedriver with webdriver-manager, using Selenium Manager: {e}")
+                    _driver_path = ''
+    return _driver_path or None
+
+
+def blocked_url_patterns(url=None, block_resources=True):
+    """
+    URL patterns of the blocked third-party domains for Network.setBlockedURLs.
+    Domains listed in SITE_ALLOWED_DOMAINS for the crawl's hostname are left out.
+    """
+    if not block_resources:
+        return []
+
+    host = (urlsplit(url).hostname or '') if url else ''
+    allowed = set()
+    for site, domains in SITE_ALLOWED_DOMAINS.items():
+        if host == site or host.endswith('.' + site):
+            allowed.update(domains)
+
+    patterns = []
+    for domain in BLOCKED_DOMAINS:
+        if domain not in allowed:
+            patterns.extend([f'*://{domain}/*', f'*://*.{domain}/*'])
+    return patterns
+
+
+class ResourceBlocker:
+    """
+    Fails the image, font and media requests of a tab by resource type, whatever their URL.
+    Chromedriver doesn't forward DevTools events, so the blocker opens its own DevTools
+    connection to the tab, enables Fetch interception for BLOCKED_RESOURCE_TYPES and
+    answers every Fetch.requestPaused with Fetch.failRequest from a daemon thread.
+    Chrome drops the interception when the connection is closed.
+    """
+
+    def __init__(self, driver):
+        import websocket
+
+        address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        handle = driver.current_window_handle
+        with urllib.request.urlopen(f'http://{address}/json/list', timeout=DEVTOOLS_TIMEOUT) as response:
+            targets = json.load(response)
+        ### Chromedriver's window handles are the DevTools target ids
+        target = next(target for target in targets if handle.endswith(target['id']))
+
+        ### Without an Origin header Chrome accepts the connection without --remote-allow-origins
+        self._socket = websocket.create_connection(
+            target['webSocketDebuggerUrl'], timeout=DEVTOOLS_TIMEOUT, suppress_origin=True
+        )
+        self._ids = itertools.count(1)
+        patterns = [{'resourceType': resource_type, 'requestStage': 'Request'}
+                    for resource_type in BLOCKED_RESOURCE_TYPES]
+        enable_id = self._send('Fetch.enable', {'patterns': patterns})
+        ### The interception must be active before the crawl method navigates
+        while json.loads(self._socket.recv()).get('id') != enable_id:
+            pass
+        self._socket.settimeout(None)
+        threading.Thread(target=self._serve, name='resource-blocker', daemon=True).start()
+
+    def _send(self, method, params):
+        message_id = next(self._ids)
+        self._socket.send(json.dumps({'id': message_id, 'method': method, 'params': params}))
+        return message_id
+
+    def _serve(self):
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+                if message.get('method') == 'Fetch.requestPaused':
+                    self._send('Fetch.failRequest', {
+                        'requestId': message['params']['requestId'],
+                        'errorReason': 'BlockedByClient',
+                    })
+            except Exception:
+                ### The connection was closed with the tab
+                return
+
+    def close(self):
+        """Drop the connection without a close handshake, shutting the socket down wakes the serving thread"""
+        try:
+            self._socket.sock.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        self._socket.shutdown()
+
+
+def chrome_options():
+    """Headless Chrome options used for every pooled instance"""
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_experimental_option('useAutomationExtension', False)
+    return options
+
+
+class PooledBrowser:
+    """A running Chrome instance and how often it has been leased"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.base_handle = driver.current_window_handle
+        self.blocker = None
+
+    def memory_mb(self):
+        """Resident memory of chromedriver and all Chrome processes below it, or None if unknown"""
+        try:
+            import psutil
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+    def quit(self):
+        if self.blocker is not None:
+            self.blocker.close()
+        try:
+            self.driver.quit()
+        except Exception as e:
+            print(f"Error closing Chrome: {e}")
+
+
+class BrowserPool:
+    """
+    Keeps up to max_browsers headless Chrome instances warm between crawls.
+    Every lease gets a fresh tab with cleared cookies; the tab is closed on release.
+    Instances are restarted after max_uses leases, above max_memory_mb, or after an error.
+    """
+
+    def __init__(self, max_browsers=MAX_BROWSERS, max_uses=MAX_USES, max_memory_mb=MAX_MEMORY_MB):
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self._slots = threading.BoundedSemaphore(max_browsers)
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _launch(self):
+        """Start a new headless Chrome instance"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+
+        driver_path = get_driver_path()
+        service = Service(driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(service=service, options=chrome_options())
+        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        print(f"Started headless Chrome (pid {driver.service.process.pid})")
+        return PooledBrowser(driver)
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._launch()
+
+    def _open_tab(self, browser, blocked_urls, block_resources):
+        """Open a clean tab for a lease, with the resource types and URL patterns blocked in it"""
+        driver = browser.driver
+        driver.switch_to.window(browser.base_handle)
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.switch_to.new_window('tab')
+        if block_resources:
+            try:
+                browser.blocker = ResourceBlocker(driver)
+            except Exception as e:
+                print(f"Could not intercept images, fonts and media, loading them: {e}")
+        if blocked_urls:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_urls})
+
+    def _close_tab(self, browser):
+        """Close every tab except the base one"""
+        driver = browser.driver
+        if browser.blocker is not None:
+            browser.blocker.close()
+            browser.blocker = None
+        for handle in driver.window_handles:
+            if handle != browser.base_handle:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(browser.base_handle)
+
+    def _release(self, browser, healthy):
+        browser.uses += 1
+        if healthy:
+            try:
+                self._close_tab(browser)
+            except Exception as e:
+                print(f"Error closing tab, restarting Chrome: {e}")
+                healthy = False
+
+        memory = browser.memory_mb() if healthy else None
+        recycle = (not healthy or self._closed or browser.uses >= self.max_uses
+                   or (memory is not None and memory > self.max_memory_mb))
+        if recycle:
+            browser.quit()
+        else:
+            with self._lock:
+                self._idle.append(browser)
+
+    @contextmanager
+    def lease(self, url=None, block_resources=True):
+        """
+        Lease a warm Chrome instance, yields the WebDriver switched to a fresh tab.
+        With block_resources images, fonts, media and third-party trackers are not
+        loaded, except for the domains allowed for the url's site.
+        """
+        blocked_urls = blocked_url_patterns(url, block_resources)
+        with self._slots:
+            browser = self._acquire()
+            healthy = False
+            try:
+                self._open_tab(browser, blocked_urls, block_resources)
+                healthy = True
+                yield browser.driver
+            except Exception:
+                healthy = False
+                raise
+            finally:
+                self._release(browser, healthy)
+
+    def close(self):
+        """Quit all idle instances, leased ones are quit on release"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            browser.quit()
+
+
+### One round-trip per poll: the first matching selector, or the load state of the page
+_READY_SCRIPT = """
+const selectors = arguments[0];
+for (const selector of selectors) {
+    if (document.querySelector(selector)) return {selector: selector};
+}
+return {state: document.readyState, resources: performance.getEntriesByType('resource').length};
+"""
+
+_TEXT_SCRIPT = """
+const element = document.querySelector(arguments[0]);
+return element ? element.innerText : null;
+"""
+
+
+def wait_for(driver, selectors=None, timeout=10, network_idle=False):
+    """
+    Wait until one of the CSS selectors matches, or with network_idle until the
+    page is loaded and has not requested new resources for NETWORK_IDLE_TIME.
+
+    Returns:
+        The matching selector, True once the network is idle, or None at the deadline
+    """
+    if isinstance(selectors, str):
+        selectors = [selectors]
+    selectors = list(selectors or [])
+    deadline = time.monotonic() + timeout
+    resources, idle_since = None, None
+
+    while True:
+        result = driver.execute_script(_READY_SCRIPT, selectors)
+        if 'selector' in result:
+            return result['selector']
+
+        now = time.monotonic()
+        if result['state'] == 'complete':
+            if not selectors and not network_idle:
+                return True
+            if network_idle:
+                if result['resources'] != resources:
+                    resources, idle_since = result['resources'], now
+                elif now - idle_since >= NETWORK_IDLE_TIME:
+                    return True
+
+        if now >= deadline:
+            print(f"Timed out after {timeout}s waiting for {selectors or 'network idle'}")
+            return None
+        time.sleep(WAIT_POLL_INTERVAL)
+
+
+def element_text(driver, selector):
+    """Text of the first element matching the selector, or None"""
+    return driver.execute_script(_TEXT_SCRIPT, selector)
+
+
+def wait_for_change(driver, selector, previous_text, timeout=10):
+    """Wait until the text of an element differs from previous_text (e.g. after an AJAX reload), returns True or False at the deadline"""
+    deadline = time.monotonic() + timeout
+    while True:
+        text = element_text(driver, selector)
+        if text and text != previous_text:
+            return True
+        if time.monotonic() >= deadline:
+            print(f"Timed out after {timeout}s waiting for {selector} to change")
+            return False
+        time.sleep(WAIT_POLL_INTERVAL)
+
+
+### Runs a record spec in the page and returns plain JSON, see extract_records
+_EXTRACT_SCRIPT = """
+const [itemSelectors, fields] = arguments;
+let items = [];
+for (const selector of itemSelectors) {
+    items = Array.from(document.querySelectorAll(selector));
+    if (items.length) break;
+}
+const read = (element, field) => {
+    if (!element) return null;
+    if (field.prop) return element[field.prop] == null ? null : String(element[field.prop]);
+    if (field.attr) return element.getAttribute(field.attr);
+    return (element.innerText || '').trim();
+};
+return items.map(item => {
+    const record = {};
+    for (const [name, field] of Object.entries(fields)) {
+        if (field.all) {
+            record[name] = field.selectors.flatMap(selector =>
+                Array.from(item.querySelectorAll(selector)).map(element => read(element, field)));
+            continue;
+        }
+        record[name] = null;
+        for (const selector of field.selectors) {
+            const value = read(selector ? item.querySelector(selector) : item, field);
+            if (value) { record[name] = value; break; }
+        }
+    }
+    return record;
+});
+"""
+
+
+def _normalize_field(field):
+    """A field is a selector string or a dict with selector, attr, prop and all"""
+    if field is None or isinstance(field, str):
+        field = {'selector': field}
+    selectors = field.get('selector')
+    if selectors is None or isinstance(selectors, str):
+        selectors = [selectors]
+    return {
+        'selectors': list(selectors),
+        'attr': field.get('attr'),
+        'prop': field.get('prop'),
+        'all': bool(field.get('all')),
+    }
+
+
+def extract_records(driver, items, fields):
+    """
+    Extract job records in the page with a single execute_script call.
+
+    Args:
+        items: CSS selector of the job elements, or a list tried in order until one matches
+        fields: name -> field spec. A spec is a CSS selector relative to the item (None
+            for the item itself) or a dict with 'selector' (str or list of fallbacks),
+            'attr' (getAttribute), 'prop' (DOM property, e.g. absolute 'href') and 'all'
+            (list of every match). Without attr/prop the trimmed innerText is returned.
+
+    Returns:
+        list: One dict per item with a value (or None) for every field
+    """
+    if isinstance(items, str):
+        items = [items]
+    spec = {name: _normalize_field(field) for name, field in fields.items()}
+    return driver.execute_script(_EXTRACT_SCRIPT, list(items), spec) or []
+
+
+def browser_crawl(crawl_method):
+    """Mark a crawl method as driving a pooled browser, so the scheduler runs it on the browser workers"""
+    crawl_method.uses_browser = True
+    return crawl_method
+
+
+def get_browser_pool():
+    """Get the process-wide browser pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+    return _pool
+
+
+def close_browser_pool():
+    """Quit all pooled Chrome instances"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+atexit.register(close_browser_pool)
@@ -0,0 +1,152 @@
+"""
+HTTP cassettes - the responses of a real sweep recorded to disk and replayed without network.
+
+A cassette is a single SQLite file with one row per request (method + URL), the body
+zlib compressed. Enable one with use_cassette() in base_crawler or with the environment
+variable CRAWLER_CASSETTE=record:<path> / replay:<path>.
+"""
+
+import json
+import sqlite3
+import threading
+import zlib
+from datetime import timedelta
+from http.client import responses
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+RECORD = 'record'
+REPLAY = 'replay'
+MODES = (RECORD, REPLAY)
+
+### Headers the crawl methods and the redirect handling look at
+KEPT_HEADERS = ('Content-Type', 'Content-Encoding', 'Location', 'ETag', 'Last-Modified')
+
+
+def build_response(request, status, headers, url, body):
+    """Create a fully read requests Response without a connection behind it"""
+    response = requests.Response()
+    response.request = request
+    response.status_code = status
+    response.reason = responses.get(status, '')
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = url
+    response.elapsed = timedelta(0)
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class Cassette:
+    """Recorded responses indexed by method and URL"""
+
+    def __init__(self, path, mode=REPLAY):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._ensure_table()
+
+    def _ensure_table(self):
+        """Create the responses table if it doesn't exist yet"""
+        conn = sqlite3.connect(self.path)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    method TEXT,
+                    url TEXT,
+                    status INTEGER,
+                    headers TEXT,
+                    final_url TEXT,
+                    body BLOB,
+                    PRIMARY KEY (method, url)
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def __len__(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        finally:
+            conn.close()
+
+    def store(self, request, response):
+        """Record a live response, the body is read in full"""
+        headers = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        ### requests has already decoded gzip/deflate bodies
+        headers.pop('Content-Encoding', None)
+        body = zlib.compress(response.content, 6)
+        with self._lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                conn.execute('''
+                    INSERT OR REPLACE INTO responses (method, url, status, headers, final_url, body)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (request.method, request.url, response.status_code, json.dumps(headers),
+                      response.url, body))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def load(self, request):
+        """The recorded response of a request, or a 404 response if it wasn't recorded"""
+        conn = sqlite3.connect(self.path)
+        try:
+            row = conn.execute('''
+                SELECT status, headers, final_url, body FROM responses WHERE method = ? AND url = ?
+            ''', (request.method, request.url)).fetchone()
+        finally:
+            conn.close()
+
+        if row is None:
+            response = build_response(request, 404, {}, request.url, b'')
+            response.reason = 'Not recorded'
+            return response
+        status, headers, final_url, body = row
+        return build_response(request, status, json.loads(headers), final_url, zlib.decompress(body))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport sending through the live adapter and recording every response"""
+
+    def __init__(self, cassette, live_adapter):
+        super().__init__()
+        self.cassette = cassette
+        self.live_adapter = live_adapter
+
+    def send(self, request, **kwargs):
+        response = self.live_adapter.send(request, **kwargs)
+        self.cassette.store(request, response)
+        return response
+
+    def close(self):
+        self.live_adapter.close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport serving the recorded responses, never opens a connection"""
+
+    def __init__(self, cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        return self.cassette.load(request)
+
+
+def cassette_from_env(value):
+    """Parse a CRAWLER_CASSETTE value ('record:<path>' or 'replay:<path>'), None if unset"""
+    if not value:
+        return None
+    mode, _, path = value.partition(':')
+    if not path:
+        raise ValueError(f"CRAWLER_CASSETTE must be 'record:<path>' or 'replay:<path>', got {value!r}")
+    return Cassette(path, mode)
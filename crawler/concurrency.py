@@ -0,0 +1,77 @@
+"""
+Request concurrency limits shared by all crawls running in this process
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from urllib.parse import urlsplit
+
+MAX_CONCURRENT_REQUESTS = 16   # requests in flight across all hosts
+MAX_REQUESTS_PER_HOST = 2      # requests in flight against a single host
+SLOT_POLL_INTERVAL = 0.05      # seconds between slot checks of a waiting coroutine
+
+
+async def _acquire_async(semaphore):
+    """Acquire a threading semaphore without blocking the event loop (safe to cancel while waiting)"""
+    while not semaphore.acquire(blocking=False):
+        await asyncio.sleep(SLOT_POLL_INTERVAL)
+
+
+class HostLimiter:
+    """Caps in-flight requests overall and per host"""
+
+    def __init__(self, max_total=MAX_CONCURRENT_REQUESTS, max_per_host=MAX_REQUESTS_PER_HOST):
+        self.max_total = max_total
+        self.max_per_host = max_per_host
+        self._total = threading.BoundedSemaphore(max_total)
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, host):
+        """Get or create the semaphore for a host"""
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._hosts[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, url):
+        """Hold a request slot for the host of the given URL"""
+        host = (urlsplit(url).hostname or '').lower()
+        ### Wait for the host slot first so a busy host doesn't hold a global slot
+        with self._host_semaphore(host):
+            with self._total:
+                yield
+
+    @asynccontextmanager
+    async def async_slot(self, url):
+        """slot() for coroutines, sharing the limits with the threads using slot()"""
+        host = (urlsplit(url).hostname or '').lower()
+        host_semaphore = self._host_semaphore(host)
+        await _acquire_async(host_semaphore)
+        try:
+            await _acquire_async(self._total)
+            try:
+                yield
+            finally:
+                self._total.release()
+        finally:
+            host_semaphore.release()
+
+
+_limiter = HostLimiter()
+
+
+def get_host_limiter():
+    """Get the process-wide host limiter"""
+    return _limiter
+
+
+def configure_host_limiter(max_total=MAX_CONCURRENT_REQUESTS, max_per_host=MAX_REQUESTS_PER_HOST):
+    """Replace the process-wide host limiter with new limits"""
+    global _limiter
+    _limiter = HostLimiter(max_total, max_per_host)
+    return _limiter
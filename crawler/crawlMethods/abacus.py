@@ -1,15 +1,16 @@
-from bs4 import BeautifulSoup
 import requests
 import json
 import urllib.parse
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_abacus(crawler_instance, url, keywords):
         """Crawl function for Abacus API"""
         print(f"Crawling Abacus API URL: {url}")
 
         try:
             ### Make the API request
-            response = requests.get(url, headers=crawler_instance.api_headers, timeout=10)
+            response = crawler_instance.fetch(url, headers=crawler_instance.api_headers)
 
             ### Parse the response as a dictionary
             response_data = response.json()
@@ -20,7 +21,7 @@ def crawl_abacus(crawler_instance, url, keywords):
                 return [], None
 
             ### Parse the HTML content
-            soup = BeautifulSoup(response_data['html'], 'html.parser')
+            soup = crawler_instance.parse_html(response_data['html'], 'job-advertisement-table')
 
             ### Look for job advertisement table or elements
             job_elements = soup.find_all('job-advertisement-table')
@@ -47,22 +48,14 @@ def crawl_abacus(crawler_instance, url, keywords):
                         location = job.get('u_b_jobs_xxx__userfield1', 'No location')
                         link = job.get('PublicationUrlAbacusJobPortal', '#')
 
-                        ### Check if any keyword is in the title and location is in Ostschweiz
-                        if (any(keyword.lower() in title.lower() for keyword in keywords) and 
-                            crawler_instance.is_location_in_ostschweiz(location) and
-                            crawler_instance.is_it_job(title)):
-
-                            job_entry = {
-                                'title': title,
-                                'link': link,
-                                'company': 'Abacus',
-                                'location': location,
-                            }
-
-                            content.append(job_entry)
-                            print(f"Found matching job: {title}")
-                        else:
-                            print(f"Skipping non-matching job: {title}")
+                        job_entry = {
+                            'title': title,
+                            'link': link,
+                            'company': 'Abacus',
+                            'location': location,
+                        }
+
+                        content.append(job_entry)
 
                 except Exception as e:
                     print(f"Error processing job element: {e}")
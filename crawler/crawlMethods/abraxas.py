@@ -1,16 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_abraxas(crawler_instance, url, keywords):
         """Crawl function for Abraxas"""
         print(f"Crawling Abraxas URL: {url}")
 
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             print(f"Initial response status: {response.status_code}")
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'li', class_='job-list__list-item')
             job_rows = soup.find_all('li', class_='job-list__list-item')
             print(f"Found {len(job_rows)} job listings")
 
@@ -24,18 +24,12 @@ def crawl_abraxas(crawler_instance, url, keywords):
                     company = 'Abraxas'
 
                     print(f"Found job: \n Title={title} \n Location={location}")
-
-                    # Check if any keyword is in the title and location is in Ostschweiz
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title} \n")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                 
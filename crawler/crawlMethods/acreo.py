@@ -1,15 +1,15 @@
-from bs4 import BeautifulSoup
-import requests
 from bs4.element import Tag
+from ..filters import raw_postings
 
+@raw_postings(check_location=False)
 def crawl_acreo(crawler_instance, url, keywords):
         """Function to crawl Acreo"""        
         print(f"Crawling Acreo URL: {url}")
         
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'ul', class_='grid-3')
             
             job_list = soup.find('ul', class_='grid-3')
             if job_list and isinstance(job_list, Tag):
@@ -26,18 +26,12 @@ def crawl_acreo(crawler_instance, url, keywords):
                     link = 'https://acreo.ch' + job.find('a')['href']
                     location = 'St. Gallen'
                     company = 'Acreo Consulting'
-                    
-                    ### Check if any keyword is in the title and is an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_it_job(title):
-                        content.append({
-                           'title': title,
-                           'link': link,
-                           'location': location,
-                           'company': company
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                       'title': title,
+                       'link': link,
+                       'location': location,
+                       'company': company
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
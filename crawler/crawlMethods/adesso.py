@@ -1,16 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
 from bs4 import Tag
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_adesso(crawler_instance, url, keywords):
         """Function to crawl Adesso"""
         print(f"Crawling Adesso URL: {url}")
         
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'div', class_='real_table_container')
             
             job_section = soup.find('div', class_='real_table_container')
             print(f"Job section: {job_section}")
@@ -38,26 +38,12 @@ def crawl_adesso(crawler_instance, url, keywords):
                 
                 location = job.find('td', class_='real_table_col2').text.strip()
                 company = 'Adesso'
-                
-                ### Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                    content.append({
-                        'title': title,
-                        'link': link,
-                        'location': location,
-                        'company': company
-                    })
-                    print(f"Found matching job: {title}")
-                else:
-                    keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                    it_job_match = crawler_instance.is_it_job(title)
-                    if not keyword_match and not it_job_match:
-                        print(f"Skipping: no keyword match + not IT job - {title}")
-                    elif not keyword_match:
-                        print(f"Skipping: no keyword match - {title}")
-                    elif not it_job_match:
-                        print(f"Skipping: not IT job - {title}")
-                            
+                content.append({
+                    'title': title,
+                    'link': link,
+                    'location': location,
+                    'company': company
+                })
             next_page = None
             print(f"Found {len(content)} jobs")
             return content, next_page
@@ -1,14 +1,14 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_aproda(crawler_instance, url, keywords):
         """Function to crawl Aproda"""
         print(f"Crawling Aproda URL: {url}")
         
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'article', class_='note')
             
             job_rows = soup.find_all('article', class_='note')
             print(f"Found {len(job_rows)} job listings")
@@ -20,27 +20,12 @@ def crawl_aproda(crawler_instance, url, keywords):
                     link = job.find('a', class_='button')['href']
                     company = 'Aproda'
                     location = 'St. Gallen / Rotkreuz'
-                    
-                    
-                    
-                    ### Check if any keyword is in the title, location is in ostschweiz and is an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    })
                 
                 except Exception as e:
                     print(f"Error during extraction: {e}")
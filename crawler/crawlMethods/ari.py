@@ -1,19 +1,18 @@
-from bs4 import BeautifulSoup
-import requests
 import time
+from ..filters import raw_postings
 
+@raw_postings(check_location=False)
 def crawl_ari(crawler_instance, url, keywords):
         """Function to crawl ARI AG"""
         print(f"Crawling ARI AG URL: {url}")
         
         try:
-            session = requests.Session()
-            response = session.get(url, headers=crawler_instance.headers, timeout=30)
+            response = crawler_instance.fetch(url, timeout=30)
             response.raise_for_status()
             
             time.sleep(5)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content)
             #print(soup.prettify())
             
             page_title = soup.find('title')
@@ -30,26 +29,12 @@ def crawl_ari(crawler_instance, url, keywords):
                     link = title_element.find('a')['href']
                     location = 'Herisau'
                     company = 'ARI AG'
-                    
-                    ### Check if any keyword is in the title and if it's an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'location': location,
-                            'company': company
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
-                            
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'location': location,
+                        'company': company
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
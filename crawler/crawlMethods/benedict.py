@@ -2,15 +2,16 @@
 Benedict.ch Crawler
 """
 
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
+from ..filters import raw_postings
 
+@raw_postings(check_location=False, check_it_job=False)
 def crawl_benedict(crawler_instance, url, keywords):
     """Crawl function for Benedict"""
     print(f"Crawling Benedict URL: {url}")
     try:
-        response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = crawler_instance.fetch(url)
+        soup = crawler_instance.parse_html(response.content, 'div', id='city4')
     
         ### Extract parent element of listed jobs
         ### Then find all H2 elements in the div
@@ -32,17 +33,13 @@ def crawl_benedict(crawler_instance, url, keywords):
                             href = job_element.get('href')
                             link = "www.benedict.ch/" + str(href) if href else "www.benedict.ch/"
                             
-                    ### Check if any keyword is in the title
-                    if any(keyword.lower() in title.lower() for keyword in keywords):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': 'Benedict',
-                            'location': 'St. Gallen'
-                        })
-                        print(f"Found job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': 'Benedict',
+                        'location': 'St. Gallen'
+                    })
+                    print(f"Found job: {title}")
                 except Exception as e:
                     print(f"Error during extraction: {e}")
             print(content)
@@ -1,12 +1,12 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_location=False, check_it_job=False)
 def crawl_bzwu(crawler_instance, url, keywords):
         """Crawl function for BZWU"""
         print(f"Crawling BZWU URL: {url}")
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = crawler_instance.fetch(url)
+            soup = crawler_instance.parse_html(response.content, 'div', class_='panel')
 
             ### Extract parent element of listed jobs
             advertisment = soup.find_all('div', class_='panel')
@@ -26,18 +26,12 @@ def crawl_bzwu(crawler_instance, url, keywords):
                             ### Extract title and link
                             title = row.text.strip() if row else 'Not specified'
                             link = row['href'] if row else url
-                            
-                            ### Check if any keyword is in the title
-                            if any(keyword.lower() in title.lower() for keyword in keywords):
-                                content.append({
-                                    'title': title,
-                                    'link': link,
-                                    'company': 'BZWU',
-                                    'location': 'Wil-Uzwil'
-                                })
-                                print(f"Found matching job: {title}")
-                            else:
-                                print(f"Skipping non-matching job: {title}")
+                            content.append({
+                                'title': title,
+                                'link': link,
+                                'company': 'BZWU',
+                                'location': 'Wil-Uzwil'
+                            })
 
                         except Exception as e:
                             print(f"Error during extraction: {e}")
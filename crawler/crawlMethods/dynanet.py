@@ -1,15 +1,15 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_location=False)
 def crawl_dynanet(crawler_instance, url, keywords):
         """Function to crawl DynaNet"""
         print(f"Crawling DynaNet URL: {url}")
         
         try:            
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'section', class_='spaltenlayout')
             
             # Find all section elements with class 'spaltenlayout'
             layout_sections = soup.find_all('section', class_='spaltenlayout')
@@ -46,26 +46,12 @@ def crawl_dynanet(crawler_instance, url, keywords):
                         
                     location = 'St. Gallen'
                     company = 'DynaNet'
-                    
-                    # Check if any keyword is in the title and if it's an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'location': location,
-                            'company': company
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
-                            
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'location': location,
+                        'company': company
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
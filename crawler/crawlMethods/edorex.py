@@ -1,18 +1,17 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_edorex(crawler_instance, url, keywords):
         """Function to crawl Edorex"""
         print(f"Crawling Edorex URL: {url}")
         
         try:
-            session = requests.Session()
-            response = session.get(url, headers=crawler_instance.headers, timeout=15)
+            response = crawler_instance.fetch(url, timeout=15)
             response.raise_for_status()
             
             response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content)
             #print(soup.prettify())
             
             job_rows = soup.find_all(lambda tag: tag.name == 'li' and 
@@ -29,26 +28,12 @@ def crawl_edorex(crawler_instance, url, keywords):
                     link = title_element.find('a')['href']
                     company = 'Edorex'
                     location = 'St. Gallen / Ostermundingen'
-                    
-                    ### Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'location': location,
-                            'company': company
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
-                            
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'location': location,
+                        'company': company
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
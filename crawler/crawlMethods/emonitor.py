@@ -1,18 +1,17 @@
-from bs4 import BeautifulSoup
-import requests
 from bs4.element import Tag
+from ..filters import raw_postings
 
 
+@raw_postings()
 def crawl_emonitor(crawler_instance, url, keywords):
     """Function to crawl eMonitor AG"""
     print(f"Crawling eMonitor AG URL: {url}")
     
     try:
-        session = requests.Session()
-        response = session.get(url, headers=crawler_instance.headers, timeout=30)
+        response = crawler_instance.fetch(url, timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = crawler_instance.parse_html(response.content, 'div', class_='sc-beqWaB gMKCKu')
         
         job_section = soup.find('div', class_='sc-beqWaB gMKCKu')
         
@@ -30,27 +29,12 @@ def crawl_emonitor(crawler_instance, url, keywords):
                 company = 'emonitor AG'
                 
                 print(f"Found job: {title} at {location}")
-                
-                ### Check if any keyword is in the title, if it's an IT job, and if the location is in Ostschweiz
-                if (any(keyword.lower() in title.lower() for keyword in keywords) and 
-                    crawler_instance.is_it_job(title) and 
-                    crawler_instance.is_location_in_ostschweiz(location)):
-                    content.append({
-                        'title': title,
-                        'link': link,
-                        'location': location,
-                        'company': company
-                    })
-                    print(f"Found matching job: {title}")
-                else:
-                    keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                    it_job_match = crawler_instance.is_it_job(title)
-                    if not keyword_match and not it_job_match:
-                        print(f"Skipping: no keyword match + not IT job - {title}")
-                    elif not keyword_match:
-                        print(f"Skipping: no keyword match - {title}")
-                    elif not it_job_match:
-                        print(f"Skipping: not IT job - {title}")
+                content.append({
+                    'title': title,
+                    'link': link,
+                    'location': location,
+                    'company': company
+                })
             except Exception as e:
                 print(f"Error during extraction: {e}")
                 continue
@@ -1,12 +1,12 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_ffhs(crawler_instance, url, keywords):
         """Crawl function for FFHS"""
         print(f"Crawling FFHS URL: {url}")
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = crawler_instance.fetch(url)
+            soup = crawler_instance.parse_html(response.content, 'div', class_='panel panel-default')
 
             ### Extract parent element of listed jobs
             job_rows = soup.find_all('div', class_='panel panel-default')
@@ -26,16 +26,12 @@ def crawl_ffhs(crawler_instance, url, keywords):
                             for loc_name in crawler_instance.ostschweiz_locations:
                                 if loc_name in p.text.lower():
                                     location = loc_name
-                    
-                    ### Check if any keyword is in the title and location contains a municipality in Ostschweiz
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': url,
-                            'company': 'FFHS',
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': url,
+                        'company': 'FFHS',
+                        'location': location
+                    })
                 
                 except Exception as e:
                     print(f"Error during extraction: {e}")
@@ -1,7 +1,8 @@
-from bs4 import BeautifulSoup
 import requests
 import time
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_hoch(crawler_instance, url, keywords):
     """Function to crawl Hoch"""
     print(f"Crawling Hoch Health Ostschweiz URL: {url}")
@@ -18,9 +19,9 @@ def crawl_hoch(crawler_instance, url, keywords):
         print(f"URL: {current_url}")
     
         try:            
-            response = requests.get(current_url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(current_url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'tr', class_='data-row')
             job_rows = soup.find_all('tr', class_='data-row')
             print(f"Found {len(job_rows)} job listings")
             content = []
@@ -30,20 +31,14 @@ def crawl_hoch(crawler_instance, url, keywords):
                     link = 'https://jobs.h-och.ch' + job.find('a')['href']
                     location = job.find('span', class_='jobLocation').text.strip()
                     company = 'Hoch Health Ostschweiz'
-                    
-                    ### Check if any keyword is in the title and location is in Ostschweiz
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        job_data ={
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        }
-                        content.append(job_data)
-                        all_content.append(job_data)
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    job_data ={
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    }
+                    content.append(job_data)
+                    all_content.append(job_data)
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
@@ -1,9 +1,8 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from ..browser_pool import browser_crawl, wait_for, extract_records
+from ..filters import raw_postings
 
+@browser_crawl
+@raw_postings()
 def crawl_hostpoint(self, url, keywords):
             """Function to crawl Hostpoint"""
             print(f"Crawling Hostpoint URL: {url}")
@@ -11,60 +10,41 @@ def crawl_hostpoint(self, url, keywords):
             company = "Hostpoint"
             
             try:
-                # Chrome-Optionen konfigurieren
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")  # Optional: Browser im Hintergrund
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                
-                # WebDriver initialisieren
-                driver = webdriver.Chrome(options=chrome_options)
-                
-                try:
+                with self.browser(url) as driver:
                     # Seite laden
                     driver.get(url)
                 
                     # Warten bis die Seite geladen ist
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "li.job"))
-                    )
+                    wait_for(driver, "li.job", timeout=10)
                 
                     # Jobs finden und crawlen
-                    job_rows = driver.find_elements(By.CSS_SELECTOR, "li.job h5 a[href*='/jobs/details/']")
+                    job_rows = extract_records(driver, "li.job h5 a[href*='/jobs/details/']", {
+                        'title': None,
+                        'link': {'selector': None, 'prop': "href"},
+                    })
                 
                     print(f"Found {len(job_rows)} jobs")
                 
                     for job in job_rows:
                         try:
-                            title = job.text.strip()
-                            link = job.get_attribute("href")
+                            title = job['title']
+                            link = job['link']
                             location = "Rapperswil-Jona"  # Hostpoint is located in Rapperswil-Jona
                         
                             print(f"Title: {title}")
                             print(f"Location: {location}")
                             print(f"URL: {link}")
-                            
-                            # Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                            if any(keyword.lower() in title.lower() for keyword in keywords) and self.is_location_in_ostschweiz(location) and self.is_it_job(title):
-                                content.append({
-                                    'title': title,
-                                    'link': link,  # Use job_url instead of link
-                                    'location': location,
-                                    'company': company
-                                })
-                                print(f"Found matching job: {title}")
-                            else:
-                                print(f"Skipping non-matching job: {title}")
-                                
+                            content.append({
+                                'title': title,
+                                'link': link,  # Use job_url instead of link
+                                'location': location,
+                                'company': company
+                            })
                             print("---")
                             
                         except Exception as e:
                             print(f"Error during extraction: {e}")
                             continue
-                            
-                finally:
-                    # WebDriver schließen
-                    driver.quit()
                     
             except Exception as e:
                 print(f"Error during crawling: {e}")
@@ -1,14 +1,14 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_location=False, check_it_job=False)
 def crawl_infosystem(crawler_instance, url, keywords):
     """Function to crawl Infosystem"""
     print(f"Crawling Infosystem URL: {url}")
     
     try:
-        response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+        response = crawler_instance.fetch(url)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = crawler_instance.parse_html(response.content, 'div', class_='section-inner d-flex flex-column')
         
         job_rows = soup.find_all('div', class_='section-inner d-flex flex-column')
         print(f"Found {len(job_rows)} job listings")
@@ -21,17 +21,12 @@ def crawl_infosystem(crawler_instance, url, keywords):
             link = job.find('a', class_='area-link')['href'] if job.find('a', class_='area-link') else 'No link'
             location = job.find('span', class_='overline font-size-xs').text.strip() if job.find('span', class_='overline font-size-xs') else 'No location'
             company = 'Infosystem'
-            
-            if any(keyword.lower() in title.lower() for keyword in keywords):
-                content.append({
-                    'title': title,
-                    'link': link,
-                    'company': company,
-                    'location': location,
-                })
-                print(f"Found matching job: \n {title} \n {location} \n {link}")
-            else:
-                print(f"Skipping non-matching job:\n {title} \n {location} \n {link}")
+            content.append({
+                'title': title,
+                'link': link,
+                'company': company,
+                'location': location,
+            })
         
         next_page = None
         print(f"Found {len(content)} jobs")
@@ -1,32 +1,20 @@
-from bs4 import BeautifulSoup, Tag
-import requests
+from bs4 import Tag
 import time
-from requests.adapters import Retry, HTTPAdapter
+from ..filters import raw_postings
 
+@raw_postings(check_it_job=False)
 def crawl_insideit(crawler_instance, url, keywords):
         """Crawl function for inside-it.ch"""
         print(f"Crawling inside-it URL: {url}")
         try:
-            
-            ### Set up a session with retries
-            session = requests.Session()
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
-            
             time.sleep(2)
            
-            response = session.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status() 
             
             response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = crawler_instance.parse_html(response.content)
             #print(soup.prettify()[:500])
             
             ### Extract parent element of listed jobs
@@ -60,18 +48,12 @@ def crawl_insideit(crawler_instance, url, keywords):
                     ### Extract Company
                     company_element = row.find('div', class_='job-listing-company company')
                     company = company_element.text.strip() if company_element else 'Not specified'
-                    
-                    ### Check if any keyword is in the title and location is in Ostschweiz
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    })
                     
                 except Exception as e:
                     print(f"Error during extraction: {e}")
@@ -1,12 +1,12 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_ipso(crawler_instance, url, keywords):
         """Crawl function for ipso"""
         print(f"Crawling ipso URL: {url}")
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = crawler_instance.fetch(url)
+            soup = crawler_instance.parse_html(response.content, 'a', class_='beg-job-block node')
             
             job_rows = soup.find_all('a', class_='beg-job-block node')
             
@@ -17,18 +17,12 @@ def crawl_ipso(crawler_instance, url, keywords):
                     title = row.find('p', class_='beg-job-block__title').text.strip()
                     link = row['href']
                     location = row.find('span', class_='beg-job-block__city').text.strip()
-                    
-                    ### Check if any keyword is in the title and location is in Ostschweiz
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': 'ipso',
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': 'ipso',
+                        'location': location
+                    })
                 
                 except Exception as e:
                     print(f"Error during extraction: {e}")
@@ -1,17 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
 from bs4.element import Tag
+from ..filters import raw_postings
 
+@raw_postings(check_location=False)
 def crawl_joshmartin(crawler_instance, url, keywords):
         """Function to crawl JoshMartin"""
         print(f"Crawling JoshMartin URL: {url}")
         
         try:
-            session = requests.Session()
-            response = session.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'section', class_='block special-job-entries')
             
             job_section = soup.find('section', class_='block special-job-entries')
             print(f"Job section: {job_section}")
@@ -30,26 +29,12 @@ def crawl_joshmartin(crawler_instance, url, keywords):
                     link = job.find('a')['href']
                     company = 'JoshMartin'
                     location = 'St. Gallen'
-                    
-                    ### Check if any keyword is in the title and if it's an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
-                            
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
@@ -1,14 +1,14 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_location=False, check_it_job=False)
 def crawl_kms(crawler_instance, url, keywords):
         """Function to crawl KMS"""
         print(f"Crawling KMS URL: {url}")
         
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'div', class_='job__content styled')
             
             job_rows = soup.find_all('div', class_='job__content styled')
             print(f"Found {len(job_rows)} job listings")
@@ -25,18 +25,12 @@ def crawl_kms(crawler_instance, url, keywords):
                     location_element.text.strip()
                     if 'matzingen' in location_element.text.lower():
                         location = 'Matzingen'
-                
-                ### Check if any keyword is in the title
-                if any(keyword.lower() in title.lower() for keyword in keywords):
-                    content.append({
-                        'title': title,
-                        'link': link,
-                        'company': company,
-                        'location': location,
-                    })
-                    print(f"Found matching job: {title}")
-                else:
-                    print(f"Skipping non-matching job: {title}")
+                content.append({
+                    'title': title,
+                    'link': link,
+                    'company': company,
+                    'location': location,
+                })
             
             next_page = None
             print(f"Found {len(content)} jobs")
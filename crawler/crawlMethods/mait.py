@@ -1,3 +1,8 @@
+from ..browser_pool import browser_crawl, wait_for, extract_records
+from ..filters import raw_postings
+
+@browser_crawl
+@raw_postings()
 def crawl_mait(crawler_instance, url, keywords):
             """Function to crawl dynamic JavaScript jobs"""
             print(f"Crawling dynamic jobs URL: {url}")
@@ -5,42 +10,10 @@ def crawl_mait(crawler_instance, url, keywords):
             company = "Swiss-MAIT"  # Anpassen je nach Website
             
             try:
-                from selenium import webdriver
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.chrome.service import Service
-                from selenium.webdriver.chrome.options import Options
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                
-                # Erweiterte Chrome-Optionen
-                chrome_options = Options()
-                chrome_options.add_argument("--headless")
-                chrome_options.add_argument("--no-sandbox")
-                chrome_options.add_argument("--disable-dev-shm-usage")
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--disable-extensions")
-                chrome_options.add_argument("--disable-plugins")
-                chrome_options.add_argument("--disable-images")
-                chrome_options.add_argument("--disable-javascript-harmony-shipping")
-                chrome_options.add_argument("--disable-background-timer-throttling")
-                chrome_options.add_argument("--disable-renderer-backgrounding")
-                chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-                chrome_options.add_argument("--window-size=1920,1080")
-                chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-                chrome_options.add_experimental_option('useAutomationExtension', False)
-                
-                # WebDriver initialisieren
-                driver = webdriver.Chrome(options=chrome_options)
-                driver.set_page_load_timeout(30)
-               
-                try:
+                with crawler_instance.browser(url) as driver:
                     print("Loading page...")
                     driver.get(url)
                     
-                    # Längere Wartezeit für die Seite
-                    import time
-                    time.sleep(5)
-                    
                     print("Page loaded, waiting for elements...")
                     
                     # Ersten Check: Schauen ob überhaupt Jobs da sind
@@ -55,18 +28,28 @@ def crawl_mait(crawler_instance, url, keywords):
                             "[data-testid*='job']"
                         ]
                         
+                        ### Wait for whichever selector shows up first
                         job_rows = []
-                        for selector in selectors_to_try:
-                            try:
-                                WebDriverWait(driver, 10).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                                )
-                                job_rows = driver.find_elements(By.CSS_SELECTOR, selector)
-                                if job_rows:
-                                    print(f"Found jobs with selector: {selector}")
-                                    break
-                            except:
-                                continue
+                        selector = wait_for(driver, selectors_to_try, timeout=15)
+                        if selector:
+                            print(f"Found jobs with selector: {selector}")
+                            # Flexible Titel- und Ortsselektoren, alles in einem Aufruf im Browser
+                            job_rows = extract_records(driver, selector, {
+                                'title': {'selector': [
+                                    ".JobTableItem__Title-sc-1rl91hf-2",
+                                    "[class*='JobTableItem__Title']",
+                                    "[class*='job-title']",
+                                    "h1", "h2", "h3", "h4", "h5"
+                                ]},
+                                'text': None,
+                                'link': {'selector': None, 'prop': "href"},
+                                'location': {'selector': [
+                                    ".JobItem__City-sc-amhyo-0",
+                                    "[class*='JobItem__City']",
+                                    "[class*='location']",
+                                    "[class*='city']"
+                                ]},
+                            })
                         
                         if not job_rows:
                             # Fallback: Alle Links auf der Seite analysieren
@@ -84,71 +67,19 @@ def crawl_mait(crawler_instance, url, keywords):
                         
                         for job in job_rows:
                             try:
-                                # Flexibler Titel-Extraktor
-                                title = ""
-                                title_selectors = [
-                                    ".JobTableItem__Title-sc-1rl91hf-2",
-                                    "[class*='JobTableItem__Title']",
-                                    "[class*='job-title']",
-                                    "h1", "h2", "h3", "h4", "h5"
-                                ]
-                                
-                                for title_sel in title_selectors:
-                                    try:
-                                        title_elem = job.find_element(By.CSS_SELECTOR, title_sel)
-                                        title = title_elem.text.strip()
-                                        if title:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if not title:
-                                    title = job.text.strip()[:100]  # Fallback
-                                
-                                # Link extrahieren
-                                link = job.get_attribute("href") or url
-                                
-                                # Location extrahieren
-                                location = "Unbekannt"
-                                location_selectors = [
-                                    ".JobItem__City-sc-amhyo-0",
-                                    "[class*='JobItem__City']",
-                                    "[class*='location']",
-                                    "[class*='city']"
-                                ]
-                                
-                                for loc_sel in location_selectors:
-                                    try:
-                                        location_elem = job.find_element(By.CSS_SELECTOR, loc_sel)
-                                        location = location_elem.text.strip()
-                                        if location:
-                                            break
-                                    except:
-                                        continue
+                                title = job['title'] or (job['text'] or "")[:100]  # Fallback
+                                link = job['link'] or url
+                                location = job['location'] or "Unbekannt"
                                 
                                 print(f"Title: {title}")
                                 print(f"Location: {location}")
                                 print(f"URL: {link}")
-                                
-                                # Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                                if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                                    content.append({
-                                        'title': title,
-                                        'link': link,
-                                        'location': location,
-                                        'company': company
-                                    })
-                                    print(f"Found matching job: {title}")
-                                else:
-                                    keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                                    it_job_match = crawler_instance.is_it_job(title)
-                                    if not keyword_match and not it_job_match:
-                                        print(f"Skipping: no keyword match + not IT job - {title}")
-                                    elif not keyword_match:
-                                        print(f"Skipping: no keyword match - {title}")
-                                    elif not it_job_match:
-                                        print(f"Skipping: not IT job - {title}")
-                                    
+                                content.append({
+                                    'title': title,
+                                    'link': link,
+                                    'location': location,
+                                    'company': company
+                                })
                                 print("---")
                                 
                             except Exception as e:
@@ -157,9 +88,6 @@ def crawl_mait(crawler_instance, url, keywords):
                     
                     except Exception as e:
                         print(f"Error finding jobs: {e}")
-                        
-                finally:
-                    driver.quit()
                     
             except Exception as e:
                 print(f"Error during crawling: {e}")
@@ -1,18 +1,18 @@
-from bs4 import BeautifulSoup
-import requests
 from bs4.element import Tag
 import re
 import json
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_neovac(crawler_instance, url, keywords):
         """Function to crawl Neovac"""
         print(f"Crawling Neovac URL: {url}")
         
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'div', class_='toolbox-element toolbox-job-overview')
             
             job_sections = soup.find_all('div', class_='toolbox-element toolbox-job-overview')
             print(f"Found {len(job_sections)} job sections")
@@ -47,25 +47,12 @@ def crawl_neovac(crawler_instance, url, keywords):
                                     link = job.get('detailLink', '')
                                     location = job.get('placeOfWork', '')
                                     company = 'Neovac'
-
-                                    ### Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                                        content.append({
-                                            'title': title,
-                                            'link': link,
-                                            'location': location,
-                                            'company': company
-                                        })
-                                        print(f"Found matching job: {title}")
-                                    else:
-                                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                                        it_job_match = crawler_instance.is_it_job(title)
-                                        if not keyword_match and not it_job_match:
-                                            print(f"Skipping: no keyword match + not IT job - {title}")
-                                        elif not keyword_match:
-                                            print(f"Skipping: no keyword match - {title}")
-                                        elif not it_job_match:
-                                            print(f"Skipping: not IT job - {title}")
+                                    content.append({
+                                        'title': title,
+                                        'link': link,
+                                        'location': location,
+                                        'company': company
+                                    })
                             
                                 next_page = None
                                 print(f"Found {len(content)} jobs")
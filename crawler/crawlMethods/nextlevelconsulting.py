@@ -1,21 +1,18 @@
-from bs4 import BeautifulSoup
-import requests
 import time
 from bs4.element import Tag
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_nextlevelconsulting(crawler_instance, url, keywords):
         """Function to crawl Nextlevel Consulting"""
         print(f"Crawling Nextlevel Consulting URL: {url}")
         
         try:
-            ### crate a session to keep cookies
-            session = requests.Session()
-            
-            response = session.get(url, headers=crawler_instance.headers, timeout=20)
+            response = crawler_instance.fetch(url, timeout=20)
             response.raise_for_status()
             time.sleep(5)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content, 'div', class_='content-wrapper default-gap default-gap--small')
             #print(soup.prettify())
             job_section = soup.find('div', class_='content-wrapper default-gap default-gap--small')
             print(f"Job section: {job_section}")
@@ -34,26 +31,12 @@ def crawl_nextlevelconsulting(crawler_instance, url, keywords):
                     link = job['href']
                     location = job.find('div', class_='teaser-item__tags').text.strip()
                     company = 'Nextlevel Consulting'
-                    
-                    ### Check if any keyword is in the title, location is in Ostschweiz and is an IT job
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'location': location,
-                            'company': company
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
-                        
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'location': location,
+                        'company': company
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     continue
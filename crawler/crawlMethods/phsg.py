@@ -1,12 +1,12 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_location=False)
 def crawl_phsg(crawler_instance, url, keywords):
         """Crawl function for Pädagogische Hochschule St. Gallen"""
         print(f"Crawling PHSG URL: {url}")
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = crawler_instance.fetch(url)
+            soup = crawler_instance.parse_html(response.content)
             #print(soup.prettify()[:500])
 
             ### Extract parent element of listed jobs
@@ -23,18 +23,12 @@ def crawl_phsg(crawler_instance, url, keywords):
                         title = col.find('a').text.strip()
                         link_element = col.find('a')
                         link = link_element['href'] if link_element else url
-                        
-                        ### Check if any keyword is in the title
-                        if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_it_job(title):
-                            content.append({
-                                'title': title,
-                                'link': link,
-                                'company': 'Pädagogische Hochschule St. Gallen',
-                                'location': 'St. Gallen'
-                            })
-                            print(f"Found matching job: {title}")
-                        else:
-                            print(f"Skipping non-matching job: {title}")
+                        content.append({
+                            'title': title,
+                            'link': link,
+                            'company': 'Pädagogische Hochschule St. Gallen',
+                            'location': 'St. Gallen'
+                        })
                     
                 except Exception as e:
                     print(f"Error during extraction: {e}")
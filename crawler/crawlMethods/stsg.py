@@ -1,14 +1,16 @@
 from bs4 import BeautifulSoup
 import requests
 import json
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_stsg (crawler_instance, url, keywords):
         """Crawl Function for Stadt St. Gallen or St.Galler Stadwerke"""
         print(f'Crawling Stadt St. Gallen / St.Galler Stadtwerke API URL: {url}')
         
         try:          
             ### Make the API request
-            response = requests.get(url, headers=crawler_instance.api_headers, timeout=10)
+            response = crawler_instance.fetch(url, headers=crawler_instance.api_headers)
             
             ### Parse the response using utf-8-sig encoding to handle BOM
             try:
@@ -31,18 +33,12 @@ def crawl_stsg (crawler_instance, url, keywords):
                         link = 'https://live.solique.ch/STSG/de/' + job.get('link', {})
                     company = job.get('company', {}).get('value', 'No company')
                     location = 'St. Gallen'
-                    
-                    ### Check if any keyword is in the title and location is in Ostschweiz, then append to content
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': company,
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': company,
+                        'location': location
+                    })
                 except Exception as e:
                     print(f"Error during extraction: {e}")
                     
@@ -1,10 +1,11 @@
-import requests
 
+from ..filters import raw_postings
+@raw_postings()
 def crawl_swissengineering(crawler_instance, url, keywords):
         """method to crawl swissengineering.ch"""
         print(f"Crawling swissengineering URL: {url}")
         try:
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             data = response.json()
             job_rows = data.get('jobs', [])
             
@@ -17,18 +18,12 @@ def crawl_swissengineering(crawler_instance, url, keywords):
                     
                     ### Extract location
                     location = job.get('worklocation', '')
-                    
-                    ### Check if any keyword is in the title and append to content
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'company': 'SwissEngineering',
-                            'location': location
-                        })
-                        print(f"Found matching job: {title}")
-                    else:
-                        print(f"Skipping non-matching job: {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'company': 'SwissEngineering',
+                        'location': location
+                    })
                     
                 except Exception as e:
                     print(f"Error during extraction: {e}")
@@ -1,6 +1,6 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings(check_it_job=False)
 def crawl_valantic(crawler_instance, url, keywords):
         """Function to crawl Valantic"""
         print(f"Crawling Valantic URL: {url}")
@@ -32,13 +32,13 @@ def crawl_valantic(crawler_instance, url, keywords):
         try:
             content = []
             for ending in url_endings:
-                response = requests.get(url + ending, headers=crawler_instance.headers, timeout=10)
+                response = crawler_instance.fetch(url + ending)
                 
                 ### Check if the response is successful
                 response.raise_for_status()
                 
                 print(f"Response status for {url + ending}: {response.status_code}")
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = crawler_instance.parse_html(response.content, 'a', class_="bg-white flex flex-col items-start w-full rounded pt-3.5 pb-4 px-5 pr-20 shadow-[0_10px_30px_0_rgba(0,0,0,0.08)] relative group z-10 hover:z-20")
                 
                 job_rows = soup.find_all('a', class_="bg-white flex flex-col items-start w-full rounded pt-3.5 pb-4 px-5 pr-20 shadow-[0_10px_30px_0_rgba(0,0,0,0.08)] relative group z-10 hover:z-20")
                 print(f"Found {len(job_rows)} job listings")
@@ -49,19 +49,12 @@ def crawl_valantic(crawler_instance, url, keywords):
                         link = job['href']
                         location = job.find('li', class_='mt-1 text-base truncate text-black/40').text.strip()
                         company = 'Valantic'
-                        
-                        ### Check if any keyword is in the title and location is in Ostschweiz
-                        if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location):
-                            content.append({
-                                'title': title,
-                                'link': link,
-                                'company': company,
-                                'location': location                                
-                            })
-                            print(f"Found matching job: {title}")
-                        else:
-                            print(f"Skipping non-matching job: {title}")
-                            
+                        content.append({
+                            'title': title,
+                            'link': link,
+                            'company': company,
+                            'location': location                                
+                        })
                     except Exception as e:
                         print(f"Error during extraction: {e}")
                        
@@ -1,14 +1,14 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_vantage(crawler_instance, url, keywords):
         """Crawl function for Vantage"""
         print(f"Crawling Vantage URL: {url}")
         
         try:
             ### Crawl the URL
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = crawler_instance.fetch(url)
+            soup = crawler_instance.parse_html(response.content, 'div', class_='infos')
             
             ### Extract parent element of listed jobs
             if soup:
@@ -28,18 +28,12 @@ def crawl_vantage(crawler_instance, url, keywords):
                         bold_elements = row.find_all('b')
                         company = bold_elements[0].text.strip() if len(bold_elements) > 0 else 'Not specified'
                         location = bold_elements[2].text.strip() if len(bold_elements) > 2 else 'Not specified'
-
-                        ### Check if any keyword is in the title and location is in Ostschweiz
-                        if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title):
-                            content.append({
-                                'title': title,
-                                'link': link,
-                                'company': company,
-                                'location': location
-                            })
-                            print(f"Found matching job: {title}")
-                        else:
-                            print(f"Skipping non-matching job: {title}")
+                        content.append({
+                            'title': title,
+                            'link': link,
+                            'company': company,
+                            'location': location
+                        })
                     
                     except Exception as e:
                         print(f"Error during extraction: {e}")
@@ -1,16 +1,16 @@
-from bs4 import BeautifulSoup
-import requests
+from ..filters import raw_postings
 
+@raw_postings()
 def crawl_xitrust(crawler_instance, url, keywords):
         """Function to crawl Xitrust"""
         print(f"Crawling Xitrust URL: {url}")
         try:
 
-            response = requests.get(url, headers=crawler_instance.headers, timeout=10)
+            response = crawler_instance.fetch(url)
             response.raise_for_status()
             response.encoding = 'utf-8'
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = crawler_instance.parse_html(response.content)
             #print(soup.prettify())
             
             job_rows = soup.find_all(lambda tag: tag.name == 'tr' and
@@ -47,25 +47,12 @@ def crawl_xitrust(crawler_instance, url, keywords):
 
                     ### extract company      
                     company = 'Xitrust'                   
-                    
-                    ### check if any keyword is in the title, location is in Ostschweiz and is an IT job   
-                    if any(keyword.lower() in title.lower() for keyword in keywords) and crawler_instance.is_location_in_ostschweiz(location) and crawler_instance.is_it_job(title): 
-                        content.append({
-                            'title': title,
-                            'link': link,
-                            'location': location,
-                            'company': company
-                        })
-                        print(f"Found matching job: {title}")   
-                    else:
-                        keyword_match = any(keyword.lower() in title.lower() for keyword in keywords)
-                        it_job_match = crawler_instance.is_it_job(title)
-                        if not keyword_match and not it_job_match:
-                            print(f"Skipping: no keyword match + not IT job - {title}")
-                        elif not keyword_match:
-                            print(f"Skipping: no keyword match - {title}")
-                        elif not it_job_match:
-                            print(f"Skipping: not IT job - {title}")
+                    content.append({
+                        'title': title,
+                        'link': link,
+                        'location': location,
+                        'company': company
+                    })
 
                 except Exception as e:
                     print(f"Error during extraction: {e}")
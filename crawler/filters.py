@@ -0,0 +1,106 @@
+"""
+Precompiled job filters shared by all crawl methods
+"""
+
+import re
+from functools import lru_cache
+
+IT_KEYWORDS = [
+    'informatik',
+    'software',
+    'entwickler',
+    'developer',
+    'programmierer',
+    'engineer',
+    'devops',
+    'cloud',
+    'network',
+    'storage',
+    'cyber',
+    'application',
+    'applikation',
+    'ict',
+    'systemadministrator',
+    'system',
+    'digital',
+    'consult',
+    'datenbank',
+    'frontend',
+    'backend',
+    'fullstack',
+    'consultant',
+    'consulting',
+    'it',
+    'support',
+]
+
+### Every keyword matches as a substring, only 'it' has to be a standalone word
+_IT_JOB_REGEX = re.compile('|'.join(
+    r'\bit\b' if keyword == 'it' else re.escape(keyword) for keyword in IT_KEYWORDS
+))
+
+
+def normalize_title(title):
+    """Normalize a job title for matching and memoisation"""
+    return title.strip().lower()
+
+
+@lru_cache(maxsize=4096)
+def _is_it_title(title_normalized):
+    return _IT_JOB_REGEX.search(title_normalized) is not None
+
+
+def is_it_job(title):
+    """Check if a job title is an IT job"""
+    return _is_it_title(normalize_title(title))
+
+
+def classify_titles(titles):
+    """Check a list of job titles at once, returns a list of booleans"""
+    return [_is_it_title(normalize_title(title)) for title in titles]
+
+
+@lru_cache(maxsize=256)
+def keyword_matcher(keywords):
+    """Compiled substring matcher for a tuple of lowercase keywords (None if there are none)"""
+    if not keywords:
+        return None
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+def raw_postings(check_location=True, check_it_job=True):
+    """
+    Mark a crawl method as returning unfiltered postings. BaseCrawler runs the
+    keyword, IT job and location filters over the whole batch afterwards.
+    """
+    def decorate(crawl_method):
+        crawl_method.filter_spec = {'check_location': check_location, 'check_it_job': check_it_job}
+        return crawl_method
+    return decorate
+
+
+def filter_postings(postings, keywords, locality_index, check_location=True, check_it_job=True):
+    """
+    Run the job filters over a batch of postings.
+
+    Postings are checked for a keyword in the title first; the IT job and location
+    checks only run for keyword matches.
+
+    Returns:
+        list: (posting, reasons) tuples, reasons is empty for matching postings
+    """
+    matcher = keyword_matcher(tuple(keyword.lower() for keyword in keywords))
+    verdicts = []
+    for posting in postings:
+        title = posting.get('title') or ''
+        if matcher is None or matcher.search(title.lower()) is None:
+            verdicts.append((posting, ['no keyword match']))
+            continue
+
+        reasons = []
+        if check_it_job and not is_it_job(title):
+            reasons.append('not an IT job')
+        if check_location and not locality_index.matches(posting.get('location') or ''):
+            reasons.append('location not in Ostschweiz')
+        verdicts.append((posting, reasons))
+    return verdicts
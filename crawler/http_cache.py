@@ -0,0 +1,159 @@
+"""
+Persistent HTTP caches for crawl start pages - validators for conditional GETs
+and content digests for sites that don't send validators
+"""
+
+import hashlib
+import re
+from datetime import datetime
+
+from storage import connect
+
+### Tokens that change on every request without the listing itself changing. Only markup
+### that is never shown is normalised: visible text (posting dates) and job links stay as they are.
+VOLATILE_PATTERNS = [
+    re.compile(rb'nonce="[^"]*"'),
+    re.compile(rb'(name="(?:csrf|_token|__RequestVerificationToken)[^"]*"\s+value=)"[^"]*"', re.I),
+    re.compile(rb'(name="csrf-token"\s+content=)"[^"]*"', re.I),
+    re.compile(rb'(id="__VIEWSTATE[A-Z]*"\s+value=)"[^"]*"'),
+    ### Cache-buster query strings of script and stylesheet URLs (app.js?v=123)
+    re.compile(rb'(<(?:script|link)\b[^>]*?\b(?:src|href)="[^"?]*)\?[^"]*(?=")', re.I),
+]
+
+
+class ValidatorCache:
+    """
+    Stores the ETag / Last-Modified validators of crawl start URLs in SQLite, per crawl:
+    crawls sharing a start URL (other keywords) must not be skipped on each other's results
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._ensure_table()
+
+    def _ensure_table(self):
+        """Create the http_cache table if it doesn't exist yet"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    crawl_id INTEGER,
+                    url TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    updated_at DATETIME,
+                    PRIMARY KEY (crawl_id, url)
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, crawl_id, url):
+        """Get the stored (etag, last_modified) for a crawl's start URL, or None"""
+        conn = connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                "SELECT etag, last_modified FROM http_cache WHERE crawl_id = ? AND url = ?", (crawl_id, url)
+            )
+            return cursor.fetchone()
+        finally:
+            conn.close()
+
+    def store(self, crawl_id, url, etag, last_modified):
+        """Store the validators of a crawl's start URL"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute('''
+                INSERT OR REPLACE INTO http_cache (crawl_id, url, etag, last_modified, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (crawl_id, url, etag, last_modified, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def forget(self, crawl_id, url):
+        """Drop the validators of a crawl's start URL"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute("DELETE FROM http_cache WHERE crawl_id = ? AND url = ?", (crawl_id, url))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+class DigestCache:
+    """Stores a digest of the start page body per crawl in SQLite"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._ensure_table()
+
+    def _ensure_table(self):
+        """Create the content_digests table if it doesn't exist yet"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS content_digests (
+                    crawl_id INTEGER,
+                    url TEXT,
+                    digest TEXT,
+                    updated_at DATETIME,
+                    PRIMARY KEY (crawl_id, url)
+                )
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, crawl_id, url):
+        """Get the stored digest for a crawl's start URL, or None"""
+        conn = connect(self.db_path)
+        try:
+            cursor = conn.execute(
+                "SELECT digest FROM content_digests WHERE crawl_id = ? AND url = ?", (crawl_id, url)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def store(self, crawl_id, url, digest):
+        """Store the digest of a crawl's start URL"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute('''
+                INSERT OR REPLACE INTO content_digests (crawl_id, url, digest, updated_at)
+                VALUES (?, ?, ?, ?)
+            ''', (crawl_id, url, digest, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def forget(self, crawl_id, url):
+        """Drop the digest of a crawl's start URL"""
+        conn = connect(self.db_path)
+        try:
+            conn.execute("DELETE FROM content_digests WHERE crawl_id = ? AND url = ?", (crawl_id, url))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def body_digest(content):
+    """SHA-256 of a response body with volatile tokens (nonces, CSRF tokens, asset cache-busters) removed"""
+    for pattern in VOLATILE_PATTERNS:
+        content = pattern.sub(rb'\1' if pattern.groups else b'', content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def conditional_headers(validators):
+    """Build If-None-Match / If-Modified-Since headers from stored validators"""
+    headers = {}
+    if validators:
+        etag, last_modified = validators
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
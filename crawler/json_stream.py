@@ -0,0 +1,122 @@
+"""
+Incremental decoding of the item array in large JSON API responses
+"""
+
+import codecs
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Buffer:
+    """Decoded text of a chunk stream, read on demand"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.exhausted = False
+
+    def more(self):
+        """Read the next chunk, returns False at the end of the stream"""
+        for chunk in self._chunks:
+            if not chunk:
+                continue
+            ### Drop the consumed prefix so the buffer only holds the current item
+            self.text = self.text[self.pos:] + self._decoder.decode(chunk)
+            self.pos = 0
+            return True
+        if not self.exhausted:
+            self.text = self.text[self.pos:] + self._decoder.decode(b'', final=True)
+            self.pos = 0
+            self.exhausted = True
+        return False
+
+    def peek(self):
+        """Next non-whitespace character (not consumed), or '' at the end"""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.more():
+                return ''
+
+
+def _find_array(buffer, key):
+    """Advance the buffer to just after the '[' of the top-level "key" array, returns False if missing"""
+    depth = 0
+    in_string = escaped = False
+    string_chars = []
+    last_string = None
+    while True:
+        if buffer.pos >= len(buffer.text) and not buffer.more():
+            return False
+        char = buffer.text[buffer.pos]
+        buffer.pos += 1
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+                last_string = ''.join(string_chars) if depth == 1 else None
+                continue
+            ### Only keys of the top-level object are collected
+            if depth == 1:
+                string_chars.append(char)
+            continue
+
+        if char == '"':
+            in_string = True
+            string_chars = []
+        elif char in '{[':
+            if char == '[' and depth == 1 and last_string == key:
+                return True
+            depth += 1
+            last_string = None
+        elif char in '}]':
+            depth -= 1
+        elif char == ',':
+            last_string = None
+
+
+def iter_json_array(chunks, key):
+    """
+    Yield the items of the top-level "key" array of a JSON object one at a time,
+    decoding the byte chunks as they arrive. Only the current item is held in memory.
+
+    Args:
+        chunks: Iterable of bytes, e.g. response.iter_content()
+        key: Name of the array in the top-level object (e.g. 'jobs')
+    """
+    decoder = json.JSONDecoder()
+    buffer = _Buffer(chunks)
+    if not _find_array(buffer, key):
+        return
+
+    while True:
+        char = buffer.peek()
+        if char in (']', ''):
+            return
+        if char == ',':
+            buffer.pos += 1
+            continue
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer.text, buffer.pos)
+                ### A number or literal at the end of the buffer may continue in the next chunk
+                if end < len(buffer.text) or buffer.exhausted or isinstance(item, (dict, list, str)):
+                    break
+            except json.JSONDecodeError:
+                if buffer.exhausted:
+                    raise
+            buffer.more()
+        buffer.pos = end
+        yield item
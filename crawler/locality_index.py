@@ -0,0 +1,121 @@
+"""
+Precompiled locality matcher for the Ostschweiz location check
+"""
+
+import re
+import sqlite3
+import threading
+
+from storage import connect
+
+MAX_CACHED_VERDICTS = 10000
+
+### Process-wide indexes per database: db_path -> (localities_version, LocalityIndex)
+_shared_indexes = {}
+_shared_lock = threading.Lock()
+
+
+def _trie_pattern(words):
+    """
+    Build a regex alternation for all words, factored as a character trie.
+    Shared prefixes are only tried once, so the regex engine never scans
+    the full word list at a position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        terminal = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and not terminal:
+            return branches[0]
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if terminal else pattern
+
+    if not trie:
+        return None
+    return r'\b' + build(trie) + r'\b'
+
+
+class LocalityIndex:
+    """
+    Matches location strings against a set of locality names in a single regex pass.
+    A location matches if any locality name occurs in it as a standalone word
+    (same semantics as searching r'\\b<name>\\b' for every name).
+    """
+
+    def __init__(self, names):
+        self.names = frozenset(name.lower() for name in names)
+        pattern = _trie_pattern(self.names)
+        self._regex = re.compile(pattern) if pattern else None
+        self._verdicts = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def find(self, location):
+        """Return the first locality name found in the location, or None"""
+        if self._regex is None or not location:
+            return None
+        match = self._regex.search(location.lower())
+        return match.group(0) if match else None
+
+    def matches(self, location):
+        """Check if the location contains any locality name as a standalone word"""
+        location_lower = location.lower()
+        verdict = self._verdicts.get(location_lower)
+        if verdict is None:
+            verdict = self._regex is not None and self._regex.search(location_lower) is not None
+            if len(self._verdicts) >= MAX_CACHED_VERDICTS:
+                self._verdicts.clear()
+            self._verdicts[location_lower] = verdict
+        return verdict
+
+    def classify(self, locations):
+        """Check a list of locations at once, returns a list of booleans"""
+        return [self.matches(location) for location in locations]
+
+
+def get_localities_version(db_path):
+    """Read the localities version counter (bumped by triggers on every change), or None"""
+    conn = connect(db_path)
+    try:
+        cursor = conn.execute("SELECT value FROM settings WHERE name = 'localities_version'")
+        row = cursor.fetchone()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+
+
+def get_locality_index(db_path, load_names):
+    """
+    Get the shared LocalityIndex for a database, loading it only once per process
+    and rebuilding it only when the localities version counter changed.
+
+    Args:
+        db_path: Path of the SQLite database
+        load_names: Callable returning the locality names, used on (re)load
+    """
+    version = get_localities_version(db_path)
+    cached = _shared_indexes.get(db_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _shared_lock:
+        cached = _shared_indexes.get(db_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        index = LocalityIndex(load_names())
+        ### Don't pin an empty index, the table may just not be populated yet
+        if len(index):
+            _shared_indexes[db_path] = (version, index)
+        return index
@@ -0,0 +1,137 @@
+"""
+Per-crawl timing and transfer metrics, stored in the crawl_metrics table
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from storage import connect
+
+### Phases timed for every crawl run (milliseconds)
+PHASES = ('connect', 'download', 'parse', 'filter', 'diff')
+
+CREATE_TABLE = '''
+    CREATE TABLE IF NOT EXISTS crawl_metrics (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        crawl_id INTEGER,
+        crawl_url TEXT,
+        started_at DATETIME,
+        status TEXT,
+        http_status INTEGER,
+        pages INTEGER,
+        requests INTEGER,
+        bytes INTEGER,
+        jobs_found INTEGER,
+        jobs_matched INTEGER,
+        jobs_new INTEGER,
+        jobs_removed INTEGER,
+        connect_ms REAL,
+        download_ms REAL,
+        parse_ms REAL,
+        filter_ms REAL,
+        diff_ms REAL,
+        total_ms REAL
+    )
+'''
+
+
+def ensure_metrics_table(conn):
+    """Create the crawl_metrics table if it doesn't exist yet"""
+    conn.execute(CREATE_TABLE)
+
+
+class CrawlMetrics:
+    """
+    Collects the metrics of one crawl run:
+        connect: time until the response headers arrived (DNS, connect, TLS and server wait)
+        download: time reading the response bodies
+        parse: time in the crawl methods besides fetching (parsing, browser rendering)
+        filter: keyword / location / IT job filter stage
+        diff: comparison with the stored crawl_results
+    """
+
+    def __init__(self, crawl_id=None, crawl_url=None):
+        self.crawl_id = crawl_id
+        self.crawl_url = crawl_url
+        self.started_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.status = None
+        self.http_status = None
+        self.pages = 0
+        self.requests = 0
+        self.bytes = 0
+        self.jobs_found = 0
+        self.jobs_matched = 0
+        self.jobs_new = None
+        self.jobs_removed = None
+        self.phase_ms = dict.fromkeys(PHASES, 0.0)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, phase, seconds):
+        """Add time to a phase"""
+        with self._lock:
+            self.phase_ms[phase] += seconds * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block: 'with metrics.phase('filter'):'"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def network_seconds(self):
+        """Time spent fetching so far, used to separate it from the parse time of a crawl method"""
+        with self._lock:
+            return (self.phase_ms['connect'] + self.phase_ms['download']) / 1000
+
+    def record_response(self, response, seconds, body_size=None):
+        """Record one HTTP response fetched in the given time (the first one sets http_status)"""
+        elapsed = response.elapsed.total_seconds() if response.elapsed else seconds
+        elapsed = min(elapsed, seconds)
+        if body_size is None:
+            body_size = len(response.content or b'')
+        with self._lock:
+            self.requests += 1
+            self.bytes += body_size
+            if self.http_status is None:
+                self.http_status = response.status_code
+            self.phase_ms['connect'] += elapsed * 1000
+            self.phase_ms['download'] += (seconds - elapsed) * 1000
+
+    def record_stream(self, body_size, seconds):
+        """Record the body of a streamed response once it has been read"""
+        with self._lock:
+            self.bytes += body_size
+            self.phase_ms['download'] += seconds * 1000
+
+    def as_row(self):
+        """Column values in the order of the crawl_metrics insert"""
+        total_ms = (time.perf_counter() - self._start) * 1000
+        return (
+            self.crawl_id, self.crawl_url, self.started_at, self.status, self.http_status,
+            self.pages, self.requests, self.bytes, self.jobs_found, self.jobs_matched,
+            self.jobs_new, self.jobs_removed,
+            *(round(self.phase_ms[phase], 1) for phase in PHASES),
+            round(total_ms, 1),
+        )
+
+    def save(self, db_path):
+        """Store the finished run in the crawl_metrics table"""
+        conn = connect(db_path)
+        try:
+            ensure_metrics_table(conn)
+            conn.execute('''
+                INSERT INTO crawl_metrics
+                (crawl_id, crawl_url, started_at, status, http_status, pages, requests, bytes,
+                 jobs_found, jobs_matched, jobs_new, jobs_removed,
+                 connect_ms, download_ms, parse_ms, filter_ms, diff_ms, total_ms)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', self.as_row())
+            conn.commit()
+        finally:
+            conn.close()
+
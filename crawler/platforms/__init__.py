@@ -0,0 +1,46 @@
+"""
+Crawl methods for job platforms shared by several companies (ATS backends).
+Each platform module provides crawl(crawler_instance, url, keywords, tenant),
+the tenants and their config are registered in url_mapping.PLATFORM_TENANTS.
+"""
+
+import importlib
+from urllib.parse import urljoin
+
+from ..filters import raw_postings
+
+
+def posting_link(tenant, base_url, href):
+    """
+    Link of a posting. crawl_results are keyed by link, so tenants with a 'link_prefix'
+    keep the links their own crawl method stored (prefix + href), otherwise the href
+    is resolved against base_url.
+    """
+    if 'link_prefix' in tenant:
+        return tenant['link_prefix'] + href
+    return urljoin(base_url, href)
+
+
+def get_platform_crawler(name, tenant):
+    """
+    Build the crawl method for one tenant of a platform.
+
+    Args:
+        name: Tenant name, used for the crawl method's name
+        tenant: Tenant config, 'platform' names the module in this package
+    """
+    platform = importlib.import_module(f'.{tenant["platform"]}', __name__)
+
+    def crawl_tenant(crawler_instance, url, keywords):
+        return platform.crawl(crawler_instance, url, keywords, tenant)
+
+    crawl_tenant.__name__ = f'crawl_{name}'
+    crawl_tenant.__qualname__ = crawl_tenant.__name__
+
+    ### Platforms can filter themselves (e.g. before loading detail pages)
+    if getattr(platform, 'filters_itself', lambda tenant: False)(tenant):
+        return crawl_tenant
+    return raw_postings(
+        check_location=tenant.get('check_location', True),
+        check_it_job=tenant.get('check_it_job', True),
+    )(crawl_tenant)
@@ -0,0 +1,60 @@
+"""
+Abacus job portals (<tenant>-jobs.abacuscity.ch/de/jobportal)
+
+Tenant config:
+    row_tag: Tag of the job rows ('tr' or 'div')
+    row_class: Text contained in the class attribute of the job rows
+    link_class: Class of the posting link in a row (optional, the first link otherwise)
+    company: Fixed company name, or
+    company_column: Class of the job table column holding the company
+    location: Fixed location, or
+    location_column: Class of the job table column holding the location
+    link_prefix: Prefix the posting hrefs are appended to (optional, see posting_link)
+"""
+
+import re
+
+from . import posting_link
+
+
+def _column(job, column_class):
+    element = job.find('span', class_=column_class)
+    return element.text.strip() if element else ''
+
+
+def crawl(crawler_instance, url, keywords, tenant):
+    """Crawl an abacuscity job portal"""
+    print(f"Crawling abacuscity URL: {url}")
+
+    try:
+        response = crawler_instance.fetch(url)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        ### The portals differ in their row markup, the row class is matched as a substring
+        row_class = re.compile(re.escape(tenant['row_class']))
+        soup = crawler_instance.parse_html(response.content, tenant['row_tag'], class_=row_class)
+        job_rows = soup.find_all(tenant['row_tag'], class_=row_class)
+        print(f"Found {len(job_rows)} job rows")
+
+        content = []
+        for job in job_rows:
+            try:
+                link_class = tenant.get('link_class')
+                link_element = job.find('a', class_=link_class) if link_class else job.find('a')
+                location = tenant.get('location') or _column(job, tenant['location_column'])
+                company = tenant.get('company') or _column(job, tenant['company_column'])
+                content.append({
+                    'title': link_element.text.strip(),
+                    'link': posting_link(tenant, url, link_element['href']),
+                    'location': location,
+                    'company': company,
+                })
+            except Exception as e:
+                print(f"Error during extraction: {e}")
+
+        print(f"Found {len(content)} jobs")
+        return content, None
+
+    except Exception as e:
+        print(f"Error during crawl: {e}")
+        return [], None
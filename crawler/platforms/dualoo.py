@@ -0,0 +1,43 @@
+"""
+dualoo job portals (jobs.dualoo.com/portal/<portal id>)
+
+Tenant config:
+    company: Company name of the postings
+    link_prefix: Prefix the posting hrefs are appended to (optional, see posting_link)
+"""
+
+from . import posting_link
+
+
+def crawl(crawler_instance, url, keywords, tenant):
+    """Crawl a dualoo portal page"""
+    print(f"Crawling dualoo ({tenant['company']}) URL: {url}")
+
+    try:
+        response = crawler_instance.fetch(url)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        soup = crawler_instance.parse_html(response.content, 'a', class_='row')
+
+        job_rows = [row for row in soup.find_all('a', class_='row') if row.find('span', class_='jobName')]
+        print(f"Found {len(job_rows)} job listings")
+
+        content = []
+        for job in job_rows:
+            try:
+                location_element = job.find('span', class_='cityName')
+                content.append({
+                    'title': job.find('span', class_='jobName').text.strip(),
+                    'link': posting_link(tenant, url, job['href']),
+                    'location': location_element.text.strip() if location_element else '',
+                    'company': tenant['company'],
+                })
+            except Exception as e:
+                print(f"Error during extraction: {e}")
+
+        print(f"Found {len(content)} jobs")
+        return content, None
+
+    except Exception as e:
+        print(f"Error during crawl: {e}")
+        return [], None
@@ -0,0 +1,59 @@
+"""
+jobchannel.ch job portals (<tenant>.jobportal.jobchannel.ch/search)
+
+Tenant config (company and location come from the listing):
+    link_prefix: Prefix the posting hrefs are appended to (optional, see posting_link)
+"""
+
+from urllib.parse import urljoin
+
+from . import posting_link
+
+
+def _text(row, name, **attrs):
+    element = row.find(name, **attrs)
+    return element.text.strip() if element else 'Not specified'
+
+
+def crawl(crawler_instance, url, keywords, tenant):
+    """Crawl one page of a jobchannel portal, returns the URL of the next page"""
+    print(f"Crawling jobchannel URL: {url}")
+
+    try:
+        response = crawler_instance.fetch(url)
+        soup = crawler_instance.parse_html(response.content)
+
+        job_rows = soup.find_all('li', class_='item')
+        print(f"Found {len(job_rows)} job listings")
+
+        content = []
+        for row in job_rows:
+            try:
+                link_element = row.find('a', class_='title')
+                content.append({
+                    'title': _text(row, 'span', class_='jobtitle'),
+                    'link': posting_link(tenant, url, link_element['href']) if link_element else url,
+                    'company': _text(row, 'a', title='Alle Jobs dieser Firma anzeigen...'),
+                    'location': _text(row, 'span', class_='location'),
+                })
+            except Exception as e:
+                print(f"Error during extraction: {e}")
+
+        ### search for the next page
+        next_url = None
+        for element in soup.find_all('a', class_='btn btn-sm btn-secondary'):
+            if "Nächste Seite" in element.text and element.get('href'):
+                next_url = urljoin(url, element['href'])
+                break
+
+        if next_url:
+            print(f"Next page found: {next_url}")
+        else:
+            print("No next page found")
+
+        print(f"Found {len(content)} jobs")
+        return content, next_url
+
+    except Exception as e:
+        print(f"Error during crawl: {e}")
+        return [], None
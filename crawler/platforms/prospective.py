@@ -0,0 +1,82 @@
+"""
+prospective.ch (ohws.prospective.ch) - JSON medium API and HTML career centers
+
+Tenant config:
+    company: Company name of the postings
+    location: Fixed location for all postings (optional)
+    location_attribute: Key in the job's 'attributes' holding the location (API only)
+    link_field: Key of the job holding its link (API only, default: links.directlink)
+"""
+
+
+def crawl(crawler_instance, url, keywords, tenant):
+    """Crawl a prospective.ch medium API or career center page"""
+    print(f"Crawling prospective.ch ({tenant['company']}) URL: {url}")
+
+    try:
+        if '/careercenter/' in url:
+            content = _crawl_careercenter(crawler_instance, url, tenant)
+        else:
+            content = _crawl_api(crawler_instance, url, tenant)
+
+        print(f"Found {len(content)} jobs")
+        return content, None
+
+    except Exception as e:
+        print(f"Error during crawl: {e}")
+        return [], None
+
+
+def _crawl_api(crawler_instance, url, tenant):
+    """Read the job list of the medium API, streamed item by item (the API is queried with limit=999)"""
+    content = []
+    job_count = 0
+    for job in crawler_instance.fetch_json_items(url, 'jobs'):
+        job_count += 1
+        try:
+            if 'link_field' in tenant:
+                link = job.get(tenant['link_field'], '')
+            else:
+                link = (job.get('links') or {}).get('directlink') or job.get('link', '')
+            location = tenant.get('location')
+            if location is None:
+                location = (job.get('attributes', {}).get(tenant['location_attribute']) or [''])[0]
+
+            content.append({
+                'title': job.get('title', ''),
+                'link': link,
+                'location': location,
+                'company': tenant['company'],
+            })
+        except Exception as e:
+            print(f"Error during extraction: {e}")
+    print(f"Found {job_count} job listings")
+    return content
+
+
+def _crawl_careercenter(crawler_instance, url, tenant):
+    """Parse the job list of an HTML career center"""
+    response = crawler_instance.fetch(url)
+    response.raise_for_status()
+    soup = crawler_instance.parse_html(response.content, 'a', class_='job')
+
+    job_rows = soup.find_all('a', class_='job')
+    print(f"Found {len(job_rows)} job listings")
+
+    content = []
+    for job in job_rows:
+        try:
+            title_element = job.find('div', class_='jobTitle')
+            title = title_element.find('h2').text.strip() if title_element else ''
+            location_element = job.find('div', class_='jobArbeitsOrt')
+            location = tenant.get('location') or location_element.text.strip()
+
+            content.append({
+                'title': title,
+                'link': job['href'],
+                'location': location,
+                'company': tenant['company'],
+            })
+        except Exception as e:
+            print(f"Error during extraction: {e}")
+    return content
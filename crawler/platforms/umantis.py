@@ -0,0 +1,101 @@
+"""
+Abacus Umantis recruiting apps (recruitingapp-<id>.umantis.com, jobs.fhgr.ch)
+
+Tenant config:
+    company: Company name of the postings
+    page_param: Query parameter of the paged job table (e.g. 'tc1152481'), pages are 'p1', 'p2', ...
+    detail_location: Only keep jobs whose detail page names this location. The detail
+        pages are only loaded for postings that pass the keyword and IT job filters.
+    link_prefix: Prefix the posting hrefs are appended to (optional, see posting_link)
+"""
+
+import re
+from urllib.parse import urlsplit
+
+from . import posting_link
+
+LOCATION_CLASS = 'tableaslist_subtitle tableaslist_element_1152495'
+
+
+def filters_itself(tenant):
+    """Tenants with a detail page location are filtered before the detail pages are loaded"""
+    return bool(tenant.get('detail_location'))
+
+
+def crawl(crawler_instance, url, keywords, tenant):
+    """Crawl one page of an Umantis job table, returns the URL of the next page for paged tenants"""
+    print(f"Crawling Umantis ({tenant['company']}) URL: {url}")
+
+    try:
+        response = crawler_instance.fetch(url)
+        response.raise_for_status()
+
+        page_param = tenant.get('page_param')
+        if page_param and f'{page_param}=p1' in response.url and f'{page_param}=p1' not in url:
+            print("Redirected back to page 1. Stopping the crawl.")
+            return [], None
+
+        soup = crawler_instance.parse_html(response.content, 'div', class_='tableaslist_cell')
+        job_rows = soup.find_all('div', class_='tableaslist_cell')
+        print(f"Found {len(job_rows)} job listings")
+
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}/'
+        content = []
+        for row in job_rows:
+            try:
+                title_element = row.find('a', class_='HSTableLinkSubTitle')
+                location_element = row.find('span', class_=LOCATION_CLASS)
+                content.append({
+                    'title': (title_element.get('aria-label') or title_element.text).strip(),
+                    'link': posting_link(tenant, origin, title_element['href']),
+                    'company': tenant['company'],
+                    'location': location_element.text.replace('|', '').strip() if location_element else 'Not specified',
+                })
+            except Exception as e:
+                print(f"Error during extraction: {e}")
+
+        if tenant.get('detail_location'):
+            content = _keep_detail_location(crawler_instance, content, keywords, tenant['detail_location'])
+
+        next_url = None
+        if page_param and job_rows:
+            page_match = re.search(rf'{page_param}=p(\d+)', url)
+            if page_match:
+                next_page = int(page_match.group(1)) + 1
+                next_url = url[:page_match.start()] + f'{page_param}=p{next_page}' + url[page_match.end():]
+                print(f"Moving to page {next_page}")
+
+        print(f"Found {len(content)} jobs")
+        return content, next_url
+
+    except Exception as e:
+        print(f"Error during crawl: {e}")
+        return [], None
+
+
+def _keep_detail_location(crawler_instance, postings, keywords, wanted_location):
+    """Filter the postings, then load the detail pages of the matches and keep those at the wanted location"""
+    content = []
+    for posting in crawler_instance.filter_jobs(postings, keywords, check_location=False):
+        try:
+            response = crawler_instance.fetch(posting['link'])
+            response.raise_for_status()
+            job_soup = crawler_instance.parse_html(response.content, 'b')
+
+            ### The location is in a <b> tag on the detail page
+            location = None
+            for b_elem in job_soup.find_all('b'):
+                text = b_elem.text.strip()
+                if 'Standort' in text or wanted_location in text:
+                    location = text
+                    if wanted_location in text:
+                        break
+
+            if location and wanted_location in location:
+                content.append({**posting, 'location': location})
+            else:
+                print(f"Skipping: not in {wanted_location} - {posting['title']}")
+        except Exception as e:
+            print(f"Error loading job details: {e}")
+    return content
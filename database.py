@@ -1,9 +1,11 @@
+import math
 import sqlite3
 import logging
 import os
 from crawls_data import CRAWLS_DATA
 from localities_data import LOCALITIES_DATA
 from database_config import get_db_path
+from storage import connect
 from datetime import datetime, timedelta
 
 
@@ -11,6 +13,83 @@ from datetime import datetime, timedelta
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (SQLite has no percentile function)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return round(ordered[rank - 1])
+
+
+def _add_indexes(cursor):
+    ### Crawl diff: rows of one crawl run (WHERE crawl_id = ? AND crawl_url = ?) and their links
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_results_crawl_url ON crawl_results (crawl_id, crawl_url, link)")
+    ### Cleanup of notified removals (WHERE removal_date < ? AND notified = 1)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_removed_jobs_notified ON removed_jobs (notified, removal_date)")
+    ### Keywords joined to their crawl, the index alone answers the join
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_keywords_crawl ON keywords (crawl_id, keyword)")
+    ### Last failure per crawl on the dashboard and the failed_crawls cleanup
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failed_crawls_crawl ON failed_crawls (crawl_id, failure_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_failed_crawls_date ON failed_crawls (failure_date)")
+    ### Recent runs for the expected crawl durations and the performance table
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_metrics_crawl ON crawl_metrics (crawl_id, started_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_metrics_started ON crawl_metrics (started_at)")
+
+
+def _add_day_columns(cursor):
+    ### DATE(crawl_date) = ? can't use an index. The ISO day ('YYYY-MM-DD') is derived
+    ### from the timestamp, so the writers don't change, and indexed for equality and range scans.
+    cursor.execute('''
+        ALTER TABLE crawl_results
+        ADD COLUMN crawl_day TEXT GENERATED ALWAYS AS (substr(crawl_date, 1, 10)) VIRTUAL
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crawl_results_day ON crawl_results (crawl_day)")
+    cursor.execute('''
+        ALTER TABLE removed_jobs
+        ADD COLUMN removal_day TEXT GENERATED ALWAYS AS (substr(removal_date, 1, 10)) VIRTUAL
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_removed_jobs_day ON removed_jobs (removal_day)")
+
+
+def _key_validators_by_crawl(cursor):
+    ### Validators were keyed by URL only, so crawls sharing a start URL got each other's 304s.
+    ### They are only a cache, the next crawl of every URL stores them again.
+    cursor.execute("DROP TABLE IF EXISTS http_cache")
+    cursor.execute('''
+        CREATE TABLE http_cache (
+            crawl_id INTEGER,
+            url TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at DATETIME,
+            PRIMARY KEY (crawl_id, url)
+        )
+    ''')
+
+
+def _unique_crawl_result_links(cursor):
+    ### One row per job and crawl, the crawl diff inserts against this index.
+    ### Duplicates stored before it existed are dropped, the oldest row of each job is kept.
+    cursor.execute('''
+        DELETE FROM crawl_results
+        WHERE id NOT IN (SELECT MIN(id) FROM crawl_results GROUP BY crawl_id, link)
+    ''')
+    logger.info(f"Removed {cursor.rowcount} duplicate crawl_results rows")
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_crawl_results_crawl_link ON crawl_results (crawl_id, link)")
+
+
+### Schema migrations applied on top of create_tables, in order. PRAGMA user_version
+### holds the number of migrations a database has been through; only append to this list.
+MIGRATIONS = [
+    ("Indexes for the crawl diff, cleanup, keyword join and crawl metrics", _add_indexes),
+    ("Indexed ISO day columns for crawl_results and removed_jobs", _add_day_columns),
+    ("Conditional GET validators keyed by crawl and URL", _key_validators_by_crawl),
+    ("Unique crawl_results link per crawl", _unique_crawl_result_links),
+]
+
+
 class Database:
     def __init__(self):
         """Initalize Database with path from configuration"""
@@ -18,8 +97,8 @@ class Database:
         self.ensure_db_directory()
         
     def _get_connection(self):
-        """Private method to create a database connection"""
-        return sqlite3.connect(self.db_file)
+        """Private method to borrow a connection from the shared pool"""
+        return connect(self.db_file)
         
     def get_connection(self):
         """Public method to get a database connection"""
@@ -45,11 +124,12 @@ class Database:
         """Initialize the database with tables and populate localities"""
         try:
             print(f"Initializing database at {self.db_file}")
-            conn =sqlite3.connect(self.db_file)
+            conn = connect(self.db_file)
             cursor = conn.cursor()
             
             ### Check if the localities table exists and is empty
             self.create_tables(cursor)
+            self.apply_migrations(conn)
             cursor.execute("SELECT COUNT(*) FROM localities")
             locals_count = cursor.fetchone()[0]
             
@@ -170,6 +250,44 @@ class Database:
         VALUES ('email_time', '15:30')            
         ''')
         
+        ### Version counter of the localities table, bumped on every change so
+        ### crawlers only rebuild their shared locality index when it changed
+        cursor.execute('''
+        INSERT OR IGNORE INTO settings (name, value)
+        VALUES ('localities_version', '0')
+        ''')
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS localities_version_{event.lower()}
+            AFTER {event} ON localities
+            BEGIN
+                UPDATE settings SET value = CAST(value AS INTEGER) + 1 WHERE name = 'localities_version';
+            END
+            ''')
+        
+        ### Create http_cache table (conditional GET validators per crawl and start URL)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS http_cache (
+            crawl_id INTEGER,
+            url TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at DATETIME,
+            PRIMARY KEY (crawl_id, url)
+        )
+        ''')
+        
+        ### Create content_digests table (start page digest per crawl)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS content_digests (
+            crawl_id INTEGER,
+            url TEXT,
+            digest TEXT,
+            updated_at DATETIME,
+            PRIMARY KEY (crawl_id, url)
+        )
+        ''')
+        
         ### Create failed_crawls table
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS failed_crawls (
@@ -184,8 +302,65 @@ class Database:
             FOREIGN KEY (crawl_id) REFERENCES crawls(id)
         )
         ''')
+        
+        ### Create schedule_changes table (change feed of crawls and settings for the scheduler)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schedule_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity TEXT,
+            entity_id TEXT,
+            action TEXT,
+            changed_at DATETIME
+        )
+        ''')
+        
+        ### Create crawl_metrics table (phase timings and counts per crawl run)
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS crawl_metrics (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            crawl_id INTEGER,
+            crawl_url TEXT,
+            started_at DATETIME,
+            status TEXT,
+            http_status INTEGER,
+            pages INTEGER,
+            requests INTEGER,
+            bytes INTEGER,
+            jobs_found INTEGER,
+            jobs_matched INTEGER,
+            jobs_new INTEGER,
+            jobs_removed INTEGER,
+            connect_ms REAL,
+            download_ms REAL,
+            parse_ms REAL,
+            filter_ms REAL,
+            diff_ms REAL,
+            total_ms REAL
+        )
+        ''')
+
+
+    def apply_migrations(self, conn):
+        """Apply the schema migrations the database hasn't been through yet, one transaction each"""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA user_version")
+        version = cursor.fetchone()[0]
+
+        for number, (description, migration) in enumerate(MIGRATIONS[version:], start=version + 1):
+            ### DDL doesn't open a transaction implicitly, so each migration opens its own
+            conn.commit()
+            cursor.execute("BEGIN")
+            try:
+                migration(cursor)
+                cursor.execute(f"PRAGMA user_version = {number}")
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Schema migration {number} ({description}) failed: {e}")
+                raise
+            logger.info(f"Applied schema migration {number}: {description}")
+
 
-    
     def populate_localities(self, cursor):
         """Populate the localities initial with data"""
         try:
@@ -244,8 +419,24 @@ class Database:
             raise
     
     
+    def _record_change(self, cursor, entity, entity_id, action):
+        """Publish a change of a crawl or setting to the scheduler, in the writer's transaction"""
+        cursor.execute('''
+            INSERT INTO schedule_changes (entity, entity_id, action, changed_at)
+            VALUES (?, ?, ?, ?)
+        ''', (entity, str(entity_id), action, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+    
+    
+    def _forget_http_cache(self, cursor, crawl_id):
+        """Drop the conditional GET validators and start page digests of a crawl"""
+        for table in ('http_cache', 'content_digests'):
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,))
+            if cursor.fetchone():
+                cursor.execute(f"DELETE FROM {table} WHERE crawl_id = ?", (crawl_id,))
+    
+    
     def add_crawl(self, title, url, scheduleTime, scheduleDay, keywords):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         
@@ -268,6 +459,9 @@ class Database:
                 VALUES (?, ?)
                 ''', (crawl_id, keyword))
             
+            ### A new crawl never starts from validators stored under its id
+            self._forget_http_cache(cursor, crawl_id)
+            self._record_change(cursor, 'crawl', crawl_id, 'add')
             conn.commit()
             return {"status": "success", "id": crawl_id}
         except Exception as e:
@@ -278,7 +472,7 @@ class Database:
         
     
     def get_all_crawls(self):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         try:
@@ -305,13 +499,15 @@ class Database:
     
     
     def delete_crawl(self, crawl_id):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         try:
             ### Delete keywords first (due to foreign key)
             cursor.execute("DELETE FROM keywords WHERE crawl_id = ?", (crawl_id,))
+            self._forget_http_cache(cursor, crawl_id)
             cursor.execute("DELETE FROM crawls WHERE id = ?", (crawl_id,))
+            self._record_change(cursor, 'crawl', crawl_id, 'delete')
         
             conn.commit()
             return {"status": "success"}
@@ -323,10 +519,13 @@ class Database:
     
     
     def update_crawl(self, crawl_id, name, url, scheduleTime, scheduleDay, keywords):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()     
         
         try:
+            ### Keywords or URL may change, so the cached validators no longer apply
+            self._forget_http_cache(cursor, crawl_id)
+            
             ### Update Crawl details
             cursor.execute('''
             UPDATE crawls
@@ -344,6 +543,7 @@ class Database:
                 VALUES (?, ?)
                 ''', (crawl_id, keyword))
             
+            self._record_change(cursor, 'crawl', crawl_id, 'update')
             conn.commit()
             return {"status": "success"}
         except Exception as e:
@@ -355,7 +555,7 @@ class Database:
     
     def add_email(self, email):
         """Add an email to the database"""
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         try:
@@ -373,7 +573,7 @@ class Database:
             
             
     def get_email(self):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor() 
         
         try:
@@ -385,7 +585,7 @@ class Database:
     
     
     def delete_email(self, email_id):
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         try:
@@ -401,7 +601,7 @@ class Database:
     def get_email_settings(self):
         """Function to get the Email settings from the database"""
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = connect(self.db_file)
             cursor = conn.cursor()
             
             ### check if the table settings exists
@@ -445,7 +645,7 @@ class Database:
     def update_email_settings(self, email_time):
         """Function to update the Email settings in the database"""
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = connect(self.db_file)
             cursor = conn.cursor()
             
             ### check if the table settings exists
@@ -473,6 +673,7 @@ class Database:
                 ### Insert new email_time
                 cursor.execute("INSERT INTO settings (name, value) VALUES ('email_time', ?)", (email_time,))
             
+            self._record_change(cursor, 'setting', 'email_time', 'update')
             conn.commit()
             
             return {
@@ -493,7 +694,7 @@ class Database:
     def get_dashboard_stats(self):
         """Get statistics for the dashboard"""
         print("=== DEBUG: database.get_dashboard_stats() gestartet ===")
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
 
         try:
@@ -505,11 +706,11 @@ class Database:
             stats['active_jobs'] = cursor.fetchone()[0]
 
             # New jobs today
-            cursor.execute("SELECT COUNT(*) FROM crawl_results WHERE DATE(crawl_date) = ?", (today,))
+            cursor.execute("SELECT COUNT(*) FROM crawl_results WHERE crawl_day = ?", (today,))
             stats['new_jobs_today'] = cursor.fetchone()[0]
 
             # Removed jobs today
-            cursor.execute("SELECT COUNT(*) FROM removed_jobs WHERE DATE(removal_date) = ?", (today,))
+            cursor.execute("SELECT COUNT(*) FROM removed_jobs WHERE removal_day = ?", (today,))
             stats['removed_jobs_today'] = cursor.fetchone()[0]
 
             # Active crawls count
@@ -542,23 +743,23 @@ class Database:
             """)
             stats['recent_crawls'] = cursor.fetchall()
 
-            # Job trends for the last 7 days
-            dates = []
-            new_jobs = []
-            removed_jobs = []
-
-            for i in range(29, -1, -1):
-                date = (datetime.now() - timedelta(days=i))
-                date_str = date.strftime('%Y-%m-%d')
-                dates.append(date.strftime('%d.%m'))
-
-                # New jobs for this date
-                cursor.execute("SELECT COUNT(*) FROM crawl_results WHERE DATE(crawl_date) = ?", (date_str,))
-                new_jobs.append(cursor.fetchone()[0])
+            # Job trends for the last 30 days, one range scan per table
+            days = [datetime.now() - timedelta(days=i) for i in range(29, -1, -1)]
+            first_day = days[0].strftime('%Y-%m-%d')
+            cursor.execute("""
+                SELECT crawl_day, COUNT(*) FROM crawl_results
+                WHERE crawl_day >= ? GROUP BY crawl_day
+            """, (first_day,))
+            new_per_day = dict(cursor.fetchall())
+            cursor.execute("""
+                SELECT removal_day, COUNT(*) FROM removed_jobs
+                WHERE removal_day >= ? GROUP BY removal_day
+            """, (first_day,))
+            removed_per_day = dict(cursor.fetchall())
 
-                # Removed jobs for this date
-                cursor.execute("SELECT COUNT(*) FROM removed_jobs WHERE DATE(removal_date) = ?", (date_str,))
-                removed_jobs.append(cursor.fetchone()[0])
+            dates = [day.strftime('%d.%m') for day in days]
+            new_jobs = [new_per_day.get(day.strftime('%Y-%m-%d'), 0) for day in days]
+            removed_jobs = [removed_per_day.get(day.strftime('%Y-%m-%d'), 0) for day in days]
 
             stats['job_trends'] = {
                 'dates': dates,
@@ -566,6 +767,9 @@ class Database:
                 'removed_jobs': removed_jobs
             }
 
+            # Crawl durations per website (last 30 days)
+            stats['crawl_performance'] = self.get_crawl_performance(cursor)
+
             return stats
 
         except Exception as e:
@@ -580,15 +784,56 @@ class Database:
                 'active_crawls': 0,
                 'jobs_per_website': [],
                 'recent_crawls': [],
-                'job_trends': {'dates': [], 'new_jobs': [], 'removed_jobs': []}
+                'job_trends': {'dates': [], 'new_jobs': [], 'removed_jobs': []},
+                'crawl_performance': []
             }
         finally:
             conn.close()
             
+    
+    def get_crawl_performance(self, cursor, days=30):
+        """
+        Per website durations of the crawl runs in the last days: runs, average and p95 of
+        the total time, p95 of the last 7 days (trend), average phase times and bytes
+        """
+        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+        week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d %H:%M:%S')
+        cursor.execute('''
+            SELECT crawl_url, started_at, total_ms, connect_ms + download_ms, parse_ms,
+                   filter_ms, diff_ms, bytes
+            FROM crawl_metrics
+            WHERE started_at >= ? AND status != 'failed'
+            ORDER BY started_at
+        ''', (since,))
+
+        runs_per_site = {}
+        for row in cursor.fetchall():
+            runs_per_site.setdefault(row[0], []).append(row)
+
+        performance = []
+        for url, runs in runs_per_site.items():
+            totals = [run[2] for run in runs]
+            recent = [run[2] for run in runs if run[1] >= week_ago]
+            averages = [round(sum(run[i] or 0 for run in runs) / len(runs)) for i in range(3, 8)]
+            performance.append({
+                'website': url,
+                'runs': len(runs),
+                'avg_ms': round(sum(totals) / len(totals)),
+                'p95_ms': _percentile(totals, 0.95),
+                'p95_last_7_days_ms': _percentile(recent, 0.95),
+                'network_ms': averages[0],
+                'parse_ms': averages[1],
+                'filter_ms': averages[2],
+                'diff_ms': averages[3],
+                'avg_bytes': averages[4],
+            })
+        performance.sort(key=lambda site: site['p95_ms'], reverse=True)
+        return performance
+            
             
     def add_failed_crawl(self, crawl_id, crawl_url, error_message, error_type, traceback_str):
         """Add a failed crawl to the database"""
-        conn = sqlite3.connect(self.db_file)
+        conn = connect(self.db_file)
         cursor = conn.cursor()
         
         try:
@@ -618,7 +863,7 @@ class Database:
     def close(self):
         """Properly close the connection to the database"""
         try:
-            conn = sqlite3.connect(self.db_file)
+            conn = connect(self.db_file)
             conn.close()
             logger.info('Database connection closed')
         except Exception as e:
@@ -3,7 +3,7 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 import pytz
-import sqlite3
+from storage import connect
 import logging
 import os
 from dotenv import load_dotenv
@@ -72,10 +72,11 @@ class EmailNotifier:
         
     
     def _get_connection(self):
-        """Get or create a thread-local database connection"""
-        if not hasattr(self.thread_local, 'connection'):
-            self.thread_local.connection = sqlite3.connect(self.db_path)
-        return self.thread_local.connection
+        """Get the thread-local connection, borrowing a new one from the pool once it was closed"""
+        connection = getattr(self.thread_local, 'connection', None)
+        if connection is None or connection.closed:
+            connection = self.thread_local.connection = connect(self.db_path)
+        return connection
     
     def _close_connection(self):
         """Close the thread-local connection if it exists"""
@@ -97,7 +98,7 @@ class EmailNotifier:
                 SELECT cr.title, cr.company, cr.location, cr.link, c.title as crawl_name
                 FROM crawl_results cr
                 JOIN crawls c ON cr.crawl_id = c.id
-                WHERE DATE(cr.crawl_date) = ?
+                WHERE cr.crawl_day = ?
                 ORDER BY cr.crawl_date DESC
             """, (today,))
             
@@ -115,7 +116,7 @@ class EmailNotifier:
     
     def get_removed_jobs(self, mark_as_notified=False):
         """Get jobs that have been removed and optionally mark them as notified"""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         cursor = conn.cursor()
 
         try:
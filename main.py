@@ -253,7 +253,8 @@ def get_dashboard_stats():
             'active_crawls': 0,
             'jobs_per_website': [],
             'recent_crawls': [],
-            'job_trends': {'dates': [], 'new_jobs': [], 'removed_jobs': []}
+            'job_trends': {'dates': [], 'new_jobs': [], 'removed_jobs': []},
+            'crawl_performance': []
         }
     
 def start_gui():
@@ -2,12 +2,15 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime, timedelta
 from pytz import timezone
-import sqlite3
-from crawler import Crawler
+from storage import connect
+from crawler import Crawler, UNCHANGED
 import logging
 from email_notification import send_daily_email_report, send_failure_email
 from database_config import get_db_path
+from crawl_executor import CrawlQueue, HTTP, BROWSER, DEFAULT_HTTP_DURATION, DEFAULT_BROWSER_DURATION
+from crawler.url_mapping import crawler_uses_browser
 import threading
+import time
 
 ### Set up logging
 logging.basicConfig(
@@ -16,9 +19,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger('Scheduler')
 
+### 'queue': due crawls go through the deadline-aware crawl queue
+### 'cron': one APScheduler cron job per crawl at its scheduleTime
+SCHEDULING_MODE = 'queue'
+### Crawls are released early enough to finish this long before the email report
+DEADLINE_MARGIN = timedelta(minutes=10)
+### Runs averaged for the expected duration of a crawl
+EXPECTED_DURATION_RUNS = 5
+
 
 class CrawlerScheduler:
-    def __init__(self):
+    def __init__(self, scheduling_mode=SCHEDULING_MODE):
         self.db_path = get_db_path()
         self.thread_local = threading.local()
         self.scheduler = BackgroundScheduler()
@@ -27,14 +38,23 @@ class CrawlerScheduler:
         self.active_crawls = set()
         self.today_crawls_completed = set()
         self.email_task_id = 'daily_email_report'
+        self.scheduling_mode = scheduling_mode
+        self.crawl_queue = CrawlQueue(self.execute_crawl)
+        self.enqueued_on = {}
+        self.crawls = {}
+        ### The change feed and the queue feeder run on different executor threads
+        self.crawls_lock = threading.Lock()
+        self.email_time = None
+        self.last_change_seq = 0
         
         
     
     def _get_connection(self):
-        """Get or create a thread-local database connection"""
-        if not hasattr(self.thread_local, 'connection'):
-            self.thread_local.connection = sqlite3.connect(self.db_path)
-        return self.thread_local.connection
+        """Get the thread-local connection, borrowing a new one from the pool once it was closed"""
+        connection = getattr(self.thread_local, 'connection', None)
+        if connection is None or connection.closed:
+            connection = self.thread_local.connection = connect(self.db_path)
+        return connection
 
     def _close_connection(self):
         """Close the thread-local connection if it exists"""
@@ -70,25 +90,30 @@ class CrawlerScheduler:
     def start(self):
         """Start the scheduler and load all crawls from database"""
         try:
-            ### Checks the settins 
+            ### Apply changed crawls and settings from the database change feed every minute
             self.scheduler.add_job(
-                self.check_settings,
+                self.apply_schedule_changes,
                 'interval',
                 minutes=1,
-                id='settings_checker'
+                id='schedule_change_feed'
             )
             
-            ### Check crawls every minute for updates
-            self.scheduler.add_job(
-                self.update_crawl_schedules,
-                'interval',
-                minutes=1,
-                id='crawl_schedule_updater'
-            )
+            ### Changes published from now on are applied by the change feed
+            self.last_change_seq = self.get_last_change_seq()
             
             ### Get the email time from database and plan the job
             self.schedule_email_task()
                         
+            if self.scheduling_mode == 'queue':
+                self.crawl_queue.start()
+                ### Move due crawls onto the crawl queue every minute
+                self.scheduler.add_job(
+                    self.enqueue_due_crawls,
+                    'interval',
+                    minutes=1,
+                    id='queue_feeder'
+                )
+            
             ### Load all crawls from database when starting
             self.update_crawl_schedules()
             
@@ -104,6 +129,7 @@ class CrawlerScheduler:
         """Function to plan the daily email job based on database"""
         try:
             email_time = self.get_email_time_from_db()
+            self.email_time = email_time
             
             ### Parse the email time
             hour, minute = map(int, email_time.split(':'))
@@ -179,100 +205,262 @@ class CrawlerScheduler:
             if self.scheduler.running:
                 self.scheduler.shutdown()
                 logger.info('Scheduler stopped successfully')
+            self.crawl_queue.stop()
         except Exception as e:
             logger.error(f'Error stopping scheduler: {e}')
             
     
     
     def update_crawl_schedules(self):
-        """Check database for crawls and update scheduler accordingly"""
+        """Load all crawls from the database and schedule them (full reload at start)"""
+        try:
+            crawls = self._load_crawls()
+        except Exception as e:
+            print(f'Error updating crawl schedules: {e}')
+            return
+        with self.crawls_lock:
+            self.crawls = crawls
+        
+        if self.scheduling_mode == 'queue':
+            ### Crawls that already ran today (before a restart) are not run again
+            today = datetime.now(self.timezone).date()
+            for crawl_id in self.get_crawls_run_on(today):
+                self.enqueued_on[crawl_id] = today
+            self.enqueue_due_crawls()
+            return
+        
+        ### Get currently scheduled job IDs
+        scheduled_tasks = {job.id for job in self.scheduler.get_jobs() if job.id.startswith('crawl_')}
+        for crawl_id in self.crawls:
+            self._schedule_crawl_job(crawl_id)
+            scheduled_tasks.discard(f'crawl_{crawl_id}')
+        
+        for job_id in scheduled_tasks:
+            self.scheduler.remove_job(job_id)
+    
+    
+    def _load_crawls(self, crawl_ids=None):
+        """Crawls with their keywords from the database: crawl_id -> (title, url, scheduleTime, scheduleDay, keywords)"""
         try:
             conn = self._get_connection()
             cursor = conn.cursor()
             
-            ### Get all crawls with their keywords
-            cursor.execute("""
+            where = ''
+            params = ()
+            if crawl_ids is not None:
+                params = tuple(crawl_ids)
+                where = f"WHERE c.id IN ({','.join('?' * len(params))})"
+            
+            ### Get the crawls with their keywords
+            cursor.execute(f"""
                 SELECT c.id, c.title, c.url, c.scheduleTime, c.scheduleDay, 
                        GROUP_CONCAT(k.keyword) as keywords
                 FROM crawls c
                 LEFT JOIN keywords k ON c.id = k.crawl_id
+                {where}
                 GROUP BY c.id
-            """)
-            crawls = cursor.fetchall()
-            
-            ### Get currently scheduled job IDs
-            system_tasks = {'crawl_schedule_updater', 'settings_checker', 'daily_email_report', 'reset_daily_tracking'}
-            scheduled_tasks = {job.id for job in self.scheduler.get_jobs() if job.id not in system_tasks and job.id.startswith('crawl_')}
+            """, params)
             
-            for crawl in crawls:
-                crawl_id, title, url, scheduleTime, scheduleDay, keywords = crawl
-                task_id = f'crawl_{crawl_id}'
-                
-                ### Parse schedule time
-                hour, minute = map(int, scheduleTime.split(':')) 
-                days_list = scheduleDay.split(',')
+            crawls = {}
+            for crawl_id, title, url, scheduleTime, scheduleDay, keywords in cursor.fetchall():
                 keywords_list = keywords.split(',') if keywords else []
-                
-                ### Create cron trigger
-                trigger = CronTrigger(
-                    day_of_week=','.join(days_list),
-                    hour=hour,
-                    minute=minute,
-                    timezone=self.timezone
-                )
-
-                ### Add or update job
-                if task_id in scheduled_tasks:
-                    self.scheduler.reschedule_job(
-                        task_id, 
-                        trigger=trigger
-                    )
-                    scheduled_tasks.remove(task_id)
-                else:
-                    self.scheduler.add_job(
-                        self.execute_crawl,
-                        trigger=trigger,
-                        args=[crawl_id, url, keywords_list],
-                        id=task_id,
-                        name=title
-                    )
-            
-            for job_id in scheduled_tasks:
-                self.scheduler.remove_job(job_id)
-                
-            conn.close()
-            
+                crawls[crawl_id] = (title, url, scheduleTime, scheduleDay, keywords_list)
+            return crawls
+        finally:
+            self._close_connection()
+    
+    
+    def _schedule_crawl_job(self, crawl_id):
+        """Add or replace the cron job of a crawl (cron scheduling mode)"""
+        title, url, scheduleTime, scheduleDay, keywords_list = self.crawls[crawl_id]
+        
+        ### Parse schedule time
+        hour, minute = map(int, scheduleTime.split(':')) 
+        days_list = scheduleDay.split(',')
+        
+        ### Create cron trigger
+        trigger = CronTrigger(
+            day_of_week=','.join(days_list),
+            hour=hour,
+            minute=minute,
+            timezone=self.timezone
+        )
+        
+        ### Replacing the job also updates its URL and keywords
+        self.scheduler.add_job(
+            self.execute_crawl,
+            trigger=trigger,
+            args=[crawl_id, url, keywords_list],
+            id=f'crawl_{crawl_id}',
+            name=title,
+            replace_existing=True
+        )
+    
+    
+    def get_last_change_seq(self):
+        """Sequence number of the newest published schedule change"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM schedule_changes")
+            return cursor.fetchone()[0]
         except Exception as e:
-            print(f'Error updating crawl schedules: {e}')
+            logger.error(f"Error reading schedule changes: {e}")
+            return 0
         finally:
             self._close_connection()
     
     
-    def check_settings(self):
-        """Checks the settings table for any changes"""
+    def apply_schedule_changes(self):
+        """Apply the crawl and settings changes published by the Database write paths since the last run"""
         try:
-            current_email_time = self.get_email_time_from_db()
-            
-            ### Save the previous email time and check if it changed
-            if not hasattr(self, 'previous_email_time'):
-                self.previous_email_time = current_email_time
-                return
-            
-            ### Only if the email time changed, reschedule the job
-            if current_email_time != self.previous_email_time:
-                logger.info(f"Email time changed from {self.previous_email_time} to {current_email_time}")
-                self.previous_email_time = current_email_time
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT seq, entity, entity_id FROM schedule_changes
+                WHERE seq > ? ORDER BY seq
+            """, (self.last_change_seq,))
+            changes = cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error reading schedule changes: {e}")
+            return
+        finally:
+            self._close_connection()
+        
+        if not changes:
+            return
+        
+        try:
+            crawl_ids = {int(entity_id) for _, entity, entity_id in changes if entity == 'crawl'}
+            if crawl_ids:
+                ### Only the changed crawls are reloaded, deleted ones are missing from the result
+                changed = self._load_crawls(crawl_ids)
+                with self.crawls_lock:
+                    for crawl_id in crawl_ids:
+                        if crawl_id in changed:
+                            self.crawls[crawl_id] = changed[crawl_id]
+                            if self.scheduling_mode == 'cron':
+                                self._schedule_crawl_job(crawl_id)
+                        else:
+                            self.crawls.pop(crawl_id, None)
+                            if self.scheduling_mode == 'cron' and self.scheduler.get_job(f'crawl_{crawl_id}'):
+                                self.scheduler.remove_job(f'crawl_{crawl_id}')
+            
+            if any(entity == 'setting' for _, entity, _ in changes):
+                logger.info("Email settings changed, rescheduling the email job")
                 self.schedule_email_task()
             
+            self.last_change_seq = changes[-1][0]
+            logger.info(f"Applied {len(changes)} schedule changes ({len(crawl_ids)} crawls)")
         except Exception as e:
-            logger.error(f"Error checking settings: {e}")
+            logger.error(f"Error applying schedule changes: {e}")
+        
+    
+    def get_expected_durations(self):
+        """Average duration in seconds of the last successful runs per crawl_id (from crawl_metrics)"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT crawl_id, AVG(total_ms)
+                FROM (
+                    SELECT crawl_id, total_ms,
+                           ROW_NUMBER() OVER (PARTITION BY crawl_id ORDER BY started_at DESC) AS run
+                    FROM crawl_metrics
+                    WHERE status = 'ok'
+                )
+                WHERE run <= ?
+                GROUP BY crawl_id
+            """, (EXPECTED_DURATION_RUNS,))
+            return {crawl_id: total_ms / 1000 for crawl_id, total_ms in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"No crawl durations available, using defaults: {e}")
+            return {}
         finally:
             self._close_connection()
+    
+    
+    def get_crawls_run_on(self, day):
+        """crawl_ids with a crawl_metrics run started on the given day"""
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT crawl_id FROM crawl_metrics WHERE started_at >= ?", (day.isoformat(),))
+            return {crawl_id for crawl_id, in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"Could not read today's crawl runs: {e}")
+            return set()
+        finally:
+            self._close_connection()
+    
+    
+    def enqueue_due_crawls(self, now=None):
+        """
+        Put today's crawls on the crawl queue once their scheduleTime is reached. When the
+        expected time to run the remaining crawls scheduled before the email report no longer
+        fits before it, those crawls are released at once so they finish before the deadline.
+        Crawls scheduled at or after the email time run at their scheduleTime.
+        """
+        ### Holding the lock keeps the change feed from adding or deleting crawls meanwhile
+        with self.crawls_lock:
+            return self._enqueue_due_crawls(now or datetime.now(self.timezone))
+    
+    
+    def _enqueue_due_crawls(self, now):
+        today = now.date()
+        hour, minute = map(int, (self.email_time or self.get_email_time_from_db()).split(':'))
+        deadline = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        
+        day = now.strftime('%a').lower()
+        waiting = []
+        for crawl_id, (_, url, scheduleTime, scheduleDay, keywords) in list(self.crawls.items()):
+            if self.enqueued_on.get(crawl_id) == today or crawl_id in self.active_crawls:
+                continue
+            if day in {d.strip()[:3].lower() for d in scheduleDay.split(',')}:
+                waiting.append((crawl_id, url, keywords, tuple(map(int, scheduleTime.split(':')))))
+        if not waiting:
+            return []
+        
+        expected = self.get_expected_durations()
+        kinds, durations = {}, {}
+        for crawl_id, url, _, _ in waiting:
+            kinds[crawl_id] = BROWSER if crawler_uses_browser(url) else HTTP
+            default = DEFAULT_BROWSER_DURATION if kinds[crawl_id] == BROWSER else DEFAULT_HTTP_DURATION
+            durations[crawl_id] = expected.get(crawl_id, default)
+        
+        ### Only crawls scheduled before the email report have to finish before it
+        before_deadline = [crawl_id for crawl_id, _, _, scheduled in waiting if scheduled < (hour, minute)]
+        release_all = False
+        if before_deadline and now < deadline:
+            ### Time the pools need for the queued and the waiting crawls, the slower pool decides.
+            ### A single crawl can't be split across workers, so the longest one is a lower bound.
+            backlog = self.crawl_queue.backlog_seconds()
+            for crawl_id in before_deadline:
+                kind = kinds[crawl_id]
+                backlog[kind] += durations[crawl_id] / max(1, self.crawl_queue.workers[kind])
+            lead_seconds = max(max(backlog.values()), max(durations[crawl_id] for crawl_id in before_deadline))
+            lead_time = timedelta(seconds=lead_seconds) + DEADLINE_MARGIN
+            release_all = now >= deadline - lead_time
         
+        enqueued = []
+        for crawl_id, url, keywords, scheduled in waiting:
+            released = release_all and scheduled < (hour, minute)
+            if not released and scheduled > (now.hour, now.minute):
+                continue
+            if self.crawl_queue.submit(crawl_id, url, keywords, kinds[crawl_id], durations[crawl_id]):
+                self.enqueued_on[crawl_id] = today
+                enqueued.append(crawl_id)
+        
+        if enqueued:
+            reason = f"to finish before the email report at {hour:02d}:{minute:02d}" if release_all else "at their schedule time"
+            logger.info(f"Enqueued {len(enqueued)} crawls {reason}")
+        return enqueued
+    
     
     def execute_crawl(self, crawl_id, url, keywords):
         """Execute a crawl task and process job listings"""
         self.active_crawls.add(crawl_id)
+        crawler = None
         
         try:
             current_time = datetime.now(self.timezone)
@@ -281,72 +469,85 @@ class CrawlerScheduler:
             
             # Execute crawl
             crawler = Crawler()
-            results = crawler.crawl(url, keywords)
+            results = crawler.crawl(url, keywords, conditional=True, crawl_id=crawl_id)
             
             if results is None:
                 raise Exception("Crawler returned None - website unreachable, network error, or parsing failed")
             
+            if results is UNCHANGED:
+                logger.info(f"Crawl {crawl_id} unchanged since last run - skipping parse and diff")
+                return
+            
             conn = self._get_connection()
             cursor = conn.cursor()
+            diff_started = time.perf_counter()
             
             try:
-                # 1. Get all existing jobs for this crawl
+                # 1. Stage the crawl results (one row per link)
                 cursor.execute('''
-                    SELECT id, title, company, location, link 
-                    FROM crawl_results 
-                    WHERE crawl_id = ? AND crawl_url = ?
-                ''', (crawl_id, url))
-                existing_jobs = {row[4]: row for row in cursor.fetchall()}
-                
-                new_jobs = 0
-                updated_jobs = 0
-                found_links = set()
-                
-                # 2. Process crawl results
-                for result in results:
-                    link = result['link']
-                    found_links.add(link)
-                    
-                    if link in existing_jobs:
-                        updated_jobs += 1
-                        del existing_jobs[link]
-                    else:
-                        # Insert new job
-                        cursor.execute('''
-                            INSERT INTO crawl_results 
-                            (crawl_id, crawl_url, title, company, location, link, crawl_date)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)
-                        ''', (crawl_id, url, result['title'], result.get('company', 'Not specified'),
-                              result.get('location', 'Not specified'), result['link'], current_date))
-                        new_jobs += 1
-                
-                # 3. Process removed jobs (left overs in existing_jobs = not found in results)
-                removed_jobs = []
-                for link, job_data in existing_jobs.items():
-                    job_id, title, company, location, _ = job_data
-                    removed_jobs.append((job_id, title, company, location, link))
+                    CREATE TEMP TABLE IF NOT EXISTS crawl_batch (
+                        link TEXT PRIMARY KEY,
+                        title TEXT,
+                        company TEXT,
+                        location TEXT
+                    )
+                ''')
+                cursor.execute("DELETE FROM crawl_batch")
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO crawl_batch (link, title, company, location)
+                    VALUES (?, ?, ?, ?)
+                ''', [(result['link'], result['title'], result.get('company', 'Not specified'),
+                       result.get('location', 'Not specified')) for result in results])
                 
-                # 4. Add removed jobs to removed_jobs table
+                # 2. Move jobs that are no longer listed to removed_jobs
+                cursor.execute('''
+                    SELECT r.title, r.company FROM crawl_results r
+                    WHERE r.crawl_id = ? AND r.crawl_url = ?
+                      AND NOT EXISTS (SELECT 1 FROM crawl_batch b WHERE b.link = r.link)
+                ''', (crawl_id, url))
+                removed = cursor.fetchall()
+                removed_jobs = len(removed)
                 if removed_jobs:
-                    for job_id, title, company, location, link in removed_jobs:
-                        cursor.execute('''
-                            INSERT INTO removed_jobs
-                            (job_id, crawl_id, title, company, location, link, removal_date, notified)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, 0)
-                        ''', (job_id, crawl_id, title, company, location, link, current_date))
-                        
+                    for title, company in removed:
                         logger.info(f'Job removed: {title} at {company}')
-                    
-                    # 5. DELETE removed jobs from crawl_results
-                    job_ids_to_delete = [job[0] for job in removed_jobs]
-                    placeholders = ','.join('?' * len(job_ids_to_delete))
-                    cursor.execute(f'''
-                        DELETE FROM crawl_results 
-                        WHERE id IN ({placeholders})
-                    ''', job_ids_to_delete)
+                    cursor.execute('''
+                        INSERT INTO removed_jobs
+                        (job_id, crawl_id, title, company, location, link, removal_date, notified)
+                        SELECT r.id, r.crawl_id, r.title, r.company, r.location, r.link, ?, 0
+                        FROM crawl_results r
+                        WHERE r.crawl_id = ? AND r.crawl_url = ?
+                          AND NOT EXISTS (SELECT 1 FROM crawl_batch b WHERE b.link = r.link)
+                    ''', (current_date, crawl_id, url))
+                    cursor.execute('''
+                        DELETE FROM crawl_results
+                        WHERE crawl_id = ? AND crawl_url = ?
+                          AND link NOT IN (SELECT link FROM crawl_batch)
+                    ''', (crawl_id, url))
+                
+                # 3. Count the new jobs, then insert them. Rows of jobs still listed are kept as they are.
+                cursor.execute('''
+                    SELECT COUNT(*), SUM(NOT EXISTS (
+                        SELECT 1 FROM crawl_results r WHERE r.crawl_id = ? AND r.link = b.link
+                    ))
+                    FROM crawl_batch b
+                ''', (crawl_id,))
+                found_jobs, new_jobs = cursor.fetchone()
+                new_jobs = new_jobs or 0
+                updated_jobs = found_jobs - new_jobs
+                
+                cursor.execute('''
+                    INSERT INTO crawl_results
+                    (crawl_id, crawl_url, title, company, location, link, crawl_date)
+                    SELECT ?, ?, title, company, location, link, ? FROM crawl_batch WHERE true
+                    ON CONFLICT (crawl_id, link) DO NOTHING
+                ''', (crawl_id, url, current_date))
                 
                 conn.commit()
-                logger.info(f"Completed crawl {crawl_id} - Added {new_jobs} new, updated {updated_jobs}, removed {len(removed_jobs)}")
+                crawler.metrics.add('diff', time.perf_counter() - diff_started)
+                crawler.metrics.jobs_new = new_jobs
+                crawler.metrics.jobs_removed = removed_jobs
+                crawler.commit_http_cache()
+                logger.info(f"Completed crawl {crawl_id} - Added {new_jobs} new, updated {updated_jobs}, removed {removed_jobs}")
                 
             finally:
                 conn.close()
@@ -359,6 +560,8 @@ class CrawlerScheduler:
             error_traceback = traceback.format_exc()
             print(f"=== DEBUG: Full traceback: {error_traceback} ===")
             logger.error(f'Crawl {crawl_id} failed: {crawl_error}')
+            if crawler is not None and crawler.metrics is not None:
+                crawler.metrics.status = 'failed'
             # Fehler in Database speichern
             from database import Database
             db = Database()
@@ -374,12 +577,23 @@ class CrawlerScheduler:
             self.send_failure_notification(crawl_id, url, crawl_error, error_traceback)
 
         finally:
+            self.save_crawl_metrics(crawler)
             self.today_crawls_completed.add(crawl_id)
             self.active_crawls.remove(crawl_id)
             self._close_connection()
             
             
     
+    def save_crawl_metrics(self, crawler):
+        """Store the phase timings and counts of a finished crawl run"""
+        if crawler is None or crawler.metrics is None:
+            return
+        try:
+            crawler.metrics.save(self.db_path)
+        except Exception as e:
+            logger.error(f"Error storing crawl metrics: {e}")
+    
+    
     def send_failure_notification(self, crawl_id, url, error, traceback_str):
         """Send email notification for failed crawls"""
         try:
@@ -461,6 +675,10 @@ class CrawlerScheduler:
             cursor.execute("DELETE FROM failed_crawls WHERE failure_date < ?", (cutoff_date,))
             failed_count = cursor.rowcount
 
+            ### Clean up applied schedule changes (older than 30 days)
+            cursor.execute("DELETE FROM schedule_changes WHERE changed_at < ? AND seq <= ?",
+                           (cutoff_date, self.last_change_seq))
+
             conn.commit()
             logger.info(f"Database cleanup completed:")
             logger.info(f"  - Removed {removed_count} old removed job notifications")
@@ -0,0 +1,160 @@
+"""
+Shared SQLite connections for the application database.
+
+Every component (Database, CrawlerScheduler, EmailNotifier, the crawlers) gets its
+connections from connect(). Connections are opened once with the performance pragmas
+below and handed back to a small per-file pool when they are closed, so the
+statement cache and the page cache survive between calls.
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+### Idle connections kept open per database file
+POOL_SIZE = 8
+### Prepared statements cached per connection (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+### Seconds to wait for a write lock held by another connection
+BUSY_TIMEOUT = 5
+
+PRAGMAS = (
+    ### Readers don't block the writer and the writer doesn't block readers
+    "PRAGMA journal_mode = WAL",
+    ### In WAL mode NORMAL is safe against corruption, only the last commit may be lost on power loss
+    "PRAGMA synchronous = NORMAL",
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT * 1000}",
+    "PRAGMA mmap_size = 67108864",
+    "PRAGMA cache_size = -8000",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def _open(db_path):
+    """Open a new connection with the performance pragmas applied"""
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                           cached_statements=CACHED_STATEMENTS)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ConnectionPool:
+    """Idle connections to one database file, reused last in first out"""
+
+    def __init__(self, db_path, size=POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _open(self.db_path)
+
+    def release(self, conn):
+        """Give a connection back, an open transaction is rolled back first"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error as e:
+            logger.warning(f"Discarding broken connection to {self.db_path}: {e}")
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class PooledConnection:
+    """
+    A connection borrowed from a pool. It behaves like sqlite3.Connection; close()
+    returns the connection to the pool and can safely be called more than once.
+    """
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    @property
+    def closed(self):
+        return self._conn is None
+
+    def _connection(self):
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return self._conn
+
+    def __getattr__(self, name):
+        return getattr(self._connection(), name)
+
+    def __setattr__(self, name, value):
+        if name in ('_pool', '_conn'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._connection(), name, value)
+
+    def __enter__(self):
+        self._connection().__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._connection().__exit__(*exc_info)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_for(db_path):
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
+
+
+def connect(db_path):
+    """Borrow a connection to the database file, close() gives it back"""
+    pool = _pool_for(db_path)
+    return PooledConnection(pool, pool.acquire())
+
+
+def close_pool(db_path=None):
+    """Close the idle connections of one database file, or of all of them"""
+    with _pools_lock:
+        if db_path is None:
+            pools = list(_pools.values())
+            _pools.clear()
+        else:
+            pools = [_pools.pop(db_path)] if db_path in _pools else []
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pool)
@@ -67,6 +67,28 @@ function updateDashboard(data) {
         });
     }
     
+    // Update crawl performance table
+    const performanceTable = document.getElementById('performanceTable').getElementsByTagName('tbody')[0];
+    performanceTable.innerHTML = '';
+    const performance = data.crawl_performance || [];
+
+    if (performance.length === 0) {
+        const row = performanceTable.insertRow();
+        const cell = row.insertCell();
+        cell.colSpan = 5;
+        cell.textContent = 'Keine Daten verfügbar';
+        cell.style.textAlign = 'center';
+    } else {
+        performance.forEach(site => {
+            const row = performanceTable.insertRow();
+            row.insertCell().textContent = site.website;
+            row.insertCell().textContent = formatDuration(site.avg_ms);
+            row.insertCell().textContent = formatDuration(site.p95_ms);
+            row.insertCell().textContent = formatDuration(site.p95_last_7_days_ms);
+            row.insertCell().textContent = `${formatDuration(site.network_ms)} / ${formatDuration(site.parse_ms)}`;
+        });
+    }
+    
     // Load Chart.js only if it's not already loaded
     if (!window.Chart) {
         loadScript('https://cdn.jsdelivr.net/npm/chart.js@3.7.1/dist/chart.min.js')
@@ -88,6 +110,13 @@ function formatDate(dateString) {
     });
 }
 
+function formatDuration(milliseconds) {
+    if (milliseconds === null || milliseconds === undefined) {
+        return '-';
+    }
+    return milliseconds < 1000 ? `${milliseconds} ms` : `${(milliseconds / 1000).toFixed(1)} s`;
+}
+
 function loadScript(url) {
     return new Promise((resolve, reject) => {
         const script = document.createElement('script');